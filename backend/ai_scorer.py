@@ -5,6 +5,9 @@ from typing import Dict
 # 🔐 API key will be provided by company later
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+# Default shortlist cutoff (a job can override it, see /jobs/{job_id}/rescore)
+SHORTLIST_SCORE_CUTOFF = int(os.getenv("SHORTLIST_SCORE_CUTOFF", "90"))
+
 
 def score_resume(job_description: str, resume_text: str) -> Dict:
     """
@@ -25,7 +28,7 @@ def score_resume(job_description: str, resume_text: str) -> Dict:
         return {
             "score": heuristic_score,
             "reason": "Heuristic scoring used (AI disabled)",
-            "shortlisted": heuristic_score >= 90
+            "shortlisted": heuristic_score >= SHORTLIST_SCORE_CUTOFF
         }
 
     # -------------------------------
@@ -81,13 +84,22 @@ def heuristic_scoring(job_description: str, resume_text: str) -> int:
     resume_words = set(resume_text.lower().split())
 
     overlap = job_words.intersection(resume_words)
-    overlap_ratio = len(overlap) / max(len(job_words), 1)
+
+    return heuristic_score(len(overlap), len(job_words), len(resume_text))
+
+
+def heuristic_score(overlap: int, job_word_count: int, text_length: int) -> int:
+    """
+    Score from the overlap count alone, so cached resume
+    features can be rescored without the text
+    """
+    overlap_ratio = overlap / max(job_word_count, 1)
 
     # Skill relevance (70%)
     skill_score = overlap_ratio * 70
 
     # Resume completeness (30%)
-    length_score = min(len(resume_text) / 2000, 1.0) * 30
+    length_score = min(text_length / 2000, 1.0) * 30
 
     final_score = int(skill_score + length_score)
 
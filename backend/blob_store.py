@@ -0,0 +1,257 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+import threading
+
+# -------------------------------------------------
+# Environment
+# -------------------------------------------------
+BLOB_DIR = os.getenv("BLOB_DIR", "uploaded_resumes/blobs")
+# Days a job keeps its resume files referenced; no blob
+# uploaded within this window is deleted, referenced or not
+BLOB_RETENTION_DAYS = float(os.getenv("BLOB_RETENTION_DAYS", "30"))
+# Leftover temp files (interrupted uploads) younger than this are kept
+BLOB_GC_GRACE_SECONDS = int(os.getenv("BLOB_GC_GRACE_SECONDS", "3600"))
+BLOB_GC_INTERVAL_SECONDS = int(os.getenv("BLOB_GC_INTERVAL_SECONDS", "900"))
+
+CHUNK_SIZE = 1024 * 1024
+
+# Reference journal, replayed on startup (kept next to the shards)
+REFS_FILE = "refs.jsonl"
+
+
+def blob_key(data: bytes, filename: str) -> str:
+    # sha256 of the content + the original extension
+    return hashlib.sha256(data).hexdigest() + os.path.splitext(filename)[1].lower()
+
+
+class BlobStore:
+    """
+    Content-addressed resume files.
+
+    Each distinct file is stored once as <sha256><ext> in
+    two-level sharded directories (ab/cd/abcd...). Jobs hold
+    references to blobs, journaled to disk so they survive a
+    restart; a background collector deletes blobs that are no
+    longer referenced and were last uploaded before the
+    retention window.
+    """
+
+    def __init__(
+        self,
+        root: str = BLOB_DIR,
+        retention_days: float = BLOB_RETENTION_DAYS,
+        grace_seconds: int = BLOB_GC_GRACE_SECONDS
+    ):
+        self.root = root
+        self.retention_seconds = retention_days * 86400
+        self.grace_seconds = grace_seconds
+        os.makedirs(self.root, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._refs = {}            # key -> {owner: referenced_at}
+        self._refs_path = os.path.join(self.root, REFS_FILE)
+        self._gc_thread = None
+        self._gc_stop = threading.Event()
+
+        self.stored_bytes = 0
+        self.deduplicated_bytes = 0
+        self.gc_runs = 0
+        self.reclaimed_files = 0
+        self.reclaimed_bytes = 0
+        self.last_gc = None
+
+        self._load_refs()
+
+    # -------------------------------------------------
+    # Store
+    # -------------------------------------------------
+    def path(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], key[2:4], key)
+
+    def _commit(self, tmp_path: str, key: str, size: int) -> str:
+        path = self.path(key)
+
+        # Under the lock: the collector cannot delete the blob
+        # between the existence check and the mtime refresh
+        with self._lock:
+            if os.path.exists(path):
+                os.remove(tmp_path)
+                os.utime(path)
+                self.deduplicated_bytes += size
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.replace(tmp_path, path)
+                self.stored_bytes += size
+
+        return key
+
+    def put(self, data: bytes, filename: str) -> str:
+        """
+        Stores bytes (once per content) and returns the blob key
+        """
+        key = blob_key(data, filename)
+        tmp_path = os.path.join(self.root, f".{key}.{threading.get_ident()}.tmp")
+
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+
+        return self._commit(tmp_path, key, len(data))
+
+    def put_file(self, src_path: str, filename: str) -> str:
+        """
+        Moves an already-written file (e.g. a Drive download)
+        into the store and returns the blob key
+        """
+        digest = hashlib.sha256()
+        with open(src_path, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+
+        key = digest.hexdigest() + os.path.splitext(filename)[1].lower()
+        tmp_path = os.path.join(self.root, f".{key}.{threading.get_ident()}.tmp")
+        shutil.move(src_path, tmp_path)
+
+        return self._commit(tmp_path, key, os.path.getsize(tmp_path))
+
+    # -------------------------------------------------
+    # References
+    # -------------------------------------------------
+    def _load_refs(self):
+        if not os.path.exists(self._refs_path):
+            return
+
+        with open(self._refs_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    key, owner, referenced_at = json.loads(line)
+                except ValueError:
+                    # Torn last line after a crash
+                    continue
+                self._refs.setdefault(key, {})[owner] = referenced_at
+
+    def _save_refs(self):
+        # Compacts the journal to the live references
+        tmp_path = self._refs_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for key, owners in self._refs.items():
+                for owner, referenced_at in owners.items():
+                    f.write(json.dumps([key, owner, referenced_at]) + "\n")
+        os.replace(tmp_path, self._refs_path)
+
+    def add_ref(self, key: str, owner: str):
+        with self._lock:
+            referenced_at = time.time()
+            self._refs.setdefault(key, {})[owner] = referenced_at
+            with open(self._refs_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps([key, owner, referenced_at]) + "\n")
+
+    # -------------------------------------------------
+    # Garbage collection
+    # -------------------------------------------------
+    def collect_garbage(self) -> dict:
+        started = time.perf_counter()
+        now = time.time()
+        files = 0
+        reclaimed = 0
+
+        # Retention: references older than the policy expire
+        with self._lock:
+            for key in list(self._refs):
+                owners = self._refs[key]
+                for owner, referenced_at in list(owners.items()):
+                    if now - referenced_at > self.retention_seconds:
+                        del owners[owner]
+                if not owners:
+                    del self._refs[key]
+            self._save_refs()
+
+        for dirpath, _, filenames in os.walk(self.root, topdown=False):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                if path == self._refs_path:
+                    continue
+
+                # Leftover temp files only need the grace period;
+                # blobs are kept for the whole retention window
+                keep_seconds = self.grace_seconds if name.startswith(".") else self.retention_seconds
+
+                # Decided and deleted under the lock, so a concurrent
+                # upload of the same content keeps its blob
+                with self._lock:
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+
+                    if name in self._refs or now - stat.st_mtime < keep_seconds:
+                        continue
+
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        continue
+                files += 1
+                reclaimed += stat.st_size
+
+            # Drop emptied shard directories (not while an upload
+            # is moving a blob into one)
+            if dirpath != self.root:
+                with self._lock:
+                    try:
+                        os.rmdir(dirpath)
+                    except OSError:
+                        pass
+
+        elapsed = time.perf_counter() - started
+
+        self.gc_runs += 1
+        self.reclaimed_files += files
+        self.reclaimed_bytes += reclaimed
+        self.last_gc = {
+            "at": now,
+            "files": files,
+            "bytes": reclaimed,
+            "seconds": round(elapsed, 3),
+            "bytes_per_second": round(reclaimed / elapsed) if elapsed else 0
+        }
+        return self.last_gc
+
+    def _gc_loop(self, interval: int):
+        while not self._gc_stop.wait(interval):
+            try:
+                result = self.collect_garbage()
+                if result["files"]:
+                    print(f"🧹 Blob GC reclaimed {result['files']} files / {result['bytes']} bytes")
+            except Exception as e:
+                print("❌ Blob GC error:", e)
+
+    def start_gc(self, interval: int = BLOB_GC_INTERVAL_SECONDS):
+        if self._gc_thread is None:
+            self._gc_stop.clear()
+            self._gc_thread = threading.Thread(
+                target=self._gc_loop, args=(interval,), name="blob-gc", daemon=True
+            )
+            self._gc_thread.start()
+
+    def stop_gc(self):
+        if self._gc_thread is not None:
+            self._gc_stop.set()
+            self._gc_thread.join()
+            self._gc_thread = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            referenced = len(self._refs)
+        return {
+            "referenced_blobs": referenced,
+            "stored_bytes": self.stored_bytes,
+            "deduplicated_bytes": self.deduplicated_bytes,
+            "gc_runs": self.gc_runs,
+            "reclaimed_files": self.reclaimed_files,
+            "reclaimed_bytes": self.reclaimed_bytes,
+            "last_gc": self.last_gc,
+            "retention_days": self.retention_seconds / 86400
+        }
@@ -0,0 +1,255 @@
+import re
+import time
+import heapq
+import threading
+from array import array
+from typing import Dict, List
+
+# -------------------------------------------------
+# Cross-job candidate search (inverted index)
+# -------------------------------------------------
+# Postings: field -> term -> set of doc ids. Experience and
+# score are bucketed (1 year / 10 points) for range queries;
+# the boundary bucket is checked against the exact value.
+
+MAX_SEARCH_LIMIT = 500
+
+TERM_FIELDS = ("skill", "role", "email_domain", "stage", "recommendation", "shortlisted")
+
+
+def _norm(value) -> str:
+    return re.sub(r"\s+", " ", str(value).strip().lower())
+
+
+def _number(value) -> float:
+    # "" / None (not known yet) counts as 0
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class CandidateIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._doc_ids: Dict[str, int] = {}        # candidate_id -> doc id
+        self._docs: List[dict | None] = []        # doc id -> summary (None = removed)
+        self._terms: List[list] = []              # doc id -> [(field, term)]
+        self._postings = {field: {} for field in TERM_FIELDS}
+        self._experience = array("d")
+        self._score = array("d")
+        self._experience_buckets: Dict[int, set] = {}
+        self._score_buckets: Dict[int, set] = {}
+
+    # -------------------------------------------------
+    # Indexing
+    # -------------------------------------------------
+    def _doc_terms(self, job: dict, c: dict) -> list:
+        terms = [("skill", _norm(s)) for s in c.get("skills", []) if s]
+        terms.append(("role", _norm(job["role"])))
+        terms.append(("stage", _norm(c.get("email_stage", ""))))
+        terms.append(("shortlisted", _norm(bool(c.get("shortlisted")))))
+
+        if c.get("recommendation"):
+            terms.append(("recommendation", _norm(c["recommendation"])))
+
+        email = c.get("email") or ""
+        if "@" in email:
+            terms.append(("email_domain", _norm(email.rsplit("@", 1)[1])))
+
+        return terms
+
+    def _unindex(self, doc_id: int):
+        for field, term in self._terms[doc_id]:
+            postings = self._postings[field].get(term)
+            if postings is not None:
+                postings.discard(doc_id)
+                if not postings:
+                    del self._postings[field][term]
+
+        self._experience_buckets[int(self._experience[doc_id])].discard(doc_id)
+        self._score_buckets[int(self._score[doc_id]) // 10].discard(doc_id)
+
+    def add(self, job: dict, c: dict):
+        """
+        Indexes a candidate, or re-indexes it after a change
+        """
+        experience = _number(c.get("experience_years"))
+        score = _number(c.get("score"))
+        terms = self._doc_terms(job, c)
+        summary = {
+            "candidate_id": c["candidate_id"],
+            "job_id": job["job_id"],
+            "role": job["role"],
+            "name": c.get("name"),
+            "email": c.get("email"),
+            "skills": list(c.get("skills", [])),
+            "experience_years": c.get("experience_years"),
+            "score": c.get("score"),
+            "email_stage": c.get("email_stage"),
+            "recommendation": c.get("recommendation")
+        }
+
+        with self._lock:
+            doc_id = self._doc_ids.get(c["candidate_id"])
+
+            if doc_id is None:
+                doc_id = len(self._docs)
+                self._doc_ids[c["candidate_id"]] = doc_id
+                self._docs.append(summary)
+                self._terms.append(terms)
+                self._experience.append(experience)
+                self._score.append(score)
+            else:
+                self._unindex(doc_id)
+                self._docs[doc_id] = summary
+                self._terms[doc_id] = terms
+                self._experience[doc_id] = experience
+                self._score[doc_id] = score
+
+            for field, term in terms:
+                self._postings[field].setdefault(term, set()).add(doc_id)
+            self._experience_buckets.setdefault(int(experience), set()).add(doc_id)
+            self._score_buckets.setdefault(int(score) // 10, set()).add(doc_id)
+
+    def add_many(self, job: dict, candidates: list):
+        for c in candidates:
+            self.add(job, c)
+
+    def get(self, candidate_id: str) -> dict | None:
+        with self._lock:
+            doc_id = self._doc_ids.get(candidate_id)
+            return dict(self._docs[doc_id]) if doc_id is not None else None
+
+    def remove(self, candidate_id: str):
+        with self._lock:
+            doc_id = self._doc_ids.pop(candidate_id, None)
+            if doc_id is not None:
+                self._unindex(doc_id)
+                self._docs[doc_id] = None
+                self._terms[doc_id] = []
+
+    # -------------------------------------------------
+    # Search
+    # -------------------------------------------------
+    def _range(self, buckets: dict, values: array, low, high, width: int) -> set:
+        """
+        Doc ids with low <= value <= high (either bound optional)
+        """
+        low_bucket = int(low) // width if low is not None else None
+        high_bucket = int(high) // width if high is not None else None
+        result = set()
+
+        for bucket, docs in buckets.items():
+            if low_bucket is not None and bucket < low_bucket:
+                continue
+            if high_bucket is not None and bucket > high_bucket:
+                continue
+
+            # Whole bucket inside the range: no per-doc check
+            if (low_bucket is None or bucket > low_bucket) and (high_bucket is None or bucket < high_bucket):
+                result |= docs
+                continue
+
+            result.update(
+                d for d in docs
+                if (low is None or values[d] >= low) and (high is None or values[d] <= high)
+            )
+
+        return result
+
+    def search(
+        self,
+        skills: List[str] | None = None,
+        match: str = "all",
+        exclude_skills: List[str] | None = None,
+        roles: List[str] | None = None,
+        email_domains: List[str] | None = None,
+        stages: List[str] | None = None,
+        recommendations: List[str] | None = None,
+        shortlisted: bool | None = None,
+        min_experience: float | None = None,
+        max_experience: float | None = None,
+        min_score: float | None = None,
+        max_score: float | None = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> dict:
+        """
+        Skills combine with `match` ("all" = AND, "any" = OR);
+        values within one other filter are OR'ed and different
+        filters are AND'ed. Results are ordered by score.
+        """
+        if match not in ("all", "any"):
+            raise ValueError("match must be all or any")
+
+        started = time.perf_counter()
+        limit = max(1, min(limit, MAX_SEARCH_LIMIT))
+
+        with self._lock:
+            clauses = []
+
+            if skills:
+                sets = [self._postings["skill"].get(_norm(s), set()) for s in skills]
+                if match == "all":
+                    clauses.append(set.intersection(*sets))
+                else:
+                    clauses.append(set().union(*sets))
+
+            for field, values in (
+                ("role", roles),
+                ("email_domain", email_domains),
+                ("stage", stages),
+                ("recommendation", recommendations)
+            ):
+                if values:
+                    clauses.append(set().union(*(
+                        self._postings[field].get(_norm(v), set()) for v in values
+                    )))
+
+            if shortlisted is not None:
+                clauses.append(self._postings["shortlisted"].get(_norm(shortlisted), set()))
+
+            if min_experience is not None or max_experience is not None:
+                clauses.append(self._range(
+                    self._experience_buckets, self._experience, min_experience, max_experience, 1
+                ))
+
+            if min_score is not None or max_score is not None:
+                clauses.append(self._range(
+                    self._score_buckets, self._score, min_score, max_score, 10
+                ))
+
+            if clauses:
+                # Intersect smallest first
+                clauses.sort(key=len)
+                matches = set(clauses[0])
+                for clause in clauses[1:]:
+                    matches &= clause
+                    if not matches:
+                        break
+            else:
+                matches = set(self._doc_ids.values())
+
+            for s in exclude_skills or []:
+                matches -= self._postings["skill"].get(_norm(s), set())
+
+            top = heapq.nsmallest(
+                offset + limit, matches, key=lambda d: (-self._score[d], d)
+            )[offset:]
+            results = [dict(self._docs[d]) for d in top]
+
+        return {
+            "total": len(matches),
+            "limit": limit,
+            "offset": offset,
+            "took_ms": round((time.perf_counter() - started) * 1000, 2),
+            "results": results
+        }
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "candidates": len(self._doc_ids),
+                "terms": {field: len(p) for field, p in self._postings.items()}
+            }
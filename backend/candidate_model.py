@@ -0,0 +1,162 @@
+import sys
+from collections.abc import MutableMapping
+from typing import Iterable, List
+
+# -------------------------------------------------
+# Compact in-memory candidate
+# -------------------------------------------------
+# A candidate dict carries ~20 keys (over 1 KB of hash table
+# each); a slotted object stores the same values in a fixed
+# array. Candidate keeps the dict interface (c["score"],
+# c.get("rank"), "interview" in c, dict(c)), so the rest of the
+# backend reads and writes it like before.
+
+FIELDS = (
+    "candidate_id",
+    "name",
+    "email",
+    "email_confidence",
+    "skills",
+    "experience_years",
+    "score",
+    "shortlisted",
+    "resume_file",
+    "parser_engine",
+    "confidence",
+    "interview_score",
+    "recommendation",
+    "email_stage",
+    "personal_form_submitted",
+    "final_selected",
+    "rank",
+    "rank_score",
+    "interview",
+    "interview_qna"
+)
+
+# Few distinct values, repeated on every candidate: one shared
+# string object each (also after a job is reloaded from disk)
+ENUM_FIELDS = frozenset({"email_confidence", "email_stage", "recommendation", "parser_engine"})
+
+# Row columns taken from the job, not the candidate
+JOB_COLUMNS = frozenset({"job_id", "role"})
+
+_FIELD_SET = frozenset(FIELDS)
+_MISSING = object()
+
+
+class Candidate(MutableMapping):
+    """
+    Fixed fields live in slots (no per-instance dict); any other
+    key goes to a small overflow dict created on first use
+    """
+
+    __slots__ = FIELDS + ("_extra",)
+
+    def __init__(self, fields=(), **kwargs):
+        self._extra = None
+        self.update(fields, **kwargs)
+
+    # -------------------------------------------------
+    # Mapping interface
+    # -------------------------------------------------
+    def __getitem__(self, key: str):
+        if key in _FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value):
+        if key in _FIELD_SET:
+            if key in ENUM_FIELDS and isinstance(value, str):
+                value = sys.intern(value)
+            elif key == "skills" and value is not None:
+                value = [sys.intern(s) for s in value]
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str):
+        if key in _FIELD_SET:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self):
+        for key in FIELDS:
+            if getattr(self, key, _MISSING) is not _MISSING:
+                yield key
+        if self._extra:
+            yield from list(self._extra)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key) -> bool:
+        if key in _FIELD_SET:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def get(self, key: str, default=None):
+        # Hot path (ranking, views, exports): no exception on a miss
+        if key in _FIELD_SET:
+            return getattr(self, key, default)
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def __repr__(self) -> str:
+        return f"Candidate({dict(self)!r})"
+
+    # -------------------------------------------------
+    # Serialization
+    # -------------------------------------------------
+    def as_dict(self) -> dict:
+        """
+        Plain dict for JSON (job spill files)
+        """
+        data = {}
+        for key in FIELDS:
+            value = getattr(self, key, _MISSING)
+            if value is not _MISSING:
+                data[key] = value
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    def row(self, job: dict, columns: Iterable[str]) -> dict:
+        """
+        Flat Sheets / dashboard row, built straight from the slots
+        """
+        row = {}
+        for column in columns:
+            if column in _FIELD_SET:
+                row[column] = getattr(self, column, None)
+            elif column in JOB_COLUMNS:
+                row[column] = job[column]
+            else:
+                row[column] = self.get(column)
+
+        # Display formatting (same as the Sheet)
+        if "skills" in row:
+            row["skills"] = ", ".join(row["skills"] or ())
+        if "rank_score" in row:
+            row["rank_score"] = round(row["rank_score"] or 0, 2)
+        if "final_selected" in row:
+            row["final_selected"] = bool(row["final_selected"])
+        return row
+
+
+def to_candidates(candidates: List[dict]) -> List[Candidate]:
+    return [c if isinstance(c, Candidate) else Candidate(c) for c in candidates]
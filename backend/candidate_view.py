@@ -0,0 +1,194 @@
+import time
+import heapq
+from collections import OrderedDict
+from typing import Dict, List
+
+# -------------------------------------------------
+# HR dashboard candidate table, served from memory
+# -------------------------------------------------
+# Columns shown by the dashboard (same order as the Google Sheet)
+VIEW_COLUMNS = [
+    "job_id",
+    "role",
+    "candidate_id",
+    "name",
+    "email",
+    "email_confidence",
+    "skills",
+    "experience_years",
+    "score",
+    "interview_score",
+    "rank",
+    "rank_score",
+    "recommendation",
+    "shortlisted",
+    "resume_file",
+    "confidence",
+    "email_stage",
+    "personal_form_submitted",
+    "final_selected"
+]
+
+SORT_KEYS = {"interview_score", "rank_score", "score", "rank", "experience_years"}
+
+MAX_PAGE_SIZE = 500
+
+# Sorted row lists kept per job (one per job / filters / sort);
+# rows of spilled jobs stay here, so an unchanged cold job is
+# not read again to rebuild the all-jobs view
+MAX_CACHED_JOB_VIEWS = 1000
+
+# Merged all-jobs row lists kept (one per filters / sort)
+MAX_CACHED_VIEWS = 16
+
+# job_id -> version, bumped whenever a job's candidates change
+_job_versions: Dict[str, int] = {}
+
+# job_id -> time of the last bump (Last-Modified)
+_job_modified: Dict[str, float] = {}
+
+# (job_id, filters, sort) -> (job version, sorted rows), LRU
+_job_views: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+# (filters, sort) -> (versions snapshot, merged rows), LRU
+_view_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+
+def bump_job_version(job_id: str) -> int:
+    _job_versions[job_id] = _job_versions.get(job_id, 0) + 1
+    _job_modified[job_id] = time.time()
+    return _job_versions[job_id]
+
+
+def job_version(job_id: str) -> int:
+    return _job_versions.get(job_id, 0)
+
+
+def job_modified(job_id: str) -> float | None:
+    return _job_modified.get(job_id)
+
+
+def forget_job_views(job_id: str):
+    """
+    Drops the cached rows of a deleted job; all-jobs views
+    age out of the LRU
+    """
+    for key in [k for k in _job_views if k[0] == job_id]:
+        del _job_views[key]
+
+
+def forget_job(job_id: str):
+    forget_job_views(job_id)
+    _job_versions.pop(job_id, None)
+    _job_modified.pop(job_id, None)
+
+
+def _to_row(job: dict, c) -> dict:
+    return c.row(job, VIEW_COLUMNS)
+
+
+def _sort_value(row: dict, key: str):
+    # "" / None (not interviewed yet) sort below any real value
+    value = row.get(key)
+    return value if isinstance(value, (int, float)) else -1
+
+
+def _row_key(sort_by: List[str]):
+    return lambda r: tuple(_sort_value(r, k) for k in sort_by)
+
+
+def _filtered_rows(
+    job: dict,
+    shortlisted_only: bool,
+    final_selected_only: bool,
+    sort_by: List[str]
+) -> List[dict]:
+    rows = []
+    for c in job["candidates"]:
+        if shortlisted_only and not c.get("shortlisted"):
+            continue
+        if final_selected_only and not c.get("final_selected"):
+            continue
+        rows.append(_to_row(job, c))
+
+    rows.sort(key=_row_key(sort_by), reverse=True)
+    return rows
+
+
+def _job_rows(screening_db, job_id: str, filters: tuple, sort_by: List[str]) -> List[dict]:
+    """
+    Sorted rows of one job, rebuilt only when its version
+    changes (a spilled job is read, not promoted)
+    """
+    key = (job_id, *filters, tuple(sort_by))
+    version = job_version(job_id)
+
+    cached = _job_views.get(key)
+    if cached and cached[0] == version:
+        _job_views.move_to_end(key)
+        return cached[1]
+
+    job = screening_db.peek(job_id)
+    rows = _filtered_rows(job, *filters, sort_by) if job is not None else []
+    _job_views[key] = (version, rows)
+    while len(_job_views) > MAX_CACHED_JOB_VIEWS:
+        _job_views.popitem(last=False)
+    return rows
+
+
+def get_candidate_page(
+    screening_db,
+    job_id: str | None = None,
+    shortlisted_only: bool = False,
+    final_selected_only: bool = False,
+    sort_by: List[str] | None = None,
+    page: int = 1,
+    page_size: int = 50
+) -> Dict:
+    """
+    Filtered, sorted and paginated candidate rows.
+
+    Sorted rows are cached per (job, filters, sort) and rebuilt
+    only when that job changes version. The all-jobs view merges
+    the per-job lists, so a change to one job re-reads only that
+    job; a cache hit does not load spilled jobs.
+    """
+    sort_by = [k for k in (sort_by or ["interview_score", "rank_score"]) if k in SORT_KEYS]
+    page = max(page, 1)
+    page_size = min(max(page_size, 1), MAX_PAGE_SIZE)
+    filters = (shortlisted_only, final_selected_only)
+
+    if job_id:
+        job_ids = [job_id] if job_id in screening_db else []
+    else:
+        job_ids = sorted(screening_db)
+
+    versions = tuple((j, job_version(j)) for j in job_ids)
+
+    if job_id:
+        rows = _job_rows(screening_db, job_id, filters, sort_by) if job_ids else []
+    else:
+        cache_key = (*filters, tuple(sort_by))
+        cached = _view_cache.get(cache_key)
+        if cached and cached[0] == versions:
+            _view_cache.move_to_end(cache_key)
+            rows = cached[1]
+        else:
+            rows = list(heapq.merge(
+                *(_job_rows(screening_db, j, filters, sort_by) for j in job_ids),
+                key=_row_key(sort_by),
+                reverse=True
+            ))
+            _view_cache[cache_key] = (versions, rows)
+            while len(_view_cache) > MAX_CACHED_VIEWS:
+                _view_cache.popitem(last=False)
+
+    start = (page - 1) * page_size
+
+    return {
+        "total": len(rows),
+        "page": page,
+        "page_size": page_size,
+        "version": sum(v for _, v in versions),
+        "rows": rows[start:start + page_size]
+    }
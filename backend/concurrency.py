@@ -0,0 +1,139 @@
+import os
+import math
+import asyncio
+import threading
+import contextvars
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+
+# -------------------------------------------------
+# Environment
+# -------------------------------------------------
+# Parse / extract / score (CPU + disk)
+SCREENING_WORKERS = int(os.getenv("SCREENING_WORKERS", "2"))
+# Drive downloads, Sheets / webhook calls, file writes
+IO_WORKERS = int(os.getenv("IO_WORKERS", "8"))
+
+MAX_ACTIVE_SCREENING_JOBS = int(os.getenv("MAX_ACTIVE_SCREENING_JOBS", "4"))
+MAX_QUEUED_RESUMES = int(os.getenv("MAX_QUEUED_RESUMES", "300"))
+MAX_RETRY_AFTER_SECONDS = 300
+
+# -------------------------------------------------
+# Bounded executors for blocking stages
+# -------------------------------------------------
+screening_executor = ThreadPoolExecutor(SCREENING_WORKERS, thread_name_prefix="screening")
+io_executor = ThreadPoolExecutor(IO_WORKERS, thread_name_prefix="io")
+
+
+async def run_blocking(executor: ThreadPoolExecutor, fn, *args, **kwargs):
+    """
+    Runs fn off the event loop; the tracing context (current
+    span) is carried into the worker thread
+    """
+    context = contextvars.copy_context()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, partial(context.run, fn, *args, **kwargs)
+    )
+
+
+def shutdown_executors():
+    screening_executor.shutdown(wait=True)
+    io_executor.shutdown(wait=True)
+
+
+# -------------------------------------------------
+# Admission control
+# -------------------------------------------------
+class Overloaded(Exception):
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class ScreeningTicket:
+    """
+    One admitted screening request; resumes still to be
+    processed count against MAX_QUEUED_RESUMES
+    """
+
+    def __init__(self, controller: "AdmissionController", resumes: int):
+        self.controller = controller
+        self.remaining = resumes
+
+    def resume_done(self, seconds: float):
+        self.controller._resume_done(self, seconds)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.controller._release(self)
+
+
+class AdmissionController:
+    def __init__(
+        self,
+        max_active_jobs: int = MAX_ACTIVE_SCREENING_JOBS,
+        max_queued_resumes: int = MAX_QUEUED_RESUMES,
+        workers: int = SCREENING_WORKERS
+    ):
+        self.max_active_jobs = max_active_jobs
+        self.max_queued_resumes = max_queued_resumes
+        self.workers = workers
+
+        self._lock = threading.Lock()
+        self.active_jobs = 0
+        self.queued_resumes = 0
+        self.seconds_per_resume = 1.0     # moving average
+        self.admitted = 0
+        self.rejected = 0
+
+    def _retry_after(self) -> int:
+        backlog = self.queued_resumes * self.seconds_per_resume / self.workers
+        return max(1, min(math.ceil(backlog), MAX_RETRY_AFTER_SECONDS))
+
+    def admit(self, resumes: int) -> ScreeningTicket:
+        """
+        Raises Overloaded (with a Retry-After estimate) when
+        over capacity
+        """
+        with self._lock:
+            if self.active_jobs >= self.max_active_jobs:
+                reason = "Too many screening jobs in progress"
+            elif self.queued_resumes and self.queued_resumes + resumes > self.max_queued_resumes:
+                reason = "Too many resumes queued for screening"
+            else:
+                self.active_jobs += 1
+                self.queued_resumes += resumes
+                self.admitted += 1
+                return ScreeningTicket(self, resumes)
+
+            self.rejected += 1
+            raise Overloaded(reason, self._retry_after())
+
+    def _resume_done(self, ticket: ScreeningTicket, seconds: float):
+        with self._lock:
+            if ticket.remaining:
+                ticket.remaining -= 1
+                self.queued_resumes -= 1
+            self.seconds_per_resume = 0.9 * self.seconds_per_resume + 0.1 * seconds
+
+    def _release(self, ticket: ScreeningTicket):
+        with self._lock:
+            self.active_jobs -= 1
+            self.queued_resumes -= ticket.remaining
+            ticket.remaining = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "active_jobs": self.active_jobs,
+                "queued_resumes": self.queued_resumes,
+                "max_active_jobs": self.max_active_jobs,
+                "max_queued_resumes": self.max_queued_resumes,
+                "seconds_per_resume": round(self.seconds_per_resume, 3),
+                "admitted": self.admitted,
+                "rejected": self.rejected
+            }
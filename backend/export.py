@@ -0,0 +1,157 @@
+import io
+from typing import Iterable, Iterator, List
+
+from backend.google_sheets import SHEET_COLUMNS
+
+# -------------------------------------------------
+# Columnar (Arrow IPC / Parquet) export of job results
+# -------------------------------------------------
+# pyarrow is only imported when an export is requested
+
+EXPORT_FORMATS = {
+    "arrow": ("application/vnd.apache.arrow.stream", "arrow"),
+    "parquet": ("application/vnd.apache.parquet", "parquet")
+}
+
+BATCH_SIZE = 10_000
+
+# Arrow type per Sheets column (same order as append_candidate)
+COLUMN_TYPES = {
+    "job_id": "string",
+    "role": "string",
+    "candidate_id": "string",
+    "name": "string",
+    "email": "string",
+    "skills": "string",
+    "experience_years": "float64",
+    "score": "int64",
+    "interview_score": "int64",
+    "rank": "int32",
+    "rank_score": "float64",
+    "recommendation": "string",
+    "shortlisted": "bool",
+    "resume_file": "string",
+    "confidence": "float64",
+    "email_stage": "string",
+    "personal_form_submitted": "bool",
+    "final_selected": "bool"
+}
+
+EXPORT_COLUMNS = [column for column, _ in SHEET_COLUMNS]
+
+
+def candidate_schema(columns: List[str] | None = None):
+    import pyarrow as pa
+
+    return pa.schema([
+        pa.field(column, pa.type_for_alias(COLUMN_TYPES[column]))
+        for column in (columns or EXPORT_COLUMNS)
+    ])
+
+
+def validate_columns(columns: List[str] | None) -> List[str]:
+    if not columns:
+        return EXPORT_COLUMNS
+
+    unknown = [c for c in columns if c not in COLUMN_TYPES]
+    if unknown:
+        raise ValueError(f"Unknown export columns: {', '.join(unknown)}")
+
+    return columns
+
+
+def _value(job: dict, c: dict, column: str):
+    if column in ("job_id", "role"):
+        return job[column]
+    if column == "skills":
+        return ", ".join(c.get("skills", []))
+    if column == "rank_score":
+        return round(c.get("rank_score", 0), 2)
+
+    value = c.get(column)
+    # Not-yet-known values are stored as "" in memory
+    return None if value == "" else value
+
+
+def _record_batches(jobs: Iterable[dict], columns: List[str], schema):
+    """
+    Builds column arrays directly from the candidate dicts,
+    BATCH_SIZE rows at a time
+    """
+    import pyarrow as pa
+
+    arrays = {column: [] for column in columns}
+    size = 0
+
+    for job in jobs:
+        for c in job["candidates"]:
+            for column in columns:
+                arrays[column].append(_value(job, c, column))
+            size += 1
+
+            if size == BATCH_SIZE:
+                yield pa.RecordBatch.from_pydict(arrays, schema=schema)
+                arrays = {column: [] for column in columns}
+                size = 0
+
+    if size:
+        yield pa.RecordBatch.from_pydict(arrays, schema=schema)
+
+
+class _ChunkSink(io.RawIOBase):
+    """
+    Write-only file that hands written bytes back to the
+    response generator, while tell() keeps counting so the
+    Parquet footer offsets stay correct.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def stream_export(
+    jobs: Iterable[dict],
+    export_format: str = "arrow",
+    columns: List[str] | None = None
+) -> Iterator[bytes]:
+    """
+    Yields an Arrow IPC stream or a Parquet file, one record
+    batch (row group) at a time
+    """
+    import pyarrow as pa
+
+    columns = validate_columns(columns)
+    schema = candidate_schema(columns)
+    sink = _ChunkSink()
+
+    if export_format == "parquet":
+        import pyarrow.parquet as pq
+        writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    else:
+        writer = pa.ipc.new_stream(sink, schema)
+
+    try:
+        for batch in _record_batches(jobs, columns, schema):
+            writer.write_batch(batch)
+            yield sink.drain()
+    finally:
+        writer.close()
+
+    yield sink.drain()
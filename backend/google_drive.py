@@ -1,14 +1,17 @@
 import os
 import json
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload
 import io
 import re
+import threading
+
+# google-api-python-client is imported on first use (cold start)
 
 SCOPES = ["https://www.googleapis.com/auth/drive.readonly"]
 
 def get_drive_service():
+    from google.oauth2.service_account import Credentials
+    from googleapiclient.discovery import build
+
     service_account_json = os.getenv("GOOGLE_SERVICE_ACCOUNT_JSON")
 
     if not service_account_json:
@@ -23,7 +26,22 @@ def get_drive_service():
 
     return build("drive", "v3", credentials=creds)
 
-drive_service = get_drive_service()
+_drive_service = None
+_drive_lock = threading.Lock()
+
+
+def drive_service():
+    """
+    Built on first use, so importing this module needs
+    no credentials
+    """
+    global _drive_service
+    # The warm-up thread and the first request may both get here
+    with _drive_lock:
+        if _drive_service is None:
+            _drive_service = get_drive_service()
+        return _drive_service
+
 
 def extract_folder_id(folder_link: str) -> str:
     match = re.search(r"/folders/([a-zA-Z0-9_-]+)", folder_link)
@@ -32,17 +50,22 @@ def extract_folder_id(folder_link: str) -> str:
     return match.group(1)
 
 def list_files_in_folder(folder_id: str):
-    results = drive_service.files().list(
+    results = drive_service().files().list(
         q=f"'{folder_id}' in parents and mimeType!='application/vnd.google-apps.folder'",
         fields="files(id, name)"
     ).execute()
     return results.get("files", [])
 
 def download_file(file_id: str, file_name: str, download_path: str):
-    request = drive_service.files().get_media(fileId=file_id)
+    from googleapiclient.http import MediaIoBaseDownload
+
+    request = drive_service().files().get_media(fileId=file_id)
     fh = io.FileIO(download_path, "wb")
     downloader = MediaIoBaseDownload(fh, request)
 
     done = False
     while not done:
         _, done = downloader.next_chunk()
+
+    fh.close()
+    return download_path
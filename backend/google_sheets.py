@@ -1,7 +1,8 @@
-import gspread
 import json
 import os
-from google.oauth2.service_account import Credentials
+import threading
+
+# gspread / google-auth are imported on first use (cold start)
 
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets"
@@ -10,8 +11,51 @@ SCOPES = [
 SPREADSHEET_NAME = "AI Hiring - Candidates Database"
 WORKSHEET_NAME = "Candidates"
 
+# Sheet column order (column name, default when missing)
+SHEET_COLUMNS = [
+    ("job_id", ""),
+    ("role", ""),
+    ("candidate_id", ""),
+    ("name", ""),
+    ("email", ""),
+    ("skills", ""),
+    ("experience_years", 0),
+    ("score", 0),
+    ("interview_score", ""),
+    ("rank", ""),
+    ("rank_score", ""),
+    ("recommendation", ""),
+    ("shortlisted", False),
+    ("resume_file", ""),
+    ("confidence", ""),
+    ("email_stage", "RESUME_SHORTLISTED"),
+    ("personal_form_submitted", False),
+    ("final_selected", False)
+]
+
+# 1-based sheet column per name
+COLUMN_INDEX = {column: idx for idx, (column, _) in enumerate(SHEET_COLUMNS, start=1)}
+
+
+_sheet = None
+_sheet_lock = threading.Lock()
+
 
 def get_sheet():
+    """
+    Authorized worksheet, created on first use and reused
+    """
+    global _sheet
+    with _sheet_lock:
+        if _sheet is None:
+            _sheet = _open_sheet()
+        return _sheet
+
+
+def _open_sheet():
+    import gspread
+    from google.oauth2.service_account import Credentials
+
     service_account_json = os.getenv("GOOGLE_SERVICE_ACCOUNT_JSON")
 
     if not service_account_json:
@@ -33,24 +77,7 @@ def append_candidate(row: dict):
     sheet = get_sheet()
 
     sheet.append_row([
-        row.get("job_id", ""),
-        row.get("role", ""),
-        row.get("candidate_id", ""),
-        row.get("name", ""),
-        row.get("email", ""),
-        row.get("skills", ""),
-        row.get("experience_years", 0),
-        row.get("score", 0),
-        row.get("interview_score", ""),
-        row.get("rank", ""),
-        row.get("rank_score", ""),
-        row.get("recommendation", ""),
-        row.get("shortlisted", False),
-        row.get("resume_file", ""),
-        row.get("confidence", ""),
-        row.get("email_stage", "RESUME_SHORTLISTED"),
-        row.get("personal_form_submitted", False),
-        row.get("final_selected", False)  # ✅ NEW COLUMN
+        row.get(column, default) for column, default in SHEET_COLUMNS
     ], value_input_option="USER_ENTERED")
 
 
@@ -68,4 +95,51 @@ def update_candidate_by_id(candidate_id: str, updates: dict):
     raise ValueError("Candidate not found in Google Sheet")
 
 
+# -------------------------------------------------
+# Batch writes (used by the write-behind queue)
+# -------------------------------------------------
+def append_candidates(rows: list):
+    """
+    Appends many rows in a single API call
+    """
+    sheet = get_sheet()
+
+    sheet.append_rows([
+        [row.get(column, default) for column, default in SHEET_COLUMNS]
+        for row in rows
+    ], value_input_option="USER_ENTERED")
+
+
+def update_candidates(updates: dict) -> list:
+    """
+    updates: candidate_id -> {column: value}
+
+    One read of the candidate_id column plus one batch write.
+    Returns the candidate_ids that are not in the sheet.
+    """
+    from gspread.utils import rowcol_to_a1
+
+    sheet = get_sheet()
+    ids = sheet.col_values(COLUMN_INDEX["candidate_id"])
+    row_of = {str(cid): idx for idx, cid in enumerate(ids, start=1) if idx > 1}
+
+    data = []
+    missing = []
+
+    for candidate_id, fields in updates.items():
+        row = row_of.get(str(candidate_id))
+        if row is None:
+            missing.append(candidate_id)
+            continue
+
+        for column, value in fields.items():
+            if column in COLUMN_INDEX:
+                data.append({
+                    "range": rowcol_to_a1(row, COLUMN_INDEX[column]),
+                    "values": [[value]]
+                })
+
+    if data:
+        sheet.batch_update(data, value_input_option="USER_ENTERED")
 
+    return missing
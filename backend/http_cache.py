@@ -0,0 +1,181 @@
+import os
+import gzip
+import uuid
+import threading
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+
+import orjson
+from fastapi import Request
+from fastapi.responses import Response
+
+# brotli is optional: "br" is only offered when it is installed
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# -------------------------------------------------
+# Environment
+# -------------------------------------------------
+COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", "1024"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "5"))
+# Encoded bodies kept (one per key, version and encoding)
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "64"))
+
+# Job versions are in-memory counters: a restart must not
+# reuse an ETag handed out by the previous process
+_BOOT_ID = uuid.uuid4().hex[:8]
+
+# (key, version, accepted encoding) -> (encoding used, body)
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+_stats = {"served": 0, "not_modified": 0, "encoded": 0, "cache_hits": 0}
+
+
+# -------------------------------------------------
+# Negotiation
+# -------------------------------------------------
+def negotiate_encoding(accept_encoding: str | None) -> str:
+    """
+    "br", "gzip" or "identity", by the client's q-values
+    (ties prefer br, then gzip)
+    """
+    listed = {}
+    for part in (accept_encoding or "").split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        listed[name.strip().lower()] = q
+
+    # "*" covers encodings not listed by name
+    star = listed.get("*", 0.0)
+    offered = {encoding: listed.get(encoding, star) for encoding in ("br", "gzip")}
+    if brotli is None:
+        offered["br"] = 0.0
+
+    best = max(("br", "gzip"), key=lambda e: offered[e])
+    return best if offered[best] > 0 else "identity"
+
+
+def make_etag(key: str, version: int) -> str:
+    # Weak: the same version is served in several encodings
+    return f'W/"{key}-{version}-{_BOOT_ID}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque
+        for tag in if_none_match.split(",")
+    )
+
+
+def not_modified_since(if_modified_since: str | None, modified: float) -> bool:
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+    # HTTP dates have one-second resolution
+    return int(modified) <= since
+
+
+# -------------------------------------------------
+# Responses
+# -------------------------------------------------
+def _encode(body: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=GZIP_LEVEL)
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return body
+
+
+def _default(obj):
+    # Candidate objects (backend/candidate_model.py) and other mappings
+    if hasattr(obj, "as_dict"):
+        return obj.as_dict()
+    raise TypeError(f"{type(obj).__name__} is not JSON serializable")
+
+
+def versioned_json_response(
+    request: Request,
+    key: str,
+    version: int,
+    modified: float | None,
+    build
+) -> Response:
+    """
+    JSON response for data identified by (key, version).
+    A matching If-None-Match (or, without one, If-Modified-Since)
+    returns 304 before build() is called; otherwise build()'s
+    result is serialized with orjson, compressed per
+    Accept-Encoding and cached for the next poll.
+    """
+    etag = make_etag(key, version)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding"
+    }
+    if modified is not None:
+        headers["Last-Modified"] = formatdate(modified, usegmt=True)
+
+    if_none_match = request.headers.get("if-none-match")
+    if etag_matches(if_none_match, etag) or (
+        if_none_match is None
+        and modified is not None
+        and not_modified_since(request.headers.get("if-modified-since"), modified)
+    ):
+        _stats["not_modified"] += 1
+        return Response(status_code=304, headers=headers)
+
+    cache_key = (key, version, negotiate_encoding(request.headers.get("accept-encoding")))
+
+    with _cache_lock:
+        cached = _cache.get(cache_key)
+        if cached is not None:
+            _cache.move_to_end(cache_key)
+            _stats["cache_hits"] += 1
+
+    if cached is None:
+        body = orjson.dumps(build(), default=_default)
+        # Small bodies are not worth compressing
+        encoding = cache_key[2] if len(body) >= COMPRESS_MIN_BYTES else "identity"
+        cached = (encoding, _encode(body, encoding))
+        _stats["encoded"] += 1
+
+        with _cache_lock:
+            _cache[cache_key] = cached
+            while len(_cache) > RESPONSE_CACHE_SIZE:
+                _cache.popitem(last=False)
+
+    encoding, body = cached
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+
+    _stats["served"] += 1
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def response_stats() -> dict:
+    with _cache_lock:
+        return {
+            **_stats,
+            "cached_bodies": len(_cache),
+            "cached_bytes": sum(len(body) for _, body in _cache.values()),
+            "brotli": brotli is not None
+        }
@@ -0,0 +1,112 @@
+import os
+import time
+import hashlib
+import threading
+from concurrent.futures import Future
+
+# -------------------------------------------------
+# Environment
+# -------------------------------------------------
+# Seconds a finished request's result is replayed for its key
+IDEMPOTENCY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_TTL_SECONDS", str(24 * 60 * 60)))
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+
+class IdempotencyConflict(Exception):
+    """
+    The key was already used for a different request
+    """
+
+
+def request_fingerprint(*parts) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(repr(part).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class IdempotencyStore:
+    """
+    Idempotency-Key -> result of the first request that used it.
+
+    The first request claims the key and does the work; retries
+    with the same key wait on the same future (while in flight)
+    or get the stored result (once finished). Failed requests
+    release their key so a retry runs again. Keys expire
+    IDEMPOTENCY_TTL_SECONDS after the request finished.
+    """
+
+    def __init__(self, ttl_seconds: int = IDEMPOTENCY_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+        # key -> {"fingerprint", "future", "finished_at"}
+        self._entries = {}
+
+        self.claimed = 0
+        self.replayed = 0
+        self.conflicts = 0
+
+    def _prune(self, now: float):
+        expired = [
+            key for key, entry in self._entries.items()
+            if entry["finished_at"] is not None
+            and now - entry["finished_at"] > self.ttl_seconds
+        ]
+        for key in expired:
+            del self._entries[key]
+
+    def claim(self, key: str, fingerprint: str) -> tuple:
+        """
+        Returns (future, owner). The owner must call complete()
+        or fail(); everyone else awaits the future.
+        """
+        if len(key) > MAX_KEY_LENGTH:
+            raise ValueError(f"{IDEMPOTENCY_HEADER} is longer than {MAX_KEY_LENGTH} characters")
+
+        with self._lock:
+            self._prune(time.time())
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                if entry["fingerprint"] != fingerprint:
+                    self.conflicts += 1
+                    raise IdempotencyConflict(key)
+                self.replayed += 1
+                return entry["future"], False
+
+            future = Future()
+            self._entries[key] = {
+                "fingerprint": fingerprint,
+                "future": future,
+                "finished_at": None
+            }
+            self.claimed += 1
+            return future, True
+
+    def complete(self, key: str, result):
+        with self._lock:
+            entry = self._entries[key]
+            entry["finished_at"] = time.time()
+        entry["future"].set_result(result)
+
+    def fail(self, key: str, error: BaseException):
+        with self._lock:
+            entry = self._entries.pop(key)
+        entry["future"].set_exception(error)
+
+    def stats(self) -> dict:
+        with self._lock:
+            in_flight = sum(1 for e in self._entries.values() if e["finished_at"] is None)
+            return {
+                "keys": len(self._entries),
+                "in_flight": in_flight,
+                "claimed": self.claimed,
+                "replayed": self.replayed,
+                "conflicts": self.conflicts,
+                "ttl_seconds": self.ttl_seconds
+            }
@@ -0,0 +1,307 @@
+import os
+import time
+import random
+import shutil
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+
+# -------------------------------------------------
+# Environment
+# -------------------------------------------------
+# "google" = live Google Sheets / Drive / Make.com,
+# "local"  = in-process emulators (offline load tests, benchmarks)
+INTEGRATIONS_BACKEND = os.getenv("INTEGRATIONS_BACKEND", "google")
+
+# Emulator knobs
+EMULATOR_LATENCY_MS = float(os.getenv("EMULATOR_LATENCY_MS", "0"))
+EMULATOR_LATENCY_JITTER_MS = float(os.getenv("EMULATOR_LATENCY_JITTER_MS", "0"))
+EMULATOR_QUOTA_PER_MINUTE = int(os.getenv("EMULATOR_QUOTA_PER_MINUTE", "0"))   # 0 = unlimited
+EMULATOR_FAILURE_RATE = float(os.getenv("EMULATOR_FAILURE_RATE", "0"))
+EMULATOR_SEED = int(os.getenv("EMULATOR_SEED", "42"))
+LOCAL_DRIVE_DIR = os.getenv("LOCAL_DRIVE_DIR", "local_drive")
+
+
+# =================================================
+# Interfaces
+# =================================================
+# Abstract: a backend missing a method fails when it is
+# constructed (at import), not in the middle of a request
+class Integration(ABC):
+    def warm_up(self):
+        """
+        Builds clients ahead of first use (no-op by default)
+        """
+
+
+class CandidateStore(Integration):
+    """
+    Candidate rows (the Google Sheet in production)
+    """
+
+    @abstractmethod
+    def append_candidates(self, rows: list):
+        ...
+
+    @abstractmethod
+    def update_candidates(self, updates: dict) -> list:
+        """
+        updates: candidate_id -> {column: value};
+        returns the candidate_ids that were not found
+        """
+
+
+class FileSource(Integration):
+    """
+    Folder of resume files (Google Drive in production)
+    """
+
+    def extract_folder_id(self, folder_link: str) -> str:
+        # Drive folder links, for the emulator too
+        from backend.google_drive import extract_folder_id
+        return extract_folder_id(folder_link)
+
+    @abstractmethod
+    def list_files(self, folder_id: str) -> list:
+        """
+        [{"id": ..., "name": ...}, ...]
+        """
+
+    @abstractmethod
+    def download_file(self, file_id: str, file_name: str, download_path: str) -> str:
+        ...
+
+
+class NotificationSink(Integration):
+    """
+    Email / workflow triggers (Make.com webhooks in production)
+    """
+
+    @abstractmethod
+    def trigger(self, url: str, payload: dict):
+        ...
+
+
+# =================================================
+# Live services
+# =================================================
+def _has_google_credentials() -> bool:
+    return bool(os.getenv("GOOGLE_SERVICE_ACCOUNT_JSON"))
+
+
+class GoogleSheetsStore(CandidateStore):
+    def warm_up(self):
+        if _has_google_credentials():
+            from backend.google_sheets import get_sheet
+            get_sheet()
+
+    def append_candidates(self, rows: list):
+        from backend.google_sheets import append_candidates
+        append_candidates(rows)
+
+    def update_candidates(self, updates: dict) -> list:
+        from backend.google_sheets import update_candidates
+        return update_candidates(updates)
+
+
+class GoogleDriveSource(FileSource):
+    def warm_up(self):
+        if _has_google_credentials():
+            from backend.google_drive import drive_service
+            drive_service()
+
+    def list_files(self, folder_id: str) -> list:
+        from backend.google_drive import list_files_in_folder
+        return list_files_in_folder(folder_id)
+
+    def download_file(self, file_id: str, file_name: str, download_path: str) -> str:
+        from backend.google_drive import download_file
+        return download_file(file_id, file_name, download_path)
+
+
+class MakeWebhookSink(NotificationSink):
+    def warm_up(self):
+        import backend.make_service
+
+    def trigger(self, url: str, payload: dict):
+        from backend.make_service import trigger_make_webhook
+        trigger_make_webhook(url=url, payload=payload)
+
+
+# =================================================
+# Local emulators
+# =================================================
+class _Response:
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+
+
+class EmulatedAPIError(Exception):
+    """
+    Shaped like gspread's APIError (error.response.status_code)
+    so callers handle it the same way
+    """
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(f"{status_code}: {message}")
+        self.response = _Response(status_code)
+
+
+class Emulator:
+    """
+    Per-call latency, a per-minute request quota (429) and
+    random failures (503), all seeded so runs are repeatable
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = EMULATOR_LATENCY_MS,
+        jitter_ms: float = EMULATOR_LATENCY_JITTER_MS,
+        quota_per_minute: int = EMULATOR_QUOTA_PER_MINUTE,
+        failure_rate: float = EMULATOR_FAILURE_RATE,
+        seed: int = EMULATOR_SEED
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.quota_per_minute = quota_per_minute
+        self.failure_rate = failure_rate
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._window = deque()        # call times in the last minute
+
+        self.calls = 0
+        self.throttled = 0
+        self.failures = 0
+
+    def _call(self):
+        with self._lock:
+            self.calls += 1
+            now = time.monotonic()
+
+            while self._window and now - self._window[0] >= 60:
+                self._window.popleft()
+
+            if self.quota_per_minute and len(self._window) >= self.quota_per_minute:
+                self.throttled += 1
+                raise EmulatedAPIError(429, "Quota exceeded")
+            self._window.append(now)
+
+            delay = self.latency_ms + self._random.uniform(-1, 1) * self.jitter_ms
+            failed = self._random.random() < self.failure_rate
+            if failed:
+                self.failures += 1
+
+        if delay > 0:
+            time.sleep(delay / 1000)
+        if failed:
+            raise EmulatedAPIError(503, "Injected failure")
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "throttled": self.throttled,
+            "failures": self.failures
+        }
+
+
+class LocalSheetsStore(Emulator, CandidateStore):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.rows = []
+        self._row_of = {}          # candidate_id -> index in rows
+
+    def append_candidates(self, rows: list):
+        from backend.google_sheets import SHEET_COLUMNS
+
+        self._call()
+        with self._lock:
+            for row in rows:
+                self._row_of[str(row["candidate_id"])] = len(self.rows)
+                self.rows.append({column: row.get(column, default) for column, default in SHEET_COLUMNS})
+
+    def update_candidates(self, updates: dict) -> list:
+        self._call()
+        missing = []
+        with self._lock:
+            for candidate_id, fields in updates.items():
+                idx = self._row_of.get(str(candidate_id))
+                if idx is None:
+                    missing.append(candidate_id)
+                    continue
+                row = self.rows[idx]
+                row.update({k: v for k, v in fields.items() if k in row})
+        return missing
+
+
+class LocalDriveSource(Emulator, FileSource):
+    """
+    Folders are subdirectories of LOCAL_DRIVE_DIR;
+    a file's id is its path relative to that directory
+    """
+
+    def __init__(self, root: str = LOCAL_DRIVE_DIR, **kwargs):
+        super().__init__(**kwargs)
+        self.root = root
+
+    def list_files(self, folder_id: str) -> list:
+        self._call()
+        folder = os.path.join(self.root, folder_id)
+        if not os.path.isdir(folder):
+            return []
+        return [
+            {"id": f"{folder_id}/{name}", "name": name}
+            for name in sorted(os.listdir(folder))
+            if os.path.isfile(os.path.join(folder, name))
+        ]
+
+    def download_file(self, file_id: str, file_name: str, download_path: str) -> str:
+        self._call()
+        shutil.copyfile(os.path.join(self.root, file_id), download_path)
+        return download_path
+
+
+class LocalNotificationSink(Emulator, NotificationSink):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.sent = []
+
+    def trigger(self, url: str, payload: dict):
+        # Same contract as trigger_make_webhook: errors are logged, not raised
+        try:
+            self._call()
+        except EmulatedAPIError as e:
+            print("❌ Make webhook error:", e)
+            return
+        with self._lock:
+            self.sent.append({"url": url, "payload": payload})
+
+
+# =================================================
+# Selection
+# =================================================
+def _build():
+    if INTEGRATIONS_BACKEND == "local":
+        return LocalSheetsStore(), LocalDriveSource(), LocalNotificationSink()
+    if INTEGRATIONS_BACKEND == "google":
+        return GoogleSheetsStore(), GoogleDriveSource(), MakeWebhookSink()
+    raise RuntimeError(f"Unknown INTEGRATIONS_BACKEND: {INTEGRATIONS_BACKEND}")
+
+
+candidate_store, file_source, notifier = _build()
+
+
+def warm_up_integrations():
+    for integration in (candidate_store, file_source, notifier):
+        integration.warm_up()
+
+
+def integration_stats() -> dict:
+    if INTEGRATIONS_BACKEND != "local":
+        return {"backend": INTEGRATIONS_BACKEND}
+    return {
+        "backend": INTEGRATIONS_BACKEND,
+        "sheets": candidate_store.stats(),
+        "drive": file_source.stats(),
+        "notifications": notifier.stats()
+    }
@@ -53,6 +53,58 @@ def generate_interview_question(
     return response.choices[0].message.content
     """
 
+# -------------------------------------------------
+# Stream Interview Question (token by token)
+# -------------------------------------------------
+def stream_interview_question(
+    job_description: str,
+    resume_text: str,
+    previous_qna: list
+):
+    """
+    Yields the next interview question in small chunks
+    as soon as they are available
+    """
+
+    # Fallback (NO API KEY)
+    if not OPENAI_API_KEY:
+        question = generate_interview_question(
+            job_description, resume_text, previous_qna
+        )
+        for i, word in enumerate(question.split(" ")):
+            yield word if i == 0 else " " + word
+        return
+
+    # REAL IMPLEMENTATION (enable later)
+    """
+    from openai import OpenAI
+    client = OpenAI(api_key=OPENAI_API_KEY)
+
+    prompt = f'''
+    Job Description:
+    {job_description}
+
+    Candidate Resume:
+    {resume_text}
+
+    Previous Q&A:
+    {previous_qna}
+
+    Ask the next interview question.
+    '''
+
+    stream = client.chat.completions.create(
+        model="gpt-5-mini",
+        messages=[{"role": "user", "content": prompt}],
+        stream=True
+    )
+
+    for chunk in stream:
+        token = chunk.choices[0].delta.content
+        if token:
+            yield token
+    """
+
 # -------------------------------------------------
 # Evaluate Interview
 # -------------------------------------------------
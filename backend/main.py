@@ -1,25 +1,62 @@
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException
+# Imported first: cold-start timings start here
+from backend.warmup import mark, warm_up_in_background, startup_report
+
+from fastapi import FastAPI, UploadFile, File, Form, Header, HTTPException, Request, Response, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import iterate_in_threadpool
 from typing import List
+from contextlib import contextmanager, asynccontextmanager
 import uuid
 import os
+import time
+import asyncio
 
-from backend.resume_parser import parse_resume
+from backend.resume_parser import parse_resume_with_engine, preload_pdf_engines
 from backend.resume_extractor import extract_resume_data
-from backend.ai_scorer import score_resume
+from backend.ai_scorer import score_resume, SHORTLIST_SCORE_CUTOFF
 from backend.email_validator import calculate_email_confidence
 from backend.duplicate_detector import is_duplicate_resume
-from backend.ranker import rank_candidates
-from backend.google_sheets import append_candidate
-from backend.google_drive import (
-    extract_folder_id,
-    list_files_in_folder,
-    download_file
-)
+from backend.ranker import rank_candidates, merge_ranked
 from backend.interview_ai import (
     generate_interview_question,
+    stream_interview_question,
     evaluate_interview
 )
-from backend.make_service import trigger_make_webhook
+from backend.integrations import file_source, notifier, integration_stats, warm_up_integrations
+from backend.tracing import span, TRACE_HEADER
+from backend.candidate_view import (
+    get_candidate_page,
+    bump_job_version,
+    job_version,
+    job_modified,
+    forget_job,
+    VIEW_COLUMNS
+)
+from backend.candidate_model import Candidate
+from backend.export import EXPORT_FORMATS, stream_export, validate_columns
+from backend.state_store import JobStore
+from backend.resume_text_store import ResumeTextStore
+from backend.blob_store import BlobStore, BLOB_DIR, blob_key
+from backend.sheets_queue import SheetsWriteQueue
+from backend.candidate_index import CandidateIndex
+from backend.similarity_index import SimilarityIndex
+from backend.resume_features import ResumeFeatureStore, job_description
+from backend.concurrency import (
+    screening_executor,
+    io_executor,
+    run_blocking,
+    shutdown_executors,
+    AdmissionController,
+    Overloaded
+)
+from backend.http_cache import versioned_json_response, response_stats
+from backend.idempotency import (
+    IdempotencyStore,
+    IdempotencyConflict,
+    IDEMPOTENCY_HEADER,
+    REPLAYED_HEADER,
+    request_fingerprint
+)
 
 # -------------------------------------------------
 # App Init
@@ -32,287 +69,563 @@ app = FastAPI(
 UPLOAD_DIR = "uploaded_resumes"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
-# Cache only (Google Sheets = DB)
-screening_db = {}
+def has_active_interview(job: dict) -> bool:
+    """
+    Jobs with an interview still running are never spilled,
+    so open sessions keep mutating the live candidate dicts
+    """
+    cutoff = time.time() - INTERVIEW_TIME_LIMIT_SECONDS - TIME_LIMIT_GRACE_SECONDS
 
-# =================================================
-# STEP 1A: HR uploads MULTIPLE resumes (manual)
-# =================================================
-@app.post("/screen-resumes")
-async def screen_resumes(
-    role: str = Form(...),
-    required_skills: str = Form(...),   # comma-separated
-    experience_level: str = Form(...),
-    culture_traits: str = Form(""),
-    resumes: List[UploadFile] = File(...)
-):
-    if not resumes:
-        raise HTTPException(status_code=400, detail="No resumes uploaded")
+    for c in job["candidates"]:
+        interview = c.get("interview")
+        if interview and not interview.get("completed") and interview["started_at"] > cutoff:
+            return True
 
-    job_id = str(uuid.uuid4())[:8]
-    required_skills_list = [s.strip() for s in required_skills.split(",")]
+    return False
 
-    job_data = {
-        "job_id": job_id,
-        "role": role,
-        "required_skills": required_skills_list,
-        "experience_level": experience_level,
-        "culture_traits": culture_traits,
-        "candidates": []
-    }
 
-    for resume in resumes:
-        if not resume.filename.lower().endswith((".pdf", ".docx")):
-            continue
+# Cache only (Google Sheets = DB); bounded, spills idle jobs to disk
+screening_db = JobStore(
+    is_pinned=has_active_interview,
+    on_delete=forget_job
+)
+
+# candidate_id -> resume text (compressed, on disk)
+resume_texts = ResumeTextStore()
+
+# Cross-job search over every screened candidate
+candidate_index = CandidateIndex()
+
+# Resume vectors for "similar candidates"
+similarity_index = SimilarityIndex()
+
+# Per-resume scoring features for what-if rescoring
+resume_features = ResumeFeatureStore()
+
+# Uploaded resume files, stored once per content (sha256)
+blobs = BlobStore(BLOB_DIR)
+
+
+# Google Sheets writes happen in the background (write-behind)
+sheets_queue = SheetsWriteQueue()
+
+# Limits concurrent screening jobs / queued resumes (429 when full)
+admission = AdmissionController()
+
+# job_id -> lock; chunked uploads into one job are screened in order
+screening_locks = {}
+
+# Idempotency-Key -> screening result (retried requests replay it)
+idempotency = IdempotencyStore()
+
 
-        file_path = f"{UPLOAD_DIR}/{job_id}_{resume.filename}"
-        with open(file_path, "wb") as f:
-            f.write(await resume.read())
+def index_stored_jobs():
+    # Jobs kept on disk by a previous run become searchable,
+    # comparable ("similar") and rescorable again
+    for job in screening_db.values():
+        candidate_index.add_many(job, job["candidates"])
+
+        for c in job["candidates"]:
+            resume_text = resume_texts.get(c["candidate_id"])
+            if resume_text is not None:
+                similarity_index.add(c["candidate_id"], resume_text)
+                resume_features.add(job["job_id"], c["candidate_id"], resume_text)
+
+
+mark("import")
+
+
+@app.on_event("startup")
+def start_background_workers():
+    blobs.start_gc()
+    sheets_queue.start()
+
+    # Heavy parsers and API clients load after the app is up
+    warm_up_in_background({
+        "pdf_engines": preload_pdf_engines,
+        "integrations": warm_up_integrations,
+        "stored_jobs": index_stored_jobs
+    })
+    mark("ready")
+    print(f"🚀 Backend ready in {startup_report()['ready_seconds']}s")
 
-        resume_text = parse_resume(file_path)
 
-        # ---- Duplicate Detection ----
-        if is_duplicate_resume(resume_text, job_data["candidates"]):
-            continue
+@app.on_event("shutdown")
+def stop_background_workers():
+    shutdown_executors()
+    blobs.stop_gc()
+    # Flushes pending Sheets writes before exit
+    sheets_queue.stop()
+    screening_db.close()
 
+# =================================================
+# Tracing (opt-in, see backend/tracing.py)
+# =================================================
+@app.middleware("http")
+async def trace_requests(request: Request, call_next):
+    with span(
+        "request",
+        method=request.method,
+        path=request.url.path
+    ) as root:
+        response = await call_next(request)
+        root["attributes"]["status_code"] = response.status_code
+
+    if "trace_id" in root:
+        response.headers[TRACE_HEADER] = root["trace_id"]
+
+    return response
+
+
+# =================================================
+# Shared screening pipeline
+# =================================================
+def screen_resume_file(
+    file_path: str,
+    resume_file: str,
+    job_data: dict,
+    seen_resumes: list
+):
+    """
+    Parse → extract → dedupe → score a single resume.
+    Returns the candidate dict, or None for duplicates.
+    """
+    role = job_data["role"]
+    required_skills_list = job_data["required_skills"]
+
+    with span("parse") as s:
+        resume_text, parser_engine = parse_resume_with_engine(file_path)
+        s["attributes"]["chars"] = len(resume_text)
+        s["attributes"]["engine"] = parser_engine
+
+    with span("extract"):
         parsed_data = extract_resume_data(
             resume_text=resume_text,
             required_skills=required_skills_list
         )
 
         email_confidence = calculate_email_confidence(
-            name=parsed_data.get("name", ""),
-            email=parsed_data.get("email", ""),
+            name=parsed_data.get("name") or "",
+            email=parsed_data.get("email") or "",
             resume_text=resume_text
         )
 
+    # ---- Duplicate Detection ----
+    # Seen resumes keep only parsed fields; their text is
+    # decompressed lazily while comparing
+    with span("dedupe") as s:
+        duplicate, reason = is_duplicate_resume(
+            {"parsed": parsed_data, "resume_text": resume_text},
+            (
+                {"parsed": seen["parsed"], "resume_text": resume_texts.get(seen["candidate_id"]) or ""}
+                for seen in seen_resumes
+            )
+        )
+        s["attributes"]["duplicate"] = duplicate
+        s["attributes"]["reason"] = reason
+
+    if duplicate:
+        return None
+
+    candidate_id = str(uuid.uuid4())[:8]
+    resume_texts.put(candidate_id, resume_text)
+    similarity_index.add(candidate_id, resume_text)
+    resume_features.add(job_data["job_id"], candidate_id, resume_text)
+    seen_resumes.append({"parsed": parsed_data, "candidate_id": candidate_id})
+
+    with span("score") as s:
         score_result = score_resume(
-            job_description=f"{role} {required_skills}",
+            job_description=job_description(role, required_skills_list),
             resume_text=resume_text
         )
+        s["attributes"]["score"] = score_result["score"]
 
-        candidate_id = str(uuid.uuid4())[:8]
-        shortlisted = score_result["score"] >= 90
-       
+    shortlisted = score_result["score"] >= job_data.get("shortlist_cutoff", SHORTLIST_SCORE_CUTOFF)
 
-        job_data["candidates"].append({
-            "candidate_id": candidate_id,
-            "name": parsed_data.get("name"),
-            "email": parsed_data.get("email"),
-            "email_confidence": email_confidence,
-            "skills": parsed_data.get("skills", []),
-            "experience_years": parsed_data.get("experience_years"),
-            "score": score_result["score"],
-            "shortlisted": shortlisted,
-            "resume_file": resume.filename,
-            "confidence": parsed_data.get("confidence", 0),
-            "interview_score": "",
-            "recommendation": "",
-            "email_stage": "RESUME_SHORTLISTED" if shortlisted else "REJECTED",
+    return Candidate({
+        "candidate_id": candidate_id,
+        "name": parsed_data.get("name"),
+        "email": parsed_data.get("email"),
+        "email_confidence": email_confidence,
+        "skills": parsed_data.get("skills", []),
+        "experience_years": parsed_data.get("experience_years"),
+        "score": score_result["score"],
+        "shortlisted": shortlisted,
+        "resume_file": resume_file,
+        "parser_engine": parser_engine,
+        "confidence": parsed_data.get("confidence", 0),
+        "interview_score": "",
+        "recommendation": "",
+        "email_stage": "RESUME_SHORTLISTED" if shortlisted else "REJECTED",
+        "personal_form_submitted": False
+    })
 
 
-            "personal_form_submitted": False
+def save_and_notify(job_data: dict, candidates: list):
+    """
+    Writes ranked candidates to Google Sheets and
+    triggers the shortlist email for shortlisted ones
+    """
+    for candidate in candidates:
+        # Queued only; the write itself is the "sheet_flush" span
+        with span("sheet_enqueue", candidate_id=candidate["candidate_id"]):
+            # Same row layout as the dashboard (Sheet columns + email_confidence)
+            sheets_queue.append(candidate.row(job_data, VIEW_COLUMNS))
 
-        })
+        if candidate["shortlisted"]:
+            with span("webhook", candidate_id=candidate["candidate_id"]):
+                notifier.trigger(
+                    url=os.getenv("MAKE_SHORTLIST_WEBHOOK"),
+                    payload={
+                        "candidate_id": candidate["candidate_id"],
+                        "name": candidate["name"],
+                        "email": candidate["email"],
+                        "job_role": job_data["role"]
+                    }
+                )
+
+
+def new_job(
+    role: str,
+    required_skills: str,
+    experience_level: str,
+    culture_traits: str
+) -> dict:
+    return {
+        "job_id": str(uuid.uuid4())[:8],
+        "role": role,
+        "required_skills": [s.strip() for s in required_skills.split(",")],
+        "experience_level": experience_level,
+        "culture_traits": culture_traits,
+        "shortlist_cutoff": SHORTLIST_SCORE_CUTOFF,
+        "candidates": []
+    }
 
-    # ---- Ranking ----
-    job_data["candidates"] = rank_candidates(job_data["candidates"])
 
-    # ---- Save to Google Sheets ----
-    for candidate in job_data["candidates"]:
-        append_candidate({
-            "job_id": job_id,
-            "role": role,
-            "candidate_id": candidate["candidate_id"],
-            "name": candidate["name"],
-            "email": candidate["email"],
-            "email_confidence": candidate["email_confidence"],
-            "skills": ", ".join(candidate["skills"]),
-            "experience_years": candidate["experience_years"],
-            "score": candidate["score"],
-            "interview_score": candidate.get("interview_score", ""),
-            "rank": candidate["rank"],
-            "rank_score": round(candidate["rank_score"], 2),
-            "recommendation": candidate.get("recommendation", ""),
-            "shortlisted": candidate["shortlisted"],
-            "resume_file": candidate["resume_file"],
-            "confidence": candidate["confidence"],
-            "email_stage": "RESUME_SHORTLISTED" if shortlisted else "REJECTED",
-
-
-            "personal_form_submitted": False,
-            "final_selected": False
-
-        })
+def is_resume_file(filename: str) -> bool:
+    return filename.lower().endswith((".pdf", ".docx"))
 
 
-        if candidate["shortlisted"]:
-            trigger_make_webhook(
-                url=os.getenv("MAKE_SHORTLIST_WEBHOOK"),
-                payload={
-                    "candidate_id": candidate["candidate_id"],
-                    "name": candidate["name"],
-                    "email": candidate["email"],
-                    "job_role": role
-                }
-            )
+def admit_screening(resumes: int):
+    try:
+        return admission.admit(resumes)
+    except Overloaded as e:
+        raise HTTPException(
+            status_code=429,
+            detail=e.reason,
+            headers={"Retry-After": str(e.retry_after)}
+        )
 
 
+def job_lock(job_id: str) -> asyncio.Lock:
+    return screening_locks.setdefault(job_id, asyncio.Lock())
+
+
+@contextmanager
+def new_job_state(job_id: str):
+    """
+    Sidecar of a job being screened; dropped again if the
+    screening fails before the job is stored
+    """
+    try:
+        yield screening_db.sidecar(job_id)
+    except BaseException:
+        screening_db.discard_sidecar(job_id)
+        raise
+
+
+@asynccontextmanager
+async def locked_job(job_id: str):
+    """
+    Serializes work on one job and keeps it in memory until
+    the block exits; yields the job (None if it does not exist)
+    """
+    async with job_lock(job_id):
+        with screening_db.hold(job_id):
+            yield screening_db.get(job_id)
+
+
+async def run_idempotent(key: str | None, fingerprint: str, response: Response, screen):
+    """
+    Runs screen() once per Idempotency-Key. A retry while the
+    first request is still running waits for it; a later retry
+    gets the stored result. Without a key, screen() just runs.
+    """
+    if not key:
+        return await screen()
+
+    try:
+        future, owner = idempotency.claim(key, fingerprint)
+    except IdempotencyConflict:
+        raise HTTPException(
+            status_code=422,
+            detail=f"{IDEMPOTENCY_HEADER} was already used for a different request"
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if not owner:
+        response.headers[REPLAYED_HEADER] = "true"
+        # Shielded: a retry that disconnects must not cancel the original
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    try:
+        result = await screen()
+    except BaseException as e:
+        # Released, so the next retry screens again
+        idempotency.fail(key, e)
+        raise
+
+    idempotency.complete(key, result)
+    return result
+
+
+async def upload_fingerprint(resumes: List[UploadFile]) -> list:
+    """
+    (filename, blob key) per upload: a retry with the same key
+    must carry the same file contents, not just the same sizes
+    """
+    keys = []
+    for resume in resumes:
+        content = await resume.read()
+        await resume.seek(0)
+        keys.append((resume.filename, await run_blocking(io_executor, blob_key, content, resume.filename)))
+    return keys
+
+
+async def screen_uploaded_resumes(job_data: dict, resumes: List[UploadFile], ticket) -> list:
+    """
+    Screens PDF / DOCX uploads (see is_resume_file). Blocking
+    stages run in the bounded executors, so the event loop
+    keeps serving other requests meanwhile
+    """
+    job_id = job_data["job_id"]
+    sidecar = screening_db.sidecar(job_id)
+    # Parsed resumes already seen (duplicate detection across uploads)
+    seen_resumes = sidecar.setdefault("seen_resumes", [])
+    # Files already screened into this job (blob key -> candidate_id)
+    seen_blobs = sidecar.setdefault("seen_blobs", {})
+    new_candidates = []
 
+    for resume in resumes:
+        started = time.perf_counter()
+        with span("resume", file=resume.filename, job_id=job_id) as s:
+            with span("upload_write") as w:
+                content = await resume.read()
+                blob_key = await run_blocking(io_executor, blobs.put, content, resume.filename)
+                w["attributes"]["bytes"] = len(content)
+
+            # Same file uploaded again: duplicate without parsing it
+            if blob_key in seen_blobs:
+                candidate = None
+            else:
+                candidate = await run_blocking(
+                    screening_executor, screen_resume_file,
+                    blobs.path(blob_key), resume.filename, job_data, seen_resumes
+                )
+                seen_blobs[blob_key] = candidate["candidate_id"] if candidate else None
+            s["attributes"]["duplicate"] = candidate is None
+        ticket.resume_done(time.perf_counter() - started)
+
+        # Duplicates are left unreferenced for the GC
+        if candidate:
+            blobs.add_ref(blob_key, job_id)
+            new_candidates.append(candidate)
+
+    return new_candidates
+
+
+def finish_screening(job_data: dict, new_candidates: list) -> int:
+    """
+    Ranks new candidates into the job, saves them to
+    Google Sheets and stores the job in the cache.
+    Returns how many existing candidates changed rank.
+    """
+    # ---- Ranking ----
+    # Existing candidates are already ranked; only new ones are scored
+    with span("rank", candidates=len(job_data["candidates"]), new=len(new_candidates)):
+        job_data["candidates"], moved = merge_ranked(job_data["candidates"], new_candidates)
 
-    screening_db[job_id] = job_data
+    # ---- Save to Google Sheets ----
+    # New rows, plus the rank of rows pushed down by them
+    save_and_notify(job_data, new_candidates)
+    for c in moved:
+        sheets_queue.update(c["candidate_id"], {"rank": c["rank"]})
 
-    
+    screening_db[job_data["job_id"]] = job_data
+    bump_job_version(job_data["job_id"])
+    candidate_index.add_many(job_data, new_candidates)
 
+    return len(moved)
 
-    return {
-        "message": "Resumes processed & ranked successfully",
-        "job_id": job_id,
-        "total_resumes": len(job_data["candidates"]),
-        "shortlisted": len([c for c in job_data["candidates"] if c["shortlisted"]])
-    }
 
 # =================================================
-# STEP 1B: HR provides GOOGLE DRIVE folder link
+# STEP 1A: HR uploads MULTIPLE resumes (manual)
 # =================================================
-@app.post("/screen-resumes-from-drive")
-async def screen_resumes_from_drive(
+@app.post("/screen-resumes")
+async def screen_resumes(
+    response: Response,
     role: str = Form(...),
-    required_skills: str = Form(...),
+    required_skills: str = Form(...),   # comma-separated
     experience_level: str = Form(...),
     culture_traits: str = Form(""),
-    drive_folder_link: str = Form(...)
+    resumes: List[UploadFile] = File(...),
+    idempotency_key: str | None = Header(None, alias=IDEMPOTENCY_HEADER)
 ):
-    job_id = str(uuid.uuid4())[:8]
-    required_skills_list = [s.strip() for s in required_skills.split(",")]
+    if not resumes:
+        raise HTTPException(status_code=400, detail="No resumes uploaded")
 
-    folder_id = extract_folder_id(drive_folder_link)
-    files = list_files_in_folder(folder_id)
+    async def screen():
+        job_data = new_job(role, required_skills, experience_level, culture_traits)
+        job_id = job_data["job_id"]
+        files = [r for r in resumes if is_resume_file(r.filename)]
 
-    if not files:
-        raise HTTPException(status_code=400, detail="No files found in folder")
+        with admit_screening(len(files)) as ticket, new_job_state(job_id):
+            new_candidates = await screen_uploaded_resumes(job_data, files, ticket)
+            await run_blocking(io_executor, finish_screening, job_data, new_candidates)
 
-    job_data = {
-        "job_id": job_id,
-        "role": role,
-        "required_skills": required_skills_list,
-        "experience_level": experience_level,
-        "culture_traits": culture_traits,
-        "candidates": []
-    }
-
-    for file in files:
-        if not file["name"].lower().endswith((".pdf", ".docx")):
-            continue
+        return {
+            "message": "Resumes processed & ranked successfully",
+            "job_id": job_id,
+            "total_resumes": len(job_data["candidates"]),
+            "shortlisted": len([c for c in job_data["candidates"] if c["shortlisted"]])
+        }
 
-        file_path = download_file(
-            file_id=file["id"],
-            filename=f"{job_id}_{file['name']}",
-            download_dir=UPLOAD_DIR
-        )
+    fingerprint = request_fingerprint(
+        "/screen-resumes", role, required_skills, experience_level, culture_traits,
+        await upload_fingerprint(resumes) if idempotency_key else None
+    )
+    return await run_idempotent(idempotency_key, fingerprint, response, screen)
 
-        resume_text = parse_resume(file_path)
+# =================================================
+# STEP 1B: HR provides GOOGLE DRIVE folder link
+# =================================================
+def download_to_blob(file: dict, job_id: str) -> str:
+    file_path = file_source.download_file(
+        file_id=file["id"],
+        file_name=file["name"],
+        download_path=os.path.join(UPLOAD_DIR, f"{job_id}_{file['name']}")
+    )
+    return blobs.put_file(file_path, file["name"])
 
-        if is_duplicate_resume(resume_text, job_data["candidates"]):
-            continue
 
-        parsed_data = extract_resume_data(
-            resume_text=resume_text,
-            required_skills=required_skills_list
-        )
+@app.post("/screen-resumes-from-drive")
+async def screen_resumes_from_drive(
+    response: Response,
+    role: str = Form(...),
+    required_skills: str = Form(...),
+    experience_level: str = Form(...),
+    culture_traits: str = Form(""),
+    drive_folder_link: str = Form(...),
+    idempotency_key: str | None = Header(None, alias=IDEMPOTENCY_HEADER)
+):
+    async def screen():
+        job_data = new_job(role, required_skills, experience_level, culture_traits)
+        job_id = job_data["job_id"]
 
-        email_confidence = calculate_email_confidence(
-            name=parsed_data.get("name", ""),
-            email=parsed_data.get("email", ""),
-            resume_text=resume_text
-        )
+        folder_id = file_source.extract_folder_id(drive_folder_link)
+        files = await run_blocking(io_executor, file_source.list_files, folder_id)
 
-        score_result = score_resume(
-            job_description=f"{role} {required_skills}",
-            resume_text=resume_text
-        )
+        if not files:
+            raise HTTPException(status_code=400, detail="No files found in folder")
 
-        candidate_id = str(uuid.uuid4())[:8]
-        shortlisted = score_result["score"] >= 90
+        files = [f for f in files if is_resume_file(f["name"])]
+        new_candidates = []
 
-        job_data["candidates"].append({
-            "candidate_id": candidate_id,
-            "name": parsed_data.get("name"),
-            "email": parsed_data.get("email"),
-            "email_confidence": email_confidence,
-            "skills": parsed_data.get("skills", []),
-            "experience_years": parsed_data.get("experience_years"),
-            "score": score_result["score"],
-            "shortlisted": shortlisted,
-            "resume_file": file["name"],
-            "confidence": parsed_data.get("confidence", 0),
-            "interview_score": "",
-            "recommendation": "",
-            "email_stage": "RESUME_SHORTLISTED" if shortlisted else "REJECTED",
+        with admit_screening(len(files)) as ticket, new_job_state(job_id) as sidecar:
+            # Parsed resumes already seen (duplicate detection across uploads)
+            seen_resumes = sidecar.setdefault("seen_resumes", [])
 
+            for file in files:
+                started = time.perf_counter()
+                with span("resume", file=file["name"], job_id=job_id) as s:
+                    with span("upload_write", source="drive"):
+                        blob_key = await run_blocking(io_executor, download_to_blob, file, job_id)
 
-            "personal_form_submitted": False
+                    candidate = await run_blocking(
+                        screening_executor, screen_resume_file,
+                        blobs.path(blob_key), file["name"], job_data, seen_resumes
+                    )
+                    s["attributes"]["duplicate"] = candidate is None
+                ticket.resume_done(time.perf_counter() - started)
 
-        })
+                if candidate:
+                    blobs.add_ref(blob_key, job_id)
+                    new_candidates.append(candidate)
 
-    job_data["candidates"] = rank_candidates(job_data["candidates"])
+            await run_blocking(io_executor, finish_screening, job_data, new_candidates)
 
-    for candidate in job_data["candidates"]:
-        append_candidate({
+        return {
+            "message": "Google Drive resumes processed & ranked successfully",
             "job_id": job_id,
-            "role": role,
-            "candidate_id": candidate["candidate_id"],
-            "name": candidate["name"],
-            "email": candidate["email"],
-            "email_confidence": candidate["email_confidence"],
-            "skills": ", ".join(candidate["skills"]),
-            "experience_years": candidate["experience_years"],
-            "score": candidate["score"],
-            "interview_score": candidate.get("interview_score", ""),
-            "rank": candidate["rank"],
-            "rank_score": round(candidate["rank_score"], 2),
-            "recommendation": candidate.get("recommendation", ""),
-            "shortlisted": candidate["shortlisted"],
-            "resume_file": candidate["resume_file"],
-            "confidence": candidate["confidence"],
-            "email_stage": "RESUME_SHORTLISTED" if shortlisted else "REJECTED",
-
+            "total_resumes": len(job_data["candidates"]),
+            "shortlisted": len([c for c in job_data["candidates"] if c["shortlisted"]])
+        }
 
-            "personal_form_submitted": False,
-            "final_selected": False
+    fingerprint = request_fingerprint(
+        "/screen-resumes-from-drive", role, required_skills, experience_level,
+        culture_traits, drive_folder_link
+    )
+    return await run_idempotent(idempotency_key, fingerprint, response, screen)
 
 
+# =================================================
+# STEP 1C: Chunked uploads into one job
+# =================================================
+@app.post("/jobs")
+def create_job(
+    role: str = Form(...),
+    required_skills: str = Form(...),   # comma-separated
+    experience_level: str = Form(...),
+    culture_traits: str = Form("")
+):
+    job_data = new_job(role, required_skills, experience_level, culture_traits)
 
-        })
+    screening_db[job_data["job_id"]] = job_data
+    bump_job_version(job_data["job_id"])
 
+    return {"job_id": job_data["job_id"]}
 
-        if candidate["shortlisted"]:
-            trigger_make_webhook(
-                url=os.getenv("MAKE_SHORTLIST_WEBHOOK"),
-                payload={
-                    "candidate_id": candidate["candidate_id"],
-                    "name": candidate["name"],
-                    "email": candidate["email"],
-                    "job_role": role
-                }
-            )
 
+@app.post("/jobs/{job_id}/resumes")
+async def append_resumes(
+    job_id: str,
+    response: Response,
+    resumes: List[UploadFile] = File(...),
+    idempotency_key: str | None = Header(None, alias=IDEMPOTENCY_HEADER)
+):
+    if job_id not in screening_db:
+        raise HTTPException(status_code=404, detail="Job not found")
 
-    screening_db[job_id] = job_data
-    
-    
+    async def screen():
+        # Chunks of one upload wait for each other before admission,
+        # so they hold one admission slot at a time, not one each
+        files = [r for r in resumes if is_resume_file(r.filename)]
 
+        async with locked_job(job_id) as job_data:
+            with admit_screening(len(files)) as ticket:
+                new_candidates = await screen_uploaded_resumes(job_data, files, ticket)
+                rank_changes = await run_blocking(io_executor, finish_screening, job_data, new_candidates)
 
+        return {
+            "message": "Resumes added to job",
+            "job_id": job_id,
+            "added": len(new_candidates),
+            "rank_changes": rank_changes,
+            "total_resumes": len(job_data["candidates"]),
+            "shortlisted": len([c for c in job_data["candidates"] if c["shortlisted"]])
+        }
 
-    return {
-        "message": "Google Drive resumes processed & ranked successfully",
-        "job_id": job_id,
-        "total_resumes": len(job_data["candidates"]),
-        "shortlisted": len([c for c in job_data["candidates"] if c["shortlisted"]])
-    }
+    # A retried chunk (its response was lost) replays the
+    # first result instead of screening the files again
+    fingerprint = request_fingerprint(
+        "/jobs/{job_id}/resumes", job_id,
+        await upload_fingerprint(resumes) if idempotency_key else None
+    )
+    return await run_idempotent(idempotency_key, fingerprint, response, screen)
 
 
-app.post("/candidates/form-submitted")
+@app.post("/candidates/form-submitted")
 def form_submitted(data: dict):
     # 1️⃣ Read candidate_id (NOT email)
     candidate_id = data.get("candidate_id")
@@ -321,42 +634,23 @@ def form_submitted(data: dict):
         raise HTTPException(status_code=400, detail="candidate_id required")
 
     # 2️⃣ Find candidate using candidate_id
-    found_candidate = None
-    found_job = None
-
-    for job in screening_db.values():
-        for c in job["candidates"]:
-            if c.get("candidate_id") == candidate_id:
-                found_candidate = c
-                found_job = job
-                break
-        if found_candidate:
-            break
-
-    if not found_candidate:
-        raise HTTPException(status_code=404, detail="Candidate not found")
-
-    # 3️⃣ Update candidate state (IN MEMORY)
-    found_candidate["personal_form_submitted"] = True
-    found_candidate["email_stage"] = "FORM_SUBMITTED"
-    
-
-    from backend.google_sheets import update_candidate_by_id
-
-    update_candidate_by_id(
-        candidate_id=found_candidate["candidate_id"],
-        updates={
-            "personal_form_submitted": True,
-            "email_stage": "FORM_SUBMITTED"
-        }
-    )
-
-
+    with candidate_session(candidate_id) as (found_candidate, found_job):
+        # 3️⃣ Update candidate state (IN MEMORY)
+        found_candidate["personal_form_submitted"] = True
+        found_candidate["email_stage"] = "FORM_SUBMITTED"
+        bump_job_version(found_job["job_id"])
+        candidate_index.add(found_job, found_candidate)
+
+        sheets_queue.update(
+            found_candidate["candidate_id"],
+            {
+                "personal_form_submitted": True,
+                "email_stage": "FORM_SUBMITTED"
+            }
+        )
 
     # 4️⃣ Trigger Email #2 (AI Interview)
-    from backend.make_service import trigger_make_webhook
-
-    trigger_make_webhook(
+    notifier.trigger(
         url=os.getenv("MAKE_INTERVIEW_WEBHOOK"),
         payload={
             "candidate_id": found_candidate["candidate_id"],
@@ -371,86 +665,124 @@ def form_submitted(data: dict):
         "candidate_id": found_candidate["candidate_id"]
     }
 
-@app.post("/candidates/{candidate_id}/start-interview")
-def start_interview(candidate_id: str):
-    candidate = None
-    job = None
+# -------------------------------------------------
+# AI Interview limits
+# -------------------------------------------------
+# The countdowns are rendered client-side; the backend only
+# checks elapsed time from its own timestamps when answers arrive
+MAX_QUESTIONS = 5
+INTERVIEW_TIME_LIMIT_SECONDS = 20 * 60
+QUESTION_TIME_LIMIT_SECONDS = 5 * 60
+TIME_LIMIT_GRACE_SECONDS = 15   # network / rerun slack
+INTERVIEW_PASS_SCORE = 70
+
 
-    for job_data in screening_db.values():
-        for c in job_data["candidates"]:
+def interview_time_remaining(interview: dict) -> int:
+    elapsed = time.time() - interview["started_at"]
+    return max(int(INTERVIEW_TIME_LIMIT_SECONDS - elapsed), 0)
+
+
+def find_candidate(candidate_id: str):
+    """
+    Returns (candidate, job) or raises 404
+    """
+    job_id = screening_db.job_id_for_candidate(candidate_id)
+
+    if job_id in screening_db:
+        for c in screening_db[job_id]["candidates"]:
             if c["candidate_id"] == candidate_id:
-                candidate = c
-                job = job_data
-                break
+                return c, screening_db[job_id]
+
+    raise HTTPException(status_code=404, detail="Candidate not found")
+
+
+@contextmanager
+def candidate_session(candidate_id: str):
+    """
+    find_candidate(), with the job kept in memory until the
+    block exits (the caller mutates the live candidate)
+    """
+    with screening_db.hold(screening_db.job_id_for_candidate(candidate_id)):
+        yield find_candidate(candidate_id)
+
+
+def candidate_changed(candidate: dict):
+    # Interview progress is part of the job results (new ETag)
+    job_id = screening_db.job_id_for_candidate(candidate["candidate_id"])
+    if job_id:
+        bump_job_version(job_id)
 
-    if not candidate:
-        raise HTTPException(status_code=404, detail="Candidate not found")
 
+def open_interview(candidate: dict):
+    """
+    Starts the interview clock. An interview in progress is
+    resumed as is (same started_at, answers kept); a completed
+    one cannot be started again.
+    """
+    interview = candidate.get("interview")
+
+    if interview and interview.get("completed"):
+        raise HTTPException(status_code=409, detail="Interview already completed")
+    if interview:
+        return
+
+    now = time.time()
     candidate["interview"] = {
         "started": True,
         "completed": False,
-        "qna": []
-    }
-
-    question = generate_interview_question(
-        job_description=job["role"],
-        resume_text=candidate.get("resume_text", ""),
-        previous_qna=[]
-    )
-
-    return {
-        "candidate_id": candidate_id,
-        "question": question,
-        "round": 1
+        "qna": [],
+        "started_at": now,
+        "question_asked_at": now,
+        "current_question": ""
     }
+    candidate["interview_qna"] = []
+    candidate_changed(candidate)
 
 
-@app.post("/candidates/{candidate_id}/answer")
-def submit_answer(candidate_id: str, answer: str):
+def record_answer(candidate: dict, answer: str):
+    """
+    Stores the answer to the current question.
+    Time limits are validated from server-side timestamps.
+    """
+    interview = candidate.get("interview")
+    if not interview or interview.get("completed"):
+        raise HTTPException(status_code=409, detail="No interview in progress")
 
-    candidate = None
-    job = None
+    now = time.time()
+    if now - interview["started_at"] > INTERVIEW_TIME_LIMIT_SECONDS + TIME_LIMIT_GRACE_SECONDS:
+        raise HTTPException(status_code=409, detail="Interview time limit exceeded")
 
-    # 1️⃣ Locate candidate
-    for j in screening_db.values():
-        for c in j["candidates"]:
-            if c["candidate_id"] == candidate_id:
-                candidate = c
-                job = j
-                break
-
-    if not candidate:
-        raise HTTPException(status_code=404, detail="Candidate not found")
+    seconds_taken = round(now - interview["question_asked_at"], 1)
 
-    # 2️⃣ Initialize interview tracking
     if "interview_qna" not in candidate:
         candidate["interview_qna"] = []
 
-    candidate["interview_qna"].append(answer)
-
-    MAX_QUESTIONS = 5
+    candidate["interview_qna"].append({
+        "question": interview["current_question"],
+        "answer": answer,
+        "seconds_taken": seconds_taken,
+        "late": seconds_taken > QUESTION_TIME_LIMIT_SECONDS + TIME_LIMIT_GRACE_SECONDS
+    })
+    candidate_changed(candidate)
 
-    # 3️⃣ If interview still going → ask next question
-    if len(candidate["interview_qna"]) < MAX_QUESTIONS:
-        from backend.interview_ai import generate_interview_question
 
-        next_question = generate_interview_question(
-            job["role"],
-            candidate.get("resume_text", ""),
-            candidate["interview_qna"]
-        )
+def ask_question(candidate: dict, question: str):
+    candidate["interview"]["current_question"] = question
+    candidate["interview"]["question_asked_at"] = time.time()
+    candidate_changed(candidate)
 
-        return {"next_question": next_question}
 
-    # 4️⃣ Interview completed → evaluate
-    from backend.interview_ai import evaluate_interview
-    from backend.ranker import rank_candidates
-    from backend.google_sheets import append_candidate
+def complete_interview(candidate: dict, job: dict) -> dict:
+    """
+    Evaluates the interview, re-ranks the job and saves the
+    candidate to Google Sheets
+    """
+    candidate["interview"]["completed"] = True
 
     evaluation = evaluate_interview(candidate["interview_qna"])
-    interview_score = evaluation.get("score", 0)
+    interview_score = evaluation.get("final_score", 0)
 
-    # 5️⃣ Recommendation logic
+    # Recommendation logic
     if interview_score >= 80:
         recommendation = "STRONG_FIT"
     elif interview_score >= 60:
@@ -461,25 +793,15 @@ def submit_answer(candidate_id: str, answer: str):
     candidate["interview_score"] = interview_score
     candidate["recommendation"] = recommendation
 
-    # 6️⃣ Re-rank candidates after interview
+    # Re-rank candidates after interview
     job["candidates"] = rank_candidates(job["candidates"])
+    bump_job_version(job["job_id"])
+    candidate_index.add(job, candidate)
 
-    # 7️⃣ Save to Google Sheet
-    append_candidate({
-        "job_id": job["job_id"],
-        "role": job["role"],
-        "candidate_id": candidate["candidate_id"],
-        "name": candidate["name"],
-        "email": candidate["email"],
-        "email_confidence": candidate.get("email_confidence"),
-        "skills": ", ".join(candidate.get("skills", [])),
-        "experience_years": candidate.get("experience_years"),
-        "score": candidate["score"],
+    # Save to Google Sheet (updates the candidate's row)
+    sheets_queue.update(candidate["candidate_id"], {
         "interview_score": interview_score,
         "recommendation": recommendation,
-        "shortlisted": candidate["shortlisted"],
-        "resume_file": candidate.get("resume_file"),
-        "confidence": candidate.get("confidence"),
         "rank": candidate["rank"],
         "rank_score": round(candidate["rank_score"], 2)
     })
@@ -488,71 +810,211 @@ def submit_answer(candidate_id: str, answer: str):
         "message": "Interview completed",
         "interview_score": interview_score,
         "recommendation": recommendation,
+        "feedback": evaluation.get("feedback", ""),
         "final_rank": candidate["rank"]
     }
 
 
-@app.post("/candidates/{candidate_id}/interview-result")
-def update_interview_result(candidate_id: str, interview_score: int):
-    found_job = None
-    found_candidate = None
+async def finish_interview(candidate: dict, job: dict) -> dict:
+    # complete_interview() re-ranks the job: serialized with
+    # uploads and rescoring of the same job
+    async with job_lock(job["job_id"]):
+        return await run_blocking(io_executor, complete_interview, candidate, job)
 
-    for job in screening_db.values():
-        for c in job["candidates"]:
-            if c["candidate_id"] == candidate_id:
-                found_job = job
-                found_candidate = c
-                break
 
-    if not found_candidate:
-        raise HTTPException(status_code=404, detail="Candidate not found")
+@app.post("/candidates/{candidate_id}/start-interview")
+def start_interview(candidate_id: str):
+    with candidate_session(candidate_id) as (candidate, job):
+        open_interview(candidate)
+        interview = candidate["interview"]
+
+        # Resumed: the question already asked stays current
+        question = interview["current_question"]
+        if not question:
+            question = generate_interview_question(
+                job_description=job["role"],
+                resume_text=resume_texts.get(candidate_id) or "",
+                previous_qna=candidate["interview_qna"]
+            )
+            ask_question(candidate, question)
 
+    return {
+        "candidate_id": candidate_id,
+        "question": question,
+        "round": len(candidate["interview_qna"]) + 1,
+        "time_remaining_seconds": interview_time_remaining(interview),
+        "question_time_limit_seconds": QUESTION_TIME_LIMIT_SECONDS
+    }
+
+
+@app.post("/candidates/{candidate_id}/answer")
+async def submit_answer(candidate_id: str, answer: str):
+    with candidate_session(candidate_id) as (candidate, job):
+        record_answer(candidate, answer)
+
+        # If interview still going → ask next question
+        if len(candidate["interview_qna"]) < MAX_QUESTIONS:
+            next_question = await run_blocking(
+                io_executor, generate_interview_question,
+                job["role"],
+                resume_texts.get(candidate_id) or "",
+                candidate["interview_qna"]
+            )
+            ask_question(candidate, next_question)
+
+            return {
+                "next_question": next_question,
+                "time_remaining_seconds": interview_time_remaining(candidate["interview"])
+            }
+
+        # Interview completed → evaluate
+        return await finish_interview(candidate, job)
+
+
+# =================================================
+# AI Interview over one WebSocket
+# =================================================
+# Client → {"type": "answer", "answer": "..."}
+# Server → {"type": "question_token", "token": "..."} (streamed)
+#          {"type": "question_end", "round": n, "question": "...", "time_remaining_seconds": s}
+#          {"type": "completed", ...interview result}
+#          {"type": "error", "detail": "..."}
+
+# candidate_id -> open interview socket (one session per candidate)
+interview_sockets = {}
+
+
+async def stream_question(websocket: WebSocket, candidate: dict, job: dict):
+    tokens = []
+
+    async for token in iterate_in_threadpool(stream_interview_question(
+        job["role"],
+        resume_texts.get(candidate["candidate_id"]) or "",
+        candidate.get("interview_qna", [])
+    )):
+        tokens.append(token)
+        await websocket.send_json({"type": "question_token", "token": token})
+
+    return "".join(tokens)
+
+
+@app.websocket("/candidates/{candidate_id}/interview/ws")
+async def interview_socket(websocket: WebSocket, candidate_id: str):
+    await websocket.accept()
+
+    # The session mutates the live candidate for up to the
+    # interview time limit: keep its job in memory meanwhile
+    with screening_db.hold(screening_db.job_id_for_candidate(candidate_id)):
+        try:
+            candidate, job = find_candidate(candidate_id)
+            open_interview(candidate)
+        except HTTPException as e:
+            await websocket.send_json({"type": "error", "detail": e.detail})
+            await websocket.close(code=1008)
+            return
+
+        previous = interview_sockets.get(candidate_id)
+        if previous is not None:
+            await previous.close(code=1000, reason="Interview opened elsewhere")
+        interview_sockets[candidate_id] = websocket
+
+        try:
+            # A reconnect resumes with the question already asked
+            question = candidate["interview"]["current_question"]
+            if not question:
+                question = await stream_question(websocket, candidate, job)
+                ask_question(candidate, question)
+
+            while True:
+                await websocket.send_json({
+                    "type": "question_end",
+                    "round": len(candidate["interview_qna"]) + 1,
+                    "question": question,
+                    "time_remaining_seconds": interview_time_remaining(candidate["interview"])
+                })
+
+                # Idle sockets are closed once the interview time is up
+                message = await asyncio.wait_for(
+                    websocket.receive_json(),
+                    timeout=interview_time_remaining(candidate["interview"]) + TIME_LIMIT_GRACE_SECONDS
+                )
+                if message.get("type") != "answer":
+                    continue
+
+                try:
+                    record_answer(candidate, message.get("answer", ""))
+                except HTTPException as e:
+                    await websocket.send_json({"type": "error", "detail": e.detail})
+                    break
+
+                if len(candidate["interview_qna"]) >= MAX_QUESTIONS:
+                    result = await finish_interview(candidate, job)
+                    await websocket.send_json({"type": "completed", **result})
+                    break
+
+                question = await stream_question(websocket, candidate, job)
+                ask_question(candidate, question)
+
+            await websocket.close()
+
+        except asyncio.TimeoutError:
+            await websocket.send_json({"type": "error", "detail": "Interview time limit exceeded"})
+            await websocket.close()
+        except WebSocketDisconnect:
+            pass
+        finally:
+            if interview_sockets.get(candidate_id) is websocket:
+                del interview_sockets[candidate_id]
+
+
+def record_interview_result(candidate: dict, job: dict, interview_score: int) -> bool:
+    """
+    Saves HR's interview score, makes the final decision,
+    re-ranks the job and updates Google Sheets.
+    Returns whether the candidate passed.
+    """
     # Save interview score
-    found_candidate["interview_score"] = interview_score
+    candidate["interview_score"] = interview_score
+
+    # -----------------------------
+    # FINAL INTERVIEW DECISION
+    # -----------------------------
+    passed = interview_score >= INTERVIEW_PASS_SCORE
+    candidate["email_stage"] = "INTERVIEW_PASSED" if passed else "INTERVIEW_FAILED"
+    candidate["final_selected"] = passed
 
     # Re-rank candidates
-    from backend.ranker import rank_candidates
-    found_job["candidates"] = rank_candidates(found_job["candidates"])
+    job["candidates"] = rank_candidates(job["candidates"])
+    bump_job_version(job["job_id"])
+    candidate_index.add(job, candidate)
 
     # Update Google Sheet
-    from backend.google_sheets import append_candidate
-    append_candidate({
-        "job_id": found_job["job_id"],
-        "role": found_job["role"],
-        "candidate_id": found_candidate["candidate_id"],
-        "name": found_candidate["name"],
-        "email": found_candidate["email"],
-        "skills": ", ".join(found_candidate.get("skills", [])),
-        "experience_years": found_candidate.get("experience_years"),
-        "score": found_candidate.get("score"),
+    sheets_queue.update(candidate["candidate_id"], {
         "interview_score": interview_score,
-        "rank": found_candidate["rank"],
-        "rank_score": round(found_candidate["rank_score"], 2),
-        "recommendation": found_candidate["recommendation"],
-        "shortlisted": found_candidate["shortlisted"],
-        "resume_file": found_candidate.get("resume_file"),
-        "confidence": found_candidate.get("confidence")
+        "rank": candidate["rank"],
+        "rank_score": round(candidate["rank_score"], 2),
+        "recommendation": candidate["recommendation"],
+        "email_stage": candidate["email_stage"],
+        "final_selected": passed
     })
 
-    return {
-        "message": "Interview evaluated and ranking updated",
-        "rank": found_candidate["rank"],
-        "recommendation": found_candidate["recommendation"]
-    }
-    
-    # -----------------------------
-# FINAL INTERVIEW DECISION
-# -----------------------------
-    INTERVIEW_PASS_SCORE = 70
+    return passed
 
-    if interview_score >= INTERVIEW_PASS_SCORE:
-        found_candidate["email_stage"] = "INTERVIEW_PASSED"
-        found_candidate["final_selected"] = True
 
-    # Trigger FINAL interview email (Calendly)
-        from backend.make_service import trigger_make_webhook
+@app.post("/candidates/{candidate_id}/interview-result")
+async def update_interview_result(candidate_id: str, interview_score: int):
+    with candidate_session(candidate_id) as (found_candidate, found_job):
+        # Re-ranks the job: serialized with uploads and rescoring
+        async with job_lock(found_job["job_id"]):
+            passed = await run_blocking(
+                io_executor, record_interview_result,
+                found_candidate, found_job, interview_score
+            )
 
-        trigger_make_webhook(
+    # Trigger FINAL interview email (Calendly)
+    if passed:
+        await run_blocking(
+            io_executor, notifier.trigger,
             url=os.getenv("MAKE_FINAL_WEBHOOK"),
             payload={
                 "candidate_id": found_candidate["candidate_id"],
@@ -562,46 +1024,300 @@ def update_interview_result(candidate_id: str, interview_score: int):
             }
         )
 
-    else:
-        found_candidate["email_stage"] = "INTERVIEW_FAILED"
-        found_candidate["final_selected"] = False
-
-
-
-
+    return {
+        "message": "Interview evaluated and ranking updated",
+        "rank": found_candidate["rank"],
+        "recommendation": found_candidate["recommendation"],
+        "final_selected": passed
+    }
 
 
 # =================================================
 # HR: View Results
 # =================================================
 @app.get("/jobs/{job_id}/results")
-def get_screening_results(job_id: str):
-    job = screening_db.get(job_id)
-    if not job:
+def get_screening_results(job_id: str, request: Request):
+    """
+    Polled by dashboards: ETag / Last-Modified follow the job
+    version, so an unchanged job is a bodyless 304
+    """
+    if job_id not in screening_db:
         raise HTTPException(status_code=404, detail="Job not found")
-    return job
+
+    return versioned_json_response(
+        request,
+        key=job_id,
+        version=job_version(job_id),
+        modified=job_modified(job_id),
+        build=lambda: screening_db[job_id]
+    )
 
 # =================================================
-# Health Check
+# HR: What-if rescoring (cached resume features)
 # =================================================
-@app.get("/")
-def health():
-    return {"status": "Backend running"}
+RESCORE_FIELDS = ("score", "skills", "shortlisted", "email_stage", "rank", "rank_score", "recommendation")
+
+# Candidates past screening (form submitted, interviewed) keep
+# their shortlist decision; only the score and rank move
+SCREENING_STAGES = ("RESUME_SHORTLISTED", "REJECTED")
+
+
+def rescore_candidates(
+    job: dict,
+    required_skills: List[str],
+    shortlist_cutoff: int,
+    apply: bool
+) -> dict:
+    """
+    Recomputes scores, shortlist decisions and ranks for new
+    criteria from cached features (no re-parsing); candidates
+    past screening keep their shortlist decision. With apply,
+    the job, Sheets and the search index are updated; emails
+    are not re-sent.
+    """
+    started = time.perf_counter()
+    candidates = job["candidates"]
+
+    with span("rescore", job_id=job["job_id"], candidates=len(candidates)):
+        features = resume_features.rescore(
+            job["job_id"],
+            [c["candidate_id"] for c in candidates],
+            job["role"],
+            required_skills,
+            resume_texts.get
+        )
 
+        what_if = []
+        for c in candidates:
+            f = features.get(c["candidate_id"])
+            if f is None:
+                # No stored resume text: keeps its current score
+                what_if.append(dict(c))
+                continue
+            new = dict(c, score=f["score"], skills=f["skills"])
+            if c.get("email_stage") in SCREENING_STAGES:
+                new["shortlisted"] = f["score"] >= shortlist_cutoff
+                new["email_stage"] = "RESUME_SHORTLISTED" if new["shortlisted"] else "REJECTED"
+            what_if.append(new)
+
+        ranked = rank_candidates(what_if)
+
+    by_id = {c["candidate_id"]: c for c in candidates}
+
+    if apply:
+        job["required_skills"] = required_skills
+        job["shortlist_cutoff"] = shortlist_cutoff
+
+        for new in ranked:
+            c = by_id[new["candidate_id"]]
+            changes = {k: new[k] for k in RESCORE_FIELDS if c.get(k) != new[k]}
+            if not changes:
+                continue
+            c.update(changes)
+
+            row = dict(changes)
+            if "skills" in row:
+                row["skills"] = ", ".join(row["skills"])
+            if "rank_score" in row:
+                row["rank_score"] = round(row["rank_score"], 2)
+            sheets_queue.update(c["candidate_id"], row)
+
+        job["candidates"] = [by_id[new["candidate_id"]] for new in ranked]
+        bump_job_version(job["job_id"])
+        candidate_index.add_many(job, job["candidates"])
 
+    return {
+        "job_id": job["job_id"],
+        "applied": apply,
+        "required_skills": required_skills,
+        "shortlist_cutoff": shortlist_cutoff,
+        "total_resumes": len(ranked),
+        "rescored": len(features),
+        "shortlisted": len([c for c in ranked if c["shortlisted"]]),
+        "took_ms": round((time.perf_counter() - started) * 1000, 2),
+        "candidates": [
+            {
+                "candidate_id": c["candidate_id"],
+                "name": c.get("name"),
+                "score": c["score"],
+                "skills": c["skills"],
+                "shortlisted": c["shortlisted"],
+                "rank": c["rank"],
+                "previous_rank": by_id[c["candidate_id"]].get("rank") if not apply else None,
+                "rank_score": round(c["rank_score"], 2),
+                "recommendation": c["recommendation"]
+            }
+            for c in ranked
+        ]
+    }
 
 
+@app.post("/jobs/{job_id}/rescore")
+async def rescore_job(
+    job_id: str,
+    required_skills: str | None = Form(None),    # comma-separated; default: the job's
+    shortlist_cutoff: int | None = Form(None),   # default: the job's
+    apply: bool = Form(False)                    # False = preview only
+):
+    # Serialized with uploads into the same job
+    async with locked_job(job_id) as job:
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+
+        skills = (
+            [s.strip() for s in required_skills.split(",")]
+            if required_skills else job["required_skills"]
+        )
+        if shortlist_cutoff is None:
+            shortlist_cutoff = job.get("shortlist_cutoff", SHORTLIST_SCORE_CUTOFF)
 
+        return await run_blocking(
+            screening_executor, rescore_candidates, job, skills, shortlist_cutoff, apply
+        )
 
+# =================================================
+# HR: Columnar export (Arrow IPC / Parquet)
+# =================================================
+def export_response(jobs: list, name: str, format: str, columns: str | None):
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="format must be arrow or parquet")
 
+    try:
+        column_list = validate_columns(
+            [c.strip() for c in columns.split(",") if c.strip()] if columns else None
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
+    media_type, extension = EXPORT_FORMATS[format]
 
+    return StreamingResponse(
+        stream_export(jobs, format, column_list),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}.{extension}"'
+        }
+    )
 
 
+@app.get("/jobs/export")
+def export_all_jobs(format: str = "arrow", columns: str | None = None):
+    return export_response(screening_db.values(), "candidates", format, columns)
 
 
+@app.get("/jobs/{job_id}/export")
+def export_job(job_id: str, format: str = "arrow", columns: str | None = None):
+    job = screening_db.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return export_response([job], f"job_{job_id}", format, columns)
 
+# =================================================
+# HR Dashboard: candidate table
+# =================================================
+@app.get("/dashboard/candidates")
+def dashboard_candidates(
+    job_id: str | None = None,
+    shortlisted_only: bool = False,
+    final_selected_only: bool = False,
+    sort_by: List[str] = Query(["interview_score", "rank_score"]),
+    page: int = 1,
+    page_size: int = 50
+):
+    return get_candidate_page(
+        screening_db,
+        job_id=job_id,
+        shortlisted_only=shortlisted_only,
+        final_selected_only=final_selected_only,
+        sort_by=sort_by,
+        page=page,
+        page_size=page_size
+    )
 
+# =================================================
+# HR: Search past applicants (all jobs)
+# =================================================
+def split_values(values: List[str]) -> List[str]:
+    # Accepts repeated params and comma-separated lists
+    return [v.strip() for value in values for v in value.split(",") if v.strip()]
+
+
+@app.get("/candidates/search")
+def search_candidates(
+    skills: List[str] = Query([]),
+    match: str = "all",
+    exclude_skills: List[str] = Query([]),
+    role: List[str] = Query([]),
+    email_domain: List[str] = Query([]),
+    stage: List[str] = Query([]),
+    recommendation: List[str] = Query([]),
+    shortlisted: bool | None = None,
+    min_experience: float | None = None,
+    max_experience: float | None = None,
+    min_score: float | None = None,
+    max_score: float | None = None,
+    limit: int = 50,
+    offset: int = 0
+):
+    try:
+        return candidate_index.search(
+            skills=split_values(skills),
+            match=match,
+            exclude_skills=split_values(exclude_skills),
+            roles=role,
+            email_domains=split_values(email_domain),
+            stages=split_values(stage),
+            recommendations=split_values(recommendation),
+            shortlisted=shortlisted,
+            min_experience=min_experience,
+            max_experience=max_experience,
+            min_score=min_score,
+            max_score=max_score,
+            limit=limit,
+            offset=max(offset, 0)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.get("/candidates/{candidate_id}/similar")
+def similar_candidates(candidate_id: str, k: int = 10):
+    try:
+        result = similarity_index.similar(candidate_id, k)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Candidate not found")
 
+    result["results"] = [
+        {**(candidate_index.get(r["candidate_id"]) or {}), **r}
+        for r in result["results"]
+    ]
+    return result
 
+# =================================================
+# Ops: in-memory state footprint
+# =================================================
+@app.get("/state/stats")
+def state_stats():
+    return {
+        "jobs": screening_db.stats(),
+        "resume_texts": resume_texts.stats(),
+        "blobs": blobs.stats(),
+        "sheets_queue": sheets_queue.stats(),
+        "integrations": integration_stats(),
+        "candidate_index": candidate_index.stats(),
+        "similarity_index": similarity_index.stats(),
+        "resume_features": resume_features.stats(),
+        "admission": admission.stats(),
+        "idempotency": idempotency.stats(),
+        "responses": response_stats()
+    }
+
+@app.get("/state/startup")
+def startup_stats():
+    return startup_report()
 
+# =================================================
+# Health Check
+# =================================================
+@app.get("/")
+def health():
+    return {"status": "Backend running"}
@@ -1,3 +1,6 @@
+import heapq
+
+
 def email_confidence_score(confidence: str) -> int:
     mapping = {
         "HIGH": 20,
@@ -20,23 +23,31 @@ def generate_recommendation(final_score: float) -> str:
         return "Not Recommended"
 
 
+def score_candidate(c: dict):
+    """
+    Adds rank_score and recommendation
+    """
+    # Missing values are stored as "" / None until known
+    interview_score = c.get("interview_score") or 0
+
+    c["rank_score"] = (
+        (c.get("score", 0) * 0.4) +
+        interview_score_weight(interview_score) +
+        (len(c.get("skills", [])) * 5) +
+        email_confidence_score(c.get("email_confidence", "LOW")) +
+        ((c.get("experience_years") or 0) * 2)
+    )
+
+    c["recommendation"] = generate_recommendation(c["rank_score"])
+
+
 def rank_candidates(candidates: list) -> list:
     """
     Adds rank_score, rank, and recommendation
     """
 
     for c in candidates:
-        interview_score = c.get("interview_score", 0)
-
-        c["rank_score"] = (
-            (c.get("score", 0) * 0.4) +
-            interview_score_weight(interview_score) +
-            (len(c.get("skills", [])) * 5) +
-            email_confidence_score(c.get("email_confidence", "LOW")) +
-            (c.get("experience_years", 0) * 2)
-        )
-
-        c["recommendation"] = generate_recommendation(c["rank_score"])
+        score_candidate(c)
 
     ranked = sorted(candidates, key=lambda x: x["rank_score"], reverse=True)
 
@@ -44,3 +55,28 @@ def rank_candidates(candidates: list) -> list:
         c["rank"] = idx
 
     return ranked
+
+
+def merge_ranked(ranked: list, new_candidates: list) -> tuple:
+    """
+    Folds new candidates into an already ranked list (as returned
+    by rank_candidates) without re-scoring the existing ones.
+    Returns (ranked list, existing candidates whose rank changed).
+    """
+    for c in new_candidates:
+        score_candidate(c)
+
+    new_ranked = sorted(new_candidates, key=lambda x: x["rank_score"], reverse=True)
+
+    # Ties keep existing candidates first, like a stable re-sort
+    merged = list(heapq.merge(ranked, new_ranked, key=lambda x: -x["rank_score"]))
+
+    new_ids = {id(c) for c in new_candidates}
+    moved = []
+
+    for idx, c in enumerate(merged, start=1):
+        if id(c) not in new_ids and c.get("rank") != idx:
+            moved.append(c)
+        c["rank"] = idx
+
+    return merged, moved
@@ -1,4 +1,5 @@
 import re
+from datetime import date
 from typing import Dict, List
 
 
@@ -50,18 +51,185 @@ def extract_skills(text: str, skill_list: List[str]) -> List[str]:
     return found
 
 
-def estimate_experience_years(text: str) -> float | None:
+# -------------------------------------------------
+# Experience: employment date ranges
+# -------------------------------------------------
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12
+}
+
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?"
+_YEAR = r"(?:19|20)[0-9]{2}"
+
+# Scanning every position with one big regex is slower than the old
+# single "N years" search. Instead, str.find (a C memchr loop) locates
+# the few places that can start a range ("19xx" / "20xx") or end a
+# statement ("years" / "yrs"), and small regexes are anchored there.
+YEAR_PREFIXES = ("19", "20")
+STATED_KEYWORDS = ("years", "Years", "YEARS", "yrs", "Yrs", "YRS")
+
+# What follows a start year: separator + end of the range
+RANGE_END_RE = re.compile(
+    r"\s*(?:-|–|—|to|until|till)\s*"
+    r"(?:(present|current|now|today|date)"
+    r"|(" + _MONTH + r")\s*,?\s*(" + _YEAR + r")"
+    r"|([0-9]{1,2})\s*[/.-]\s*(" + _YEAR + r")"
+    r"|(" + _YEAR + r"))",
+    re.IGNORECASE
+)
+# Numeric month right before a start year ("03/2016")
+START_MONTH_RE = re.compile(r"(?<![\w./-])([0-9]{1,2})\s*[/.-]\s*$")
+# Number right before "years" / "yrs" ("5+ years")
+STATED_RE = re.compile(r"(?<![\w.])([0-9]+(?:\.[0-9]+)?)\+?\s*$")
+
+LOOKBACK = 16              # chars before a year / keyword searched for its month / number
+
+MIN_START_YEAR = 1950
+MAX_RANGE_MONTHS = 50 * 12
+# "N years" beyond this is not a career ("a 125 years old company")
+MAX_STATED_YEARS = MAX_RANGE_MONTHS / 12
+
+
+def _find_all(text: str, needles: tuple) -> List[int]:
+    positions = []
+    for needle in needles:
+        pos = text.find(needle)
+        while pos != -1:
+            positions.append(pos)
+            pos = text.find(needle, pos + 1)
+    return positions
+
+
+def _month_before(text: str, pos: int) -> int | None:
     """
-    Heuristic:
-    Look for patterns like '3 years', '2.5 yrs'
+    Month number of the word right before pos ("Jan 2019",
+    "September, 2019"), None when it is not a month
     """
-    match = re.search(r"(\d+(\.\d+)?)\s*(years|yrs)", text.lower())
-    if match:
-        return float(match.group(1))
-
+    words = text[max(0, pos - LOOKBACK):pos].split()
+    if not words:
+        return None
+    word = words[-1].rstrip(",.").lower()
+    if 3 <= len(word) <= 9:
+        return MONTHS.get(word[:3])
     return None
 
 
+def _stated_years(text: str) -> float | None:
+    """
+    Largest plausible explicit "N years" / "N yrs" statement
+    """
+    stated = None
+    for pos in _find_all(text, STATED_KEYWORDS):
+        match = STATED_RE.search(text, max(0, pos - LOOKBACK), pos)
+        if match:
+            years = float(match.group(1))
+            if years <= MAX_STATED_YEARS:
+                stated = max(stated or 0.0, years)
+    return stated
+
+
+def _date_ranges(text: str, now: int) -> List[tuple]:
+    """
+    (start, end) month numbers of every employment date range
+    """
+    intervals = []
+    consumed = 0
+
+    for pos in sorted(_find_all(text, YEAR_PREFIXES)):
+        # Inside a range already read (its end year)
+        if pos < consumed:
+            continue
+        # A whole 4-digit year, not part of a longer number / word
+        if not text[pos + 2:pos + 4].isdigit() or text[pos + 4:pos + 5].isdigit():
+            continue
+
+        match = RANGE_END_RE.match(text, pos + 4)
+        if not match:
+            continue
+
+        start_num = START_MONTH_RE.search(text, max(0, pos - 6), pos)
+        if start_num:
+            start_month = int(start_num.group(1))
+        elif pos and (text[pos - 1].isalnum() or text[pos - 1] in "_./-"):
+            continue
+        else:
+            # Year only: from January
+            start_month = _month_before(text, pos) or 1
+        consumed = match.end()
+
+        present, end_mon, end_my, end_num, end_ny, end_y = match.groups()
+
+        # Months since year 0; ends point just past their month
+        # so "Jan 2019 - Jan 2019" counts as one month
+        start = int(text[pos:pos + 4]) * 12 + start_month - 1
+
+        if present:
+            end = now
+        elif end_mon:
+            end = int(end_my) * 12 + MONTHS[end_mon[:3].lower()]
+        elif end_num:
+            if not 1 <= int(end_num) <= 12:
+                continue
+            end = int(end_ny) * 12 + int(end_num)
+        else:
+            # Year only: through December ("2019 - 2019" is a year)
+            end = int(end_y) * 12 + 12
+
+        if not 1 <= start_month <= 12 or start // 12 < MIN_START_YEAR:
+            continue
+        end = min(end, now)
+        if start < end <= start + MAX_RANGE_MONTHS:
+            intervals.append((start, end))
+
+    return intervals
+
+
+def merged_months(intervals: List[tuple]) -> int:
+    """
+    Total months covered by [start, end) intervals; overlapping
+    jobs are counted once
+    """
+    total = 0
+    current_start = current_end = None
+
+    for start, end in sorted(intervals):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                total += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+
+    if current_end is not None:
+        total += current_end - current_start
+    return total
+
+
+def estimate_experience_years(text: str, today: date | None = None) -> float | None:
+    """
+    Total experience from employment date ranges ("Jan 2019 –
+    Present", "03/2016 - 12/2018", "2012 - 2015"), overlaps
+    merged. Explicit statements like "5 years" are only used
+    when the resume lists no ranges.
+    """
+    today = today or date.today()
+    now = today.year * 12 + today.month       # just past the current month
+
+    intervals = _date_ranges(text, now)
+    if intervals:
+        return round(merged_months(intervals) / 12, 1)
+    return _stated_years(text)
+
+
+def estimate_experience_batch(texts: List[str]) -> List[float | None]:
+    """
+    Experience for many resumes (one date lookup, same compiled scanner)
+    """
+    today = date.today()
+    return [estimate_experience_years(text, today) for text in texts]
+
+
 def extract_resume_data(
     resume_text: str,
     required_skills: List[str]
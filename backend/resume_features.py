@@ -0,0 +1,156 @@
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Dict, List
+
+from backend.ai_scorer import heuristic_score
+
+# -------------------------------------------------
+# Environment
+# -------------------------------------------------
+# Jobs whose features stay in memory; older ones are rebuilt
+# from the stored resume texts on their next rescore
+MAX_FEATURE_JOBS = int(os.getenv("MAX_FEATURE_JOBS", "50"))
+
+
+def job_description(role: str, required_skills: List[str]) -> str:
+    # What the resume scorer compares against
+    return f"{role} {', '.join(required_skills)}"
+
+
+class JobFeatures:
+    """
+    Per-resume features of one job, enough to rescore without
+    re-parsing: the scorer's tokens as an inverted index
+    (token -> resume slots), text lengths, and one skill-match
+    bitmap (a byte per resume) per skill asked about so far
+    """
+
+    def __init__(self):
+        self.slots: Dict[str, int] = {}          # candidate_id -> slot
+        self.candidate_ids: List[str] = []       # slot -> candidate_id
+        self.lengths = array("I")                # slot -> len(resume_text)
+        self.postings: Dict[str, array] = {}     # token -> slots
+        self.skill_maps: Dict[str, bytearray] = {}
+
+    def add(self, candidate_id: str, text: str):
+        if candidate_id in self.slots:
+            return
+
+        slot = len(self.candidate_ids)
+        self.slots[candidate_id] = slot
+        self.candidate_ids.append(candidate_id)
+        self.lengths.append(len(text))
+
+        text_lower = text.lower()
+        for token in set(text_lower.split()):
+            self.postings.setdefault(token, array("I")).append(slot)
+
+        for skill, matches in self.skill_maps.items():
+            matches.append(skill in text_lower)
+
+    def skill_map(self, skill: str, text_of) -> bytearray:
+        """
+        matches[slot] == 1 when the resume contains the skill
+        (same substring test as extract_skills)
+        """
+        skill = skill.lower()
+        matches = self.skill_maps.get(skill)
+        if matches is not None:
+            return matches
+
+        matches = bytearray(len(self.candidate_ids))
+
+        if skill and not any(ch.isspace() for ch in skill):
+            # Without whitespace the skill can only occur inside
+            # a single token: scan the vocabulary, not the texts
+            for token, slots in self.postings.items():
+                if skill in token:
+                    for slot in slots:
+                        matches[slot] = 1
+        else:
+            for slot, candidate_id in enumerate(self.candidate_ids):
+                matches[slot] = skill in (text_of(candidate_id) or "").lower()
+
+        self.skill_maps[skill] = matches
+        return matches
+
+    def scores(self, job_words: set) -> List[int]:
+        counts = [0] * len(self.candidate_ids)
+        for word in job_words:
+            for slot in self.postings.get(word, ()):
+                counts[slot] += 1
+
+        word_count = len(job_words)
+        lengths = self.lengths
+        return [heuristic_score(counts[i], word_count, lengths[i]) for i in range(len(counts))]
+
+
+class ResumeFeatureStore:
+    def __init__(self, max_jobs: int = MAX_FEATURE_JOBS):
+        self.max_jobs = max_jobs
+        self._lock = threading.Lock()
+        self._jobs = OrderedDict()       # job_id -> JobFeatures (LRU)
+        self.rebuilt = 0
+
+    def _job(self, job_id: str) -> JobFeatures:
+        features = self._jobs.get(job_id)
+        if features is None:
+            features = self._jobs[job_id] = JobFeatures()
+            while len(self._jobs) > self.max_jobs:
+                self._jobs.popitem(last=False)
+        self._jobs.move_to_end(job_id)
+        return features
+
+    def add(self, job_id: str, candidate_id: str, text: str):
+        with self._lock:
+            self._job(job_id).add(candidate_id, text)
+
+    def rescore(
+        self,
+        job_id: str,
+        candidate_ids: List[str],
+        role: str,
+        required_skills: List[str],
+        text_of
+    ) -> Dict[str, dict]:
+        """
+        candidate_id -> {"score", "skills"} for new criteria.
+        text_of(candidate_id) fills in resumes whose features
+        were evicted (or never cached); those without a stored
+        text are left out.
+        """
+        with self._lock:
+            features = self._job(job_id)
+
+            for candidate_id in candidate_ids:
+                if candidate_id not in features.slots:
+                    text = text_of(candidate_id)
+                    if text is not None:
+                        features.add(candidate_id, text)
+                        self.rebuilt += 1
+
+            job_words = set(job_description(role, required_skills).lower().split())
+            scores = features.scores(job_words)
+            skill_maps = [(skill, features.skill_map(skill, text_of)) for skill in required_skills]
+
+            result = {}
+            for candidate_id in candidate_ids:
+                slot = features.slots.get(candidate_id)
+                if slot is None:
+                    continue
+                result[candidate_id] = {
+                    "score": scores[slot],
+                    "skills": [skill for skill, matches in skill_maps if matches[slot]]
+                }
+            return result
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "jobs": len(self._jobs),
+                "resumes": sum(len(f.candidate_ids) for f in self._jobs.values()),
+                "tokens": sum(len(f.postings) for f in self._jobs.values()),
+                "rebuilt": self.rebuilt
+            }
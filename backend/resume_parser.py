@@ -1,25 +1,188 @@
-import pdfplumber
-from docx import Document
+import os
+import re
+import zipfile
+from xml.etree.ElementTree import iterparse
+
+# PDF libraries are imported on first use (see preload_pdf_engines)
+
+# -------------------------------------------------
+# PDF engine
+# -------------------------------------------------
+# "auto"       = pdfium text extraction, pdfplumber when the output looks degenerate
+# "pdfium"     = pdfium only
+# "pdfplumber" = pdfplumber only (layout analysis, slow)
+PDF_ENGINE = os.getenv("PDF_ENGINE", "auto")
+PDF_MIN_WORDS_PER_PAGE = int(os.getenv("PDF_MIN_WORDS_PER_PAGE", "20"))
+PDF_MAX_GARBLED_RATIO = float(os.getenv("PDF_MAX_GARBLED_RATIO", "0.05"))
+
+# Unmapped glyphs: replacement char, (cid:N) markers, control
+# chars and private-use code points from broken font encodings
+GARBLED_RE = re.compile(r"\ufffd|\(cid:\d+\)|[\x00-\x08\x0b\x0c\x0e-\x1f]|[\ue000-\uf8ff]")
+
+# WordprocessingML tags
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+W_BODY = W_NS + "body"
+W_P = W_NS + "p"
+W_PPR = W_NS + "pPr"
+W_T = W_NS + "t"
+W_TAB = W_NS + "tab"
+W_BREAKS = (W_NS + "br", W_NS + "cr")
+# Text boxes are stored twice (DrawingML + a VML fallback copy)
+MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+def preload_pdf_engines():
+    import pdfplumber
+    import pypdfium2
+
+
+def parse_pdf_pdfplumber(file_path: str) -> str:
+    import pdfplumber
 
-def parse_pdf(file_path: str) -> str:
     text = ""
     with pdfplumber.open(file_path) as pdf:
         for page in pdf.pages:
-            if page.extract_text():
-                text += page.extract_text() + "\n"
+            page_text = page.extract_text()
+            if page_text:
+                text += page_text + "\n"
     return text.strip()
 
 
+def parse_pdf_pdfium(file_path: str) -> tuple:
+    """
+    Text-only extraction (no layout analysis); returns (text, pages)
+    """
+    import pypdfium2
+
+    pdf = pypdfium2.PdfDocument(file_path)
+    try:
+        pages = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            pages.append(textpage.get_text_range().replace("\r\n", "\n").strip())
+            textpage.close()
+            page.close()
+        return "\n".join(p for p in pages if p).strip(), len(pages)
+    finally:
+        pdf.close()
+
+
+def degenerate_reason(text: str, pages: int) -> str | None:
+    """
+    Why fast-path output should not be trusted, if it should not
+    """
+    if not text:
+        return "empty"
+    if len(GARBLED_RE.findall(text)) / len(text) > PDF_MAX_GARBLED_RATIO:
+        return "garbled"
+    if len(text.split()) / max(pages, 1) < PDF_MIN_WORDS_PER_PAGE:
+        return "sparse"
+    return None
+
+
+def parse_pdf_with_engine(file_path: str) -> tuple:
+    """
+    Returns (text, engine); engine is "pdfium", "pdfplumber" or
+    "pdfplumber:<reason>" when auto mode fell back
+    """
+    if PDF_ENGINE == "pdfplumber":
+        return parse_pdf_pdfplumber(file_path), "pdfplumber"
+
+    import pypdfium2
+
+    try:
+        text, pages = parse_pdf_pdfium(file_path)
+        reason = degenerate_reason(text, pages)
+    except pypdfium2.PdfiumError:
+        if PDF_ENGINE == "pdfium":
+            raise
+        text, reason = "", "error"
+
+    if PDF_ENGINE == "pdfium" or reason is None:
+        return text, "pdfium"
+
+    fallback = parse_pdf_pdfplumber(file_path)
+
+    # Keep the fast output if pdfplumber does no better (e.g. a scan)
+    if len(fallback.split()) <= len(text.split()) and reason != "garbled":
+        return text, "pdfium"
+
+    return fallback, f"pdfplumber:{reason}"
+
+
+def parse_pdf(file_path: str) -> str:
+    return parse_pdf_with_engine(file_path)[0]
+
+
+def iter_docx_paragraphs(file_path: str):
+    """
+    Streams word/document.xml and yields the text of every
+    paragraph in document order: body paragraphs, table cells
+    and text boxes (a text box's paragraphs come right before
+    the paragraph that anchors it). Only the current top-level
+    block is kept in memory.
+    """
+    with zipfile.ZipFile(file_path) as docx, docx.open("word/document.xml") as xml:
+        paragraphs = []      # open paragraphs (text boxes nest inside them)
+        depth = 0
+        body_depth = None
+        body = None
+        in_ppr = 0           # tab stops in paragraph properties are not text
+        in_fallback = 0
+
+        for event, elem in iterparse(xml, events=("start", "end")):
+            tag = elem.tag
+
+            if event == "start":
+                depth += 1
+                if tag == W_P:
+                    paragraphs.append([])
+                elif tag == W_PPR:
+                    in_ppr += 1
+                elif tag == MC_FALLBACK:
+                    in_fallback += 1
+                elif tag == W_BODY:
+                    body, body_depth = elem, depth
+                continue
+
+            if paragraphs:
+                if tag == W_T:
+                    paragraphs[-1].append(elem.text or "")
+                elif tag == W_TAB and not in_ppr:
+                    paragraphs[-1].append("\t")
+                elif tag in W_BREAKS:
+                    paragraphs[-1].append("\n")
+
+            if tag == W_P:
+                text = "".join(paragraphs.pop())
+                if not in_fallback:
+                    yield text
+            elif tag == W_PPR:
+                in_ppr -= 1
+            elif tag == MC_FALLBACK:
+                in_fallback -= 1
+
+            # Drop each finished top-level block (paragraph / table)
+            if body_depth is not None and depth == body_depth + 1:
+                body.clear()
+            depth -= 1
+
+
 def parse_docx(file_path: str) -> str:
-    doc = Document(file_path)
-    text = "\n".join([para.text for para in doc.paragraphs])
+    text = "\n".join(iter_docx_paragraphs(file_path))
     return text.strip()
 
 
-def parse_resume(file_path: str) -> str:
+def parse_resume_with_engine(file_path: str) -> tuple:
+    """
+    Returns (text, engine used)
+    """
     if file_path.endswith(".pdf"):
-        return parse_pdf(file_path)
+        return parse_pdf_with_engine(file_path)
     elif file_path.endswith(".docx"):
-        return parse_docx(file_path)
+        return parse_docx(file_path), "docx-stream"
     else:
         raise ValueError("Unsupported file format")
+
+
+def parse_resume(file_path: str) -> str:
+    return parse_resume_with_engine(file_path)[0]
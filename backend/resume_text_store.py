@@ -0,0 +1,105 @@
+import os
+import json
+import mmap
+import zlib
+import threading
+
+STATE_DIR = os.getenv("STATE_DIR", "state")
+COMPRESSION_LEVEL = 6
+
+
+class ResumeTextStore:
+    """
+    Resume text keyed by candidate_id.
+
+    Texts are zlib-compressed and appended to a single data file;
+    only the (offset, length) index stays in memory. Reads go
+    through a memory map and decompress on access.
+
+    The index is journaled next to the data file and replayed on
+    start, so texts survive a restart along with the spilled jobs.
+    """
+
+    def __init__(self, state_dir: str = STATE_DIR):
+        os.makedirs(state_dir, exist_ok=True)
+        self.path = os.path.join(state_dir, "resume_texts.dat")
+        self.index_path = os.path.join(state_dir, "resume_texts.idx")
+
+        self._map = None
+        self._size = 0
+        self._index = {}          # candidate_id -> (offset, length)
+        self._raw_bytes = 0
+        self._lock = threading.Lock()
+
+        self._load_index()
+        self._file = open(self.path, "r+b" if os.path.exists(self.path) else "w+b")
+        # Drops text written after the last journaled entry (crash
+        # between the data write and the index write)
+        self._file.truncate(self._size)
+        self._journal = open(self.index_path, "a", encoding="utf-8")
+
+    def _load_index(self):
+        if not os.path.exists(self.index_path):
+            return
+
+        data_size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+
+        with open(self.index_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    candidate_id, offset, length, raw_length = json.loads(line)
+                except ValueError:
+                    # Torn last line after a crash
+                    continue
+                if offset + length > data_size:
+                    continue
+                self._index[candidate_id] = (offset, length)
+                self._size = max(self._size, offset + length)
+                self._raw_bytes += raw_length
+
+    def put(self, candidate_id: str, text: str):
+        raw = text.encode("utf-8")
+        data = zlib.compress(raw, COMPRESSION_LEVEL)
+
+        with self._lock:
+            self._file.seek(self._size)
+            self._file.write(data)
+            self._file.flush()
+
+            # Data first, then the index entry pointing at it
+            self._journal.write(json.dumps([candidate_id, self._size, len(data), len(raw)]) + "\n")
+            self._journal.flush()
+
+            self._index[candidate_id] = (self._size, len(data))
+            self._size += len(data)
+            self._raw_bytes += len(raw)
+
+    def get(self, candidate_id: str) -> str | None:
+        with self._lock:
+            entry = self._index.get(candidate_id)
+            if entry is None:
+                return None
+
+            offset, length = entry
+
+            # Re-map once the file has grown past the current view
+            if self._map is None or offset + length > len(self._map):
+                if self._map is not None:
+                    self._map.close()
+                self._map = mmap.mmap(self._file.fileno(), self._size, access=mmap.ACCESS_READ)
+
+            data = self._map[offset:offset + length]
+
+        return zlib.decompress(data).decode("utf-8")
+
+    def __contains__(self, candidate_id: str) -> bool:
+        return candidate_id in self._index
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "texts": len(self._index),
+                "raw_bytes": self._raw_bytes,
+                "compressed_bytes": self._size,
+                "compression_ratio": round(self._raw_bytes / self._size, 2) if self._size else None
+            }
@@ -0,0 +1,253 @@
+import os
+import time
+import random
+import threading
+from collections import OrderedDict
+
+from backend.integrations import CandidateStore, candidate_store
+from backend.tracing import span
+
+# -------------------------------------------------
+# Environment
+# -------------------------------------------------
+# Sheets API write quota per minute (per user / project)
+SHEETS_WRITES_PER_MINUTE = int(os.getenv("SHEETS_WRITES_PER_MINUTE", "60"))
+SHEETS_FLUSH_INTERVAL_SECONDS = float(os.getenv("SHEETS_FLUSH_INTERVAL_SECONDS", "2"))
+SHEETS_MAX_BATCH = int(os.getenv("SHEETS_MAX_BATCH", "500"))
+SHEETS_SHUTDOWN_TIMEOUT_SECONDS = float(os.getenv("SHEETS_SHUTDOWN_TIMEOUT_SECONDS", "30"))
+
+MAX_BACKOFF_SECONDS = 64
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+def _status_code(error: Exception) -> int | None:
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+
+class SheetsWriteQueue:
+    """
+    Write-behind queue in front of the candidate store
+    (Google Sheets, see backend/integrations.py).
+
+    Requests only enqueue. Pending writes are coalesced per
+    candidate (an update to a row that is not appended yet is
+    merged into the append) and flushed in batches: one
+    append_rows call plus one batch update per flush, paced to
+    stay under SHEETS_WRITES_PER_MINUTE. Quota (429) and 5xx
+    errors put the batch back and back off exponentially.
+    """
+
+    def __init__(
+        self,
+        writes_per_minute: int = SHEETS_WRITES_PER_MINUTE,
+        flush_interval: float = SHEETS_FLUSH_INTERVAL_SECONDS,
+        max_batch: int = SHEETS_MAX_BATCH,
+        store: CandidateStore | None = None
+    ):
+        self.store = store or candidate_store
+        self.min_call_interval = 60 / writes_per_minute
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+
+        self._lock = threading.Lock()
+        self._appends = OrderedDict()      # candidate_id -> row
+        self._updates = OrderedDict()      # candidate_id -> {column: value}
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+        self._last_call = 0.0
+        self._backoff = 0.0
+
+        self.enqueued = 0
+        self.coalesced = 0
+        self.flushes = 0
+        self.api_calls = 0
+        self.rows_appended = 0
+        self.rows_updated = 0
+        self.throttled = 0
+        self.dropped = 0
+
+    # -------------------------------------------------
+    # Enqueue (request path)
+    # -------------------------------------------------
+    def append(self, row: dict):
+        candidate_id = row["candidate_id"]
+
+        with self._lock:
+            self.enqueued += 1
+            if candidate_id in self._appends:
+                self._appends[candidate_id].update(row)
+                self.coalesced += 1
+            else:
+                self._appends[candidate_id] = dict(row)
+
+    def update(self, candidate_id: str, updates: dict):
+        with self._lock:
+            self.enqueued += 1
+            if candidate_id in self._appends:
+                self._appends[candidate_id].update(updates)
+                self.coalesced += 1
+            elif candidate_id in self._updates:
+                self._updates[candidate_id].update(updates)
+                self.coalesced += 1
+            else:
+                self._updates[candidate_id] = dict(updates)
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._appends) + len(self._updates)
+
+    # -------------------------------------------------
+    # Flush
+    # -------------------------------------------------
+    def _take(self, pending: OrderedDict) -> OrderedDict:
+        batch = OrderedDict()
+        while pending and len(batch) < self.max_batch:
+            candidate_id, value = pending.popitem(last=False)
+            batch[candidate_id] = value
+        return batch
+
+    def _requeue(self, pending: OrderedDict, batch: OrderedDict):
+        """
+        Puts a failed batch back in front; anything enqueued
+        meanwhile is newer and wins
+        """
+        with self._lock:
+            for candidate_id, value in batch.items():
+                if candidate_id in pending:
+                    value.update(pending[candidate_id])
+                pending[candidate_id] = value
+                pending.move_to_end(candidate_id, last=False)
+
+    def _pace(self):
+        wait = self._last_call + self.min_call_interval - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self._last_call = time.monotonic()
+        self.api_calls += 1
+
+    def _call(self, pending: OrderedDict, batch: OrderedDict, write, op: str) -> bool:
+        try:
+            self._pace()
+            with span("sheet_flush", op=op, rows=len(batch)):
+                write(batch)
+        except Exception as e:
+            status = _status_code(e)
+
+            if status in RETRYABLE_STATUS:
+                self.throttled += int(status == 429)
+                self._backoff = min(max(self._backoff * 2, 1), MAX_BACKOFF_SECONDS)
+                print(f"⚠️ Sheets write failed ({status}), retrying in ~{self._backoff:.0f}s")
+                self._requeue(pending, batch)
+                return False
+
+            print("❌ Sheets write error, dropping batch:", e)
+            self.dropped += len(batch)
+            return True
+
+        self._backoff = 0.0
+        return True
+
+    def _write_appends(self, batch: OrderedDict):
+        self.store.append_candidates(list(batch.values()))
+        self.rows_appended += len(batch)
+
+    def _write_updates(self, batch: OrderedDict):
+        missing = self.store.update_candidates(batch)
+        if missing:
+            print(f"⚠️ Candidates not found in Google Sheet: {', '.join(missing)}")
+            self.dropped += len(missing)
+        self.rows_updated += len(batch) - len(missing)
+
+    def flush(self) -> bool:
+        """
+        Writes one batch of appends, then one batch of updates
+        (appended rows must exist before they can be updated).
+        Returns False when the batch was put back for retry.
+        """
+        with self._lock:
+            appends = self._take(self._appends)
+
+        if appends and not self._call(self._appends, appends, self._write_appends, "append"):
+            return False
+
+        with self._lock:
+            updates = self._take(self._updates)
+
+        if updates and not self._call(self._updates, updates, self._write_updates, "update"):
+            return False
+
+        if appends or updates:
+            self.flushes += 1
+        return True
+
+    # -------------------------------------------------
+    # Background writer
+    # -------------------------------------------------
+    def _sleep(self) -> bool:
+        """
+        Waits for the next flush; True once stop was requested
+        """
+        if self._backoff:
+            delay = self._backoff * random.uniform(0.5, 1.0)
+            return self._stop.wait(delay)
+        self._wake.wait(self.flush_interval)
+        self._wake.clear()
+        return self._stop.is_set()
+
+    def _run(self):
+        while not self._sleep():
+            try:
+                self.flush()
+            except Exception as e:
+                print("❌ Sheets queue error:", e)
+
+        self._drain()
+
+    def _drain(self):
+        deadline = time.monotonic() + SHEETS_SHUTDOWN_TIMEOUT_SECONDS
+
+        while self.pending() and time.monotonic() < deadline:
+            if not self.flush():
+                time.sleep(min(self._backoff, max(deadline - time.monotonic(), 0)))
+
+        if self.pending():
+            print(f"❌ Sheets queue shut down with {self.pending()} unwritten candidates")
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="sheets-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """
+        Flushes everything still pending (flush-on-shutdown)
+        """
+        if self._thread is not None:
+            self._stop.set()
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+        else:
+            self._drain()
+
+    def stats(self) -> dict:
+        with self._lock:
+            pending_appends = len(self._appends)
+            pending_updates = len(self._updates)
+        return {
+            "pending_appends": pending_appends,
+            "pending_updates": pending_updates,
+            "enqueued": self.enqueued,
+            "coalesced": self.coalesced,
+            "flushes": self.flushes,
+            "api_calls": self.api_calls,
+            "rows_appended": self.rows_appended,
+            "rows_updated": self.rows_updated,
+            "throttled": self.throttled,
+            "dropped": self.dropped,
+            "backoff_seconds": self._backoff
+        }
@@ -0,0 +1,200 @@
+import os
+import re
+import math
+import time
+import zlib
+import hashlib
+import threading
+from functools import lru_cache
+from typing import Dict, List
+
+# -------------------------------------------------
+# "Similar candidates": resume vectors + ANN search
+# -------------------------------------------------
+# Each resume text becomes a hashing-trick TF-IDF vector,
+# reduced by sign random projection to a SIMILARITY_BITS bit
+# signature (SimHash). The Hamming distance between two
+# signatures estimates the angle between the TF-IDF vectors.
+# Signatures are bucketed by bands (LSH) so a query only
+# compares against resumes sharing at least one band.
+
+SIMILARITY_BITS = int(os.getenv("SIMILARITY_BITS", "256"))
+SIMILARITY_BANDS = int(os.getenv("SIMILARITY_BANDS", "32"))
+HASH_FEATURES = 2 ** 18
+MAX_SIMILAR_K = 100
+
+# Projection sums run in one big int with a 32-bit lane per
+# output bit; weights are fixed-point with this scale
+LANE_BYTES = 4
+WEIGHT_SCALE = 64
+
+TOKEN_RE = re.compile(r"[a-z][a-z0-9+#]+")
+
+
+# byte -> its 8 bits spread over 8 little-endian lanes
+_SPREAD = [
+    b"".join((byte >> bit & 1).to_bytes(LANE_BYTES, "little") for bit in range(8))
+    for byte in range(256)
+]
+
+
+@lru_cache(maxsize=8192)
+def _projection_row(feature: int) -> int:
+    """
+    Random ±1 projection row for a hashed feature, derived from
+    the feature id: lane i is 1 where the row is +1, else 0
+    """
+    digest = hashlib.blake2b(
+        feature.to_bytes(4, "little"), digest_size=SIMILARITY_BITS // 8
+    ).digest()
+    return int.from_bytes(b"".join(_SPREAD[byte] for byte in digest), "little")
+
+
+def term_frequencies(text: str) -> Dict[int, int]:
+    counts = {}
+    for token in TOKEN_RE.findall(text.lower()):
+        feature = zlib.crc32(token.encode()) % HASH_FEATURES
+        counts[feature] = counts.get(feature, 0) + 1
+    return counts
+
+
+class SimilarityIndex:
+    def __init__(self, bits: int = SIMILARITY_BITS, bands: int = SIMILARITY_BANDS):
+        if bits % bands:
+            raise ValueError("SIMILARITY_BITS must be a multiple of SIMILARITY_BANDS")
+
+        self.bits = bits
+        self.bands = bands
+        self.band_bits = bits // bands
+        self._band_mask = (1 << self.band_bits) - 1
+
+        self._lock = threading.Lock()
+        self._doc_ids: Dict[str, int] = {}          # candidate_id -> doc id
+        self._candidate_ids: List[str] = []         # doc id -> candidate_id
+        self._signatures: List[int] = []            # doc id -> signature
+        self._buckets: Dict[tuple, list] = {}       # (band, value) -> doc ids
+        self._df: Dict[int, int] = {}               # feature -> document frequency
+
+    # -------------------------------------------------
+    # Vectors
+    # -------------------------------------------------
+    def _signature(self, counts: Dict[int, int], n_docs: int) -> int:
+        """
+        Sign of the projected TF-IDF vector per output bit.
+        IDF uses the document frequencies seen so far.
+        """
+        positive = 0      # per lane: sum of weights projected to +1
+        total = 0
+
+        for feature, count in counts.items():
+            weight = round(WEIGHT_SCALE * (1 + math.log(count)) * (
+                math.log((n_docs + 1) / (self._df.get(feature, 0) + 1)) + 1
+            ))
+            positive += weight * _projection_row(feature)
+            total += weight
+
+        # projection_i = positive_i - (total - positive_i)
+        raw = positive.to_bytes(self.bits * LANE_BYTES, "little")
+        signature = 0
+        for i in range(self.bits):
+            value = int.from_bytes(raw[i * LANE_BYTES:(i + 1) * LANE_BYTES], "little")
+            if 2 * value > total:
+                signature |= 1 << i
+        return signature
+
+    def _bands(self, signature: int):
+        for band in range(self.bands):
+            yield band, (signature >> (band * self.band_bits)) & self._band_mask
+
+    def _similarity(self, distance: int) -> float:
+        # Estimated cosine of the TF-IDF vectors
+        return math.cos(math.pi * distance / self.bits)
+
+    # -------------------------------------------------
+    # Indexing
+    # -------------------------------------------------
+    def add(self, candidate_id: str, text: str):
+        counts = term_frequencies(text)
+
+        with self._lock:
+            if candidate_id in self._doc_ids:
+                return
+            for feature in counts:
+                self._df[feature] = self._df.get(feature, 0) + 1
+            n_docs = len(self._candidate_ids) + 1
+
+        signature = self._signature(counts, n_docs)
+
+        with self._lock:
+            if candidate_id in self._doc_ids:
+                return
+
+            doc_id = len(self._candidate_ids)
+            self._doc_ids[candidate_id] = doc_id
+            self._candidate_ids.append(candidate_id)
+            self._signatures.append(signature)
+
+            for key in self._bands(signature):
+                self._buckets.setdefault(key, []).append(doc_id)
+
+    def __contains__(self, candidate_id: str) -> bool:
+        return candidate_id in self._doc_ids
+
+    # -------------------------------------------------
+    # Search
+    # -------------------------------------------------
+    def similar(self, candidate_id: str, k: int = 10) -> dict:
+        """
+        k nearest resumes to a candidate's resume; falls back to
+        a full scan when the LSH buckets hold fewer than k
+        """
+        started = time.perf_counter()
+        k = max(1, min(k, MAX_SIMILAR_K))
+
+        with self._lock:
+            doc_id = self._doc_ids.get(candidate_id)
+            if doc_id is None:
+                raise KeyError(candidate_id)
+
+            query = self._signatures[doc_id]
+            candidates = set()
+            for key in self._bands(query):
+                candidates.update(self._buckets.get(key, ()))
+            candidates.discard(doc_id)
+
+            exhaustive = len(candidates) < k
+            if exhaustive:
+                candidates = [d for d in range(len(self._signatures)) if d != doc_id]
+
+            signatures = self._signatures
+            scored = sorted(
+                ((signatures[d] ^ query).bit_count(), d)
+                for d in candidates
+            )[:k]
+
+            results = [
+                {
+                    "candidate_id": self._candidate_ids[d],
+                    "similarity": round(self._similarity(distance), 3)
+                }
+                for distance, d in scored
+            ]
+
+        return {
+            "candidate_id": candidate_id,
+            "k": k,
+            "compared": len(candidates),
+            "exhaustive": exhaustive,
+            "took_ms": round((time.perf_counter() - started) * 1000, 2),
+            "results": results
+        }
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "resumes": len(self._signatures),
+                "bits": self.bits,
+                "bands": self.bands,
+                "buckets": len(self._buckets),
+                "features": len(self._df)
+            }
@@ -0,0 +1,329 @@
+import os
+import sys
+import gzip
+import json
+import time
+import threading
+from contextlib import contextmanager
+from collections import OrderedDict
+from collections.abc import MutableMapping
+
+from backend.candidate_model import Candidate, to_candidates
+
+# -------------------------------------------------
+# Environment
+# -------------------------------------------------
+STATE_DIR = os.getenv("STATE_DIR", "state")
+MAX_HOT_JOBS = int(os.getenv("MAX_HOT_JOBS", "50"))
+JOB_IDLE_TTL_SECONDS = int(os.getenv("JOB_IDLE_TTL_SECONDS", "3600"))
+
+SWEEP_INTERVAL_SECONDS = 30
+
+
+def deep_sizeof(obj) -> int:
+    """
+    Approximate resident size of nested dict / list / str data
+    """
+    seen = set()
+    stack = [obj]
+    total = 0
+
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, Candidate):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set)):
+            stack.extend(item)
+
+    return total
+
+
+def _encode(obj):
+    if isinstance(obj, Candidate):
+        return obj.as_dict()
+    raise TypeError(f"{type(obj).__name__} is not JSON serializable")
+
+
+class JobStore(MutableMapping):
+    """
+    Memory-bounded job cache, used as `screening_db`.
+
+    Recent jobs, jobs held by a request (hold()) and jobs with a
+    running interview stay in memory. Idle jobs
+    (JOB_IDLE_TTL_SECONDS) and least recently used ones beyond
+    MAX_HOT_JOBS are spilled to gzip'd JSON under STATE_DIR and
+    loaded back transparently on access.
+
+    Spill files outlive the process: close() spills every job on
+    shutdown and the next start picks them up again, together
+    with their resume texts (ResumeTextStore).
+
+    Each job can carry a sidecar dict (internal per-job state that
+    is not part of the API response) which is spilled with it.
+    """
+
+    def __init__(
+        self,
+        state_dir: str = STATE_DIR,
+        max_hot_jobs: int = MAX_HOT_JOBS,
+        idle_ttl: int = JOB_IDLE_TTL_SECONDS,
+        is_pinned=None,
+        on_delete=None
+    ):
+        self.spill_dir = os.path.join(state_dir, "jobs")
+        self.max_hot_jobs = max_hot_jobs
+        self.idle_ttl = idle_ttl
+        self.is_pinned = is_pinned or (lambda job: False)
+        # job_id -> None (e.g. dropping cached views)
+        self.on_delete = on_delete or (lambda job_id: None)
+        os.makedirs(self.spill_dir, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._hot = OrderedDict()        # job_id -> job (LRU order)
+        self._sidecars = {}              # job_id -> dict
+        self._last_access = {}           # job_id -> monotonic time
+        self._cold = set()               # spilled job_ids
+        self._holds = {}                 # job_id -> requests using it
+        self._candidate_jobs = {}        # candidate_id -> job_id
+        self._last_sweep = time.monotonic()
+
+        self.evictions = 0
+        self.reloads = 0
+
+        self._load_spilled()
+
+    # -------------------------------------------------
+    # Spill / reload
+    # -------------------------------------------------
+    def _path(self, job_id: str) -> str:
+        return os.path.join(self.spill_dir, f"{job_id}.json.gz")
+
+    def _load_spilled(self):
+        """
+        Jobs spilled by a previous process start out cold
+        """
+        for name in os.listdir(self.spill_dir):
+            path = os.path.join(self.spill_dir, name)
+            if name.endswith(".tmp"):
+                os.remove(path)
+                continue
+            if not name.endswith(".json.gz"):
+                continue
+
+            job_id = name[:-len(".json.gz")]
+            try:
+                job = self._read(job_id)["job"]
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Skipping unreadable job file {name}:", e)
+                continue
+
+            self._cold.add(job_id)
+            self.index_candidates(job)
+
+    def _spill(self, job_id: str):
+        job = self._hot.pop(job_id)
+        sidecar = self._sidecars.pop(job_id, {})
+        self._last_access.pop(job_id, None)
+
+        path = self._path(job_id)
+        with gzip.open(path + ".tmp", "wt", encoding="utf-8", compresslevel=6) as f:
+            json.dump({"job": job, "sidecar": sidecar}, f, separators=(",", ":"), default=_encode)
+        os.replace(path + ".tmp", path)
+
+        self._cold.add(job_id)
+        self.evictions += 1
+
+    def _read(self, job_id: str) -> dict:
+        with gzip.open(self._path(job_id), "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        # Callers only ever see slotted candidates
+        data["job"]["candidates"] = to_candidates(data["job"]["candidates"])
+        return data
+
+    def _reload(self, job_id: str):
+        data = self._read(job_id)
+        self._cold.discard(job_id)
+        os.remove(self._path(job_id))
+
+        self._hot[job_id] = data["job"]
+        self._sidecars[job_id] = data["sidecar"]
+        self.reloads += 1
+
+    def _touch(self, job_id: str):
+        self._hot.move_to_end(job_id)
+        self._last_access[job_id] = time.monotonic()
+
+    def _spillable(self, job_id: str) -> bool:
+        # A spilled job is a copy: whoever still holds the live
+        # dict would keep writing to a detached object
+        return job_id not in self._holds and not self.is_pinned(self._hot[job_id])
+
+    def _evict(self):
+        now = time.monotonic()
+
+        if now - self._last_sweep >= SWEEP_INTERVAL_SECONDS:
+            self._last_sweep = now
+            for job_id in list(self._hot):
+                idle = now - self._last_access.get(job_id, now)
+                if idle > self.idle_ttl and self._spillable(job_id):
+                    self._spill(job_id)
+
+        if len(self._hot) > self.max_hot_jobs:
+            for job_id in list(self._hot):
+                if len(self._hot) <= self.max_hot_jobs:
+                    break
+                if self._spillable(job_id):
+                    self._spill(job_id)
+
+    # -------------------------------------------------
+    # Mapping interface
+    # -------------------------------------------------
+    def __getitem__(self, job_id: str) -> dict:
+        with self._lock:
+            if job_id in self._cold:
+                self._reload(job_id)
+            job = self._hot[job_id]
+            self._touch(job_id)
+            self._evict()
+            return job
+
+    def __setitem__(self, job_id: str, job: dict):
+        with self._lock:
+            if job_id in self._cold:
+                self._reload(job_id)
+            job["candidates"] = to_candidates(job["candidates"])
+            self._hot[job_id] = job
+            self._sidecars.setdefault(job_id, {})
+            self.index_candidates(job)
+            self._touch(job_id)
+            self._evict()
+
+    def __delitem__(self, job_id: str):
+        with self._lock:
+            if job_id in self._cold:
+                self._reload(job_id)
+            job = self._hot.pop(job_id)
+            self._sidecars.pop(job_id, None)
+            self._last_access.pop(job_id, None)
+            for c in job["candidates"]:
+                self._candidate_jobs.pop(c["candidate_id"], None)
+        self.on_delete(job_id)
+
+    def __contains__(self, job_id) -> bool:
+        return job_id in self._hot or job_id in self._cold
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._hot) + list(self._cold))
+
+    def __len__(self) -> int:
+        return len(self._hot) + len(self._cold)
+
+    def values(self):
+        """
+        All jobs; spilled ones are read for the caller without
+        being promoted back into memory
+        """
+        with self._lock:
+            hot = list(self._hot.values())
+            cold = list(self._cold)
+
+        yield from hot
+        for job_id in cold:
+            job = self.peek(job_id)
+            if job is not None:
+                yield job
+
+    def peek(self, job_id: str) -> dict | None:
+        """
+        The job (None if it does not exist); a spilled one is
+        read for the caller without being promoted into memory
+        """
+        with self._lock:
+            if job_id in self._hot:
+                return self._hot[job_id]
+            if job_id in self._cold:
+                return self._read(job_id)["job"]
+            return None
+
+    # -------------------------------------------------
+    # Helpers
+    # -------------------------------------------------
+    @contextmanager
+    def hold(self, job_id: str):
+        """
+        Keeps the job in memory while the caller works on it
+        (it may not exist yet, or be cold until first accessed)
+        """
+        with self._lock:
+            self._holds[job_id] = self._holds.get(job_id, 0) + 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._holds[job_id] -= 1
+                if not self._holds[job_id]:
+                    del self._holds[job_id]
+
+    def close(self):
+        """
+        Spills every job, so the next start reloads them
+        """
+        with self._lock:
+            for job_id in list(self._hot):
+                self._spill(job_id)
+
+    def sidecar(self, job_id: str) -> dict:
+        """
+        Per-job internal state; may be created before the
+        job itself is stored
+        """
+        with self._lock:
+            if job_id in self._cold:
+                self._reload(job_id)
+            return self._sidecars.setdefault(job_id, {})
+
+    def discard_sidecar(self, job_id: str):
+        """
+        Drops the sidecar of a job that was never stored
+        (its screening failed)
+        """
+        with self._lock:
+            if job_id not in self._hot and job_id not in self._cold:
+                self._sidecars.pop(job_id, None)
+
+    def index_candidates(self, job: dict):
+        with self._lock:
+            for c in job["candidates"]:
+                self._candidate_jobs[c["candidate_id"]] = job["job_id"]
+
+    def job_id_for_candidate(self, candidate_id: str) -> str | None:
+        return self._candidate_jobs.get(candidate_id)
+
+    def stats(self) -> dict:
+        with self._lock:
+            hot_bytes = deep_sizeof(list(self._hot.values())) + deep_sizeof(list(self._sidecars.values()))
+            disk_bytes = sum(
+                os.path.getsize(self._path(job_id)) for job_id in self._cold
+            )
+            return {
+                "hot_jobs": len(self._hot),
+                "cold_jobs": len(self._cold),
+                "held_jobs": len(self._holds),
+                "hot_candidates": sum(len(j["candidates"]) for j in self._hot.values()),
+                "indexed_candidates": len(self._candidate_jobs),
+                "hot_bytes": hot_bytes,
+                "disk_bytes": disk_bytes,
+                "evictions": self.evictions,
+                "reloads": self.reloads,
+                "max_hot_jobs": self.max_hot_jobs,
+                "idle_ttl_seconds": self.idle_ttl
+            }
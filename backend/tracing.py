@@ -0,0 +1,136 @@
+import os
+import json
+import time
+import uuid
+import queue
+import atexit
+import logging
+import threading
+import contextvars
+from contextlib import contextmanager
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+
+# -------------------------------------------------
+# Environment (tracing is opt-in)
+# -------------------------------------------------
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "false").lower() == "true"
+TRACE_FILE = os.getenv("TRACE_FILE", "traces/spans.jsonl")
+TRACE_MAX_BYTES = int(os.getenv("TRACE_MAX_BYTES", str(20 * 1024 * 1024)))
+TRACE_BACKUP_COUNT = int(os.getenv("TRACE_BACKUP_COUNT", "5"))
+
+TRACE_HEADER = "X-Trace-Id"
+
+_current_span = contextvars.ContextVar("current_span", default=None)
+
+_logger = logging.getLogger("backend.tracing")
+_logger.propagate = False
+_listener = None
+_listener_lock = threading.Lock()
+
+
+def _start_writer():
+    """
+    Spans are handed to a queue and written to a rotating
+    JSON-lines file by a background thread, so request
+    handlers never wait on disk I/O.
+    """
+    global _listener
+
+    # Screening threads emit their first spans concurrently:
+    # only one of them may install the writer
+    with _listener_lock:
+        if _listener is None:
+            _listener = _open_writer()
+
+
+def _open_writer() -> QueueListener:
+    trace_dir = os.path.dirname(TRACE_FILE)
+    if trace_dir:
+        os.makedirs(trace_dir, exist_ok=True)
+
+    file_handler = RotatingFileHandler(
+        TRACE_FILE,
+        maxBytes=TRACE_MAX_BYTES,
+        backupCount=TRACE_BACKUP_COUNT,
+        encoding="utf-8"
+    )
+    file_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    span_queue = queue.SimpleQueue()
+    _logger.addHandler(QueueHandler(span_queue))
+    _logger.setLevel(logging.INFO)
+
+    listener = QueueListener(span_queue, file_handler)
+    listener.start()
+    atexit.register(stop_writer)
+    return listener
+
+
+def stop_writer():
+    """
+    Flush pending spans and stop the writer thread
+    """
+    global _listener
+
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+            for handler in list(_logger.handlers):
+                _logger.removeHandler(handler)
+            _listener = None
+
+
+def _emit(record: dict):
+    _start_writer()
+    _logger.info(json.dumps(record, default=str))
+
+
+def current_trace_id() -> str | None:
+    current = _current_span.get()
+    return current["trace_id"] if current else None
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """
+    Records a timed span nested under the current one.
+
+    Yields the span dict so callers can add attributes
+    while it is open:
+
+        with span("parse", file=name) as s:
+            text = parse_resume(path)
+            s["attributes"]["chars"] = len(text)
+    """
+    if not TRACING_ENABLED:
+        yield {"attributes": attributes}
+        return
+
+    parent = _current_span.get()
+
+    record = {
+        "trace_id": parent["trace_id"] if parent else uuid.uuid4().hex,
+        "span_id": uuid.uuid4().hex[:16],
+        "parent_id": parent["span_id"] if parent else None,
+        "name": name,
+        "start": time.time(),
+        "duration_ms": None,
+        "status": "ok",
+        "attributes": attributes
+    }
+
+    token = _current_span.set(record)
+    started = time.perf_counter()
+
+    try:
+        yield record
+    except BaseException as e:
+        record["status"] = "error"
+        record["attributes"]["error"] = repr(e)
+        raise
+    finally:
+        record["duration_ms"] = round((time.perf_counter() - started) * 1000, 3)
+        _current_span.reset(token)
+        _emit(record)
@@ -0,0 +1,55 @@
+import time
+import threading
+
+# -------------------------------------------------
+# Cold start: timings + background warm-up
+# -------------------------------------------------
+# main.py imports this module first, so "import" covers
+# loading the app's own modules.
+
+_started = time.perf_counter()
+_report = {
+    "import_seconds": None,
+    "ready_seconds": None,
+    "warmup": {}
+}
+_lock = threading.Lock()
+
+
+def mark(stage: str):
+    """
+    Records seconds since backend import started
+    """
+    _report[f"{stage}_seconds"] = round(time.perf_counter() - _started, 3)
+
+
+def _run(tasks: dict):
+    for name, task in tasks.items():
+        started = time.perf_counter()
+        try:
+            task()
+            result = {"seconds": round(time.perf_counter() - started, 3)}
+        except Exception as e:
+            result = {"error": str(e)}
+
+        with _lock:
+            _report["warmup"][name] = result
+
+    print(f"🔥 Warm-up done: {startup_report()}")
+
+
+def warm_up_in_background(tasks: dict):
+    """
+    Runs name -> callable tasks in a daemon thread so the
+    app serves requests while heavy modules / clients load
+    """
+    threading.Thread(target=_run, args=(tasks,), name="warm-up", daemon=True).start()
+
+
+def startup_report() -> dict:
+    with _lock:
+        return {
+            "import_seconds": _report["import_seconds"],
+            "ready_seconds": _report["ready_seconds"],
+            "warmup": dict(_report["warmup"])
+        }
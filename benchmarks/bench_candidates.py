@@ -0,0 +1,112 @@
+"""
+In-memory candidate representation: plain dicts vs the slotted
+Candidate in backend/candidate_model.py
+
+    python benchmarks/bench_candidates.py              # 100k candidates
+    python benchmarks/bench_candidates.py --count N
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.candidate_model import Candidate
+from backend.candidate_view import VIEW_COLUMNS
+
+SKILLS = ["Python", "FastAPI", "SQL", "Docker", "AWS", "React"]
+STAGES = ["RESUME_SHORTLISTED", "REJECTED", "FORM_SUBMITTED", "INTERVIEW_PASSED"]
+RECOMMENDATIONS = ["Strong Fit", "Moderate Fit", "Not Recommended"]
+CONFIDENCE = ["HIGH", "MEDIUM", "LOW"]
+
+
+def make_fields(rng: random.Random, i: int) -> dict:
+    # Like screen_resume_file + ranking; enum values are built at
+    # runtime (as after a reload from JSON), not shared literals
+    return {
+        "candidate_id": f"{i:08x}",
+        "name": f"Candidate {i}",
+        "email": f"candidate{i}@example.com",
+        "email_confidence": "".join(rng.choice(CONFIDENCE)),
+        "skills": ["".join(s) for s in rng.sample(SKILLS, rng.randint(1, 4))],
+        "experience_years": round(rng.uniform(0, 15), 1),
+        "score": rng.randint(0, 100),
+        "shortlisted": rng.random() < 0.2,
+        "resume_file": f"resume_{i}.pdf",
+        "parser_engine": "".join(rng.choice(["pdfium", "docx-stream"])),
+        "confidence": 0.8,
+        "interview_score": "",
+        "recommendation": "".join(rng.choice(RECOMMENDATIONS)),
+        "email_stage": "".join(rng.choice(STAGES)),
+        "personal_form_submitted": False,
+        "rank": i + 1,
+        "rank_score": rng.uniform(0, 120)
+    }
+
+
+def legacy_row(job: dict, c: dict) -> dict:
+    # Previous dashboard row builder (dict comprehension + fix-ups)
+    row = {col: c.get(col) for col in VIEW_COLUMNS}
+    row["job_id"] = job["job_id"]
+    row["role"] = job["role"]
+    row["skills"] = ", ".join(c.get("skills", []))
+    row["rank_score"] = round(c.get("rank_score", 0), 2)
+    row["final_selected"] = bool(c.get("final_selected", False))
+    return row
+
+
+def measure(build, count: int) -> dict:
+    rng = random.Random(7)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    candidates = [build(make_fields(rng, i)) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return {"bytes": after - before, "candidates": candidates}
+
+
+def timed(fn, items: list) -> float:
+    started = time.perf_counter()
+    for item in items:
+        fn(item)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    job = {"job_id": "bench", "role": "Backend Engineer"}
+
+    plain = measure(dict, args.count)
+    slotted = measure(Candidate, args.count)
+
+    row_plain = timed(lambda c: legacy_row(job, c), plain["candidates"])
+    row_slotted = timed(lambda c: c.row(job, VIEW_COLUMNS), slotted["candidates"])
+    json_plain = timed(json.dumps, plain["candidates"][:20_000])
+    json_slotted = timed(lambda c: json.dumps(c, default=Candidate.as_dict), slotted["candidates"][:20_000])
+
+    print(f"candidates: {args.count}")
+    print(f"{'model':<12}{'MB':>10}{'B/cand':>10}{'row us':>10}{'json us':>10}")
+    for name, result, row_s, json_s in (
+        ("dict", plain, row_plain, json_plain),
+        ("Candidate", slotted, row_slotted, json_slotted)
+    ):
+        print(
+            f"{name:<12}{result['bytes'] / 2 ** 20:>10.1f}"
+            f"{result['bytes'] / args.count:>10.0f}"
+            f"{row_s / args.count * 1e6:>10.2f}"
+            f"{json_s / min(args.count, 20_000) * 1e6:>10.2f}"
+        )
+    print(f"memory saved: {1 - slotted['bytes'] / plain['bytes']:.0%}")
+
+
+if __name__ == "__main__":
+    main()
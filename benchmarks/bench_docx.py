@@ -0,0 +1,127 @@
+"""
+DOCX text extraction: python-docx object model vs the
+streaming parser in backend/resume_parser.py
+
+    python benchmarks/bench_docx.py                  # generated corpus
+    python benchmarks/bench_docx.py --corpus DIR     # your .docx files
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from docx import Document
+
+from backend.resume_parser import parse_docx
+
+WORDS = (
+    "python fastapi sql docker aws kubernetes react backend api team built "
+    "designed led migrated engineer senior developer data pipeline cloud"
+).split()
+
+
+def legacy_parse_docx(file_path: str) -> str:
+    # Previous implementation (paragraphs only)
+    doc = Document(file_path)
+    text = "\n".join([para.text for para in doc.paragraphs])
+    return text.strip()
+
+
+def make_corpus(directory: str, count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    paths = []
+
+    for i in range(count):
+        doc = Document()
+        doc.add_paragraph(f"Candidate {i}")
+        doc.add_paragraph(f"candidate{i}@example.com")
+
+        for _ in range(rng.randint(20, 60)):
+            doc.add_paragraph(" ".join(rng.choices(WORDS, k=rng.randint(8, 30))))
+
+        table = doc.add_table(rows=rng.randint(3, 10), cols=3)
+        for row in table.rows:
+            for cell in row.cells:
+                cell.text = " ".join(rng.choices(WORDS, k=4))
+
+        path = os.path.join(directory, f"resume_{i}.docx")
+        doc.save(path)
+        paths.append(path)
+
+    return paths
+
+
+def measure(parse, paths: list) -> dict:
+    outputs = []
+
+    started = time.perf_counter()
+    for path in paths:
+        outputs.append(parse(path))
+    elapsed = time.perf_counter() - started
+
+    peak = 0
+    for path in paths[:20]:
+        tracemalloc.start()
+        parse(path)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    return {
+        "seconds": elapsed,
+        "per_file_ms": elapsed / len(paths) * 1000,
+        "peak_kb": peak / 1024,
+        "outputs": outputs
+    }
+
+
+def agreement(legacy: list, streaming: list) -> float:
+    """
+    Share of legacy lines also found by the streaming parser
+    """
+    found = total = 0
+    for old, new in zip(legacy, streaming):
+        new_lines = set(new.split("\n"))
+        for line in old.split("\n"):
+            total += 1
+            found += line in new_lines
+    return found / total if total else 1.0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus", help="directory of .docx files")
+    parser.add_argument("--count", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.corpus:
+            paths = sorted(
+                os.path.join(args.corpus, f)
+                for f in os.listdir(args.corpus) if f.lower().endswith(".docx")
+            )
+        else:
+            paths = make_corpus(tmp, args.count)
+
+        legacy = measure(legacy_parse_docx, paths)
+        streaming = measure(parse_docx, paths)
+
+    print(f"files: {len(paths)}")
+    print(f"{'parser':<12}{'ms/file':>10}{'files/s':>10}{'peak KB':>10}{'chars':>12}")
+    for name, result in (("python-docx", legacy), ("streaming", streaming)):
+        print(
+            f"{name:<12}{result['per_file_ms']:>10.2f}"
+            f"{len(paths) / result['seconds']:>10.0f}"
+            f"{result['peak_kb']:>10.0f}"
+            f"{sum(len(o) for o in result['outputs']):>12}"
+        )
+    print(f"speedup: {legacy['seconds'] / streaming['seconds']:.1f}x")
+    print(f"legacy lines kept: {agreement(legacy['outputs'], streaming['outputs']):.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Experience estimation: the first-"N years"-match regex vs the
+date-range scanner in backend/resume_extractor.py
+
+    python benchmarks/bench_experience.py                  # generated corpus
+    python benchmarks/bench_experience.py --corpus DIR     # .txt resume texts
+"""
+import os
+import re
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.resume_extractor import estimate_experience_batch
+
+WORDS = (
+    "python fastapi sql docker aws kubernetes react backend api team built "
+    "designed led migrated engineer senior developer data pipeline cloud"
+).split()
+
+MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+SEPARATORS = [" - ", " – ", " to ", "–"]
+
+
+def legacy_estimate(text: str) -> float | None:
+    # Previous implementation (first "N years" statement)
+    match = re.search(r"(\d+(\.\d+)?)\s*(years|yrs)", text.lower())
+    if match:
+        return float(match.group(1))
+    return None
+
+
+def _date(rng: random.Random, year: int, month: int) -> str:
+    style = rng.random()
+    if style < 0.6:
+        return f"{MONTH_NAMES[month - 1]} {year}"
+    if style < 0.85:
+        return f"{month:02d}/{year}"
+    return str(year)
+
+
+def make_text(rng: random.Random, i: int) -> str:
+    lines = [f"Candidate {i}", f"candidate{i}@example.com"]
+    if rng.random() < 0.5:
+        lines.append(f"Engineer with {rng.randint(1, 15)} years of experience")
+
+    year = rng.randint(2005, 2020)
+    for job in range(rng.randint(1, 5)):
+        start_month = rng.randint(1, 12)
+        end_year = year + rng.randint(0, 3)
+        end = "Present" if job == 0 and rng.random() < 0.5 else _date(rng, end_year, rng.randint(1, 12))
+        lines.append(f"Software Engineer, Company {job}  {_date(rng, year, start_month)}{rng.choice(SEPARATORS)}{end}")
+        for _ in range(rng.randint(3, 8)):
+            lines.append(" ".join(rng.choices(WORDS, k=rng.randint(8, 20))))
+        year = max(2000, year - rng.randint(1, 4))
+
+    return "\n".join(lines)
+
+
+def measure(estimate, texts: list, repeat: int) -> dict:
+    elapsed = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        outputs = estimate(texts)
+        elapsed = min(elapsed, time.perf_counter() - started)
+
+    return {
+        "seconds": elapsed,
+        "per_resume_us": elapsed / len(texts) * 1e6,
+        "found": sum(o is not None for o in outputs)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus", help="directory of .txt resume texts")
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.corpus:
+        texts = []
+        for name in sorted(os.listdir(args.corpus)):
+            if name.lower().endswith(".txt"):
+                with open(os.path.join(args.corpus, name), encoding="utf-8", errors="ignore") as f:
+                    texts.append(f.read())
+    else:
+        rng = random.Random(7)
+        texts = [make_text(rng, i) for i in range(args.count)]
+
+    legacy = measure(lambda batch: [legacy_estimate(t) for t in batch], texts, args.repeat)
+    ranges = measure(estimate_experience_batch, texts, args.repeat)
+
+    print(f"resumes: {len(texts)}")
+    print(f"{'estimator':<14}{'us/resume':>12}{'resumes/s':>12}{'found':>8}")
+    for name, result in (("first-match", legacy), ("date-ranges", ranges)):
+        print(
+            f"{name:<14}{result['per_resume_us']:>12.1f}"
+            f"{len(texts) / result['seconds']:>12.0f}"
+            f"{result['found']:>8}"
+        )
+    print(f"relative cost: {ranges['seconds'] / legacy['seconds']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
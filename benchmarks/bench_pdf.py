@@ -0,0 +1,140 @@
+"""
+PDF text extraction: pdfplumber vs pdfium vs the "auto"
+engine in backend/resume_parser.py
+
+    python benchmarks/bench_pdf.py                   # generated corpus
+    python benchmarks/bench_pdf.py --corpus DIR      # your .pdf files
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend import resume_parser
+
+WORDS = (
+    "python fastapi sql docker aws kubernetes react backend api team built "
+    "designed led migrated engineer senior developer data pipeline cloud"
+).split()
+
+
+def write_pdf(path: str, pages: list):
+    """
+    Minimal PDF with one Helvetica text block per page
+    """
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None]
+    kids = []
+
+    for lines in pages:
+        stream = "BT /F1 10 Tf 50 760 Td 12 TL " + " ".join(f"({line}) '" for line in lines) + " ET"
+        page_obj = len(objects) + 1
+        kids.append(f"{page_obj} 0 R")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Contents {page_obj + 1} 0 R /Resources << /Font << /F1 {page_obj + 2} 0 R >> >> >>"
+        )
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = "%PDF-1.4\n"
+    offsets = []
+    for i, obj in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{i} 0 obj\n{obj}\nendobj\n"
+
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n"
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets)
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n"
+
+    with open(path, "w") as f:
+        f.write(out)
+
+
+def make_corpus(directory: str, count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    paths = []
+
+    for i in range(count):
+        pages = []
+        for _ in range(rng.randint(1, 3)):
+            pages.append([
+                " ".join(rng.choices(WORDS, k=rng.randint(6, 12)))
+                for _ in range(rng.randint(30, 55))
+            ])
+        pages[0][:2] = [f"Candidate {i}", f"candidate{i}@example.com"]
+
+        path = os.path.join(directory, f"resume_{i}.pdf")
+        write_pdf(path, pages)
+        paths.append(path)
+
+    return paths
+
+
+def measure(parse, paths: list) -> dict:
+    outputs = []
+    started = time.perf_counter()
+    for path in paths:
+        outputs.append(parse(path))
+    elapsed = time.perf_counter() - started
+    return {"seconds": elapsed, "outputs": outputs}
+
+
+def word_agreement(a: str, b: str) -> float:
+    """
+    Multiset overlap of the words in both texts
+    """
+    ca, cb = Counter(a.split()), Counter(b.split())
+    total = sum((ca | cb).values())
+    return sum((ca & cb).values()) / total if total else 1.0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus", help="directory of .pdf files")
+    parser.add_argument("--count", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.corpus:
+            paths = sorted(
+                os.path.join(args.corpus, f)
+                for f in os.listdir(args.corpus) if f.lower().endswith(".pdf")
+            )
+        else:
+            paths = make_corpus(tmp, args.count)
+
+        results = {
+            "pdfplumber": measure(resume_parser.parse_pdf_pdfplumber, paths),
+            "pdfium": measure(lambda p: resume_parser.parse_pdf_pdfium(p)[0], paths),
+            "auto": measure(resume_parser.parse_pdf_with_engine, paths),
+        }
+
+    engines = Counter(engine for _, engine in results["auto"]["outputs"])
+    results["auto"]["outputs"] = [text for text, _ in results["auto"]["outputs"]]
+    baseline = results["pdfplumber"]
+
+    print(f"files: {len(paths)}")
+    print(f"{'engine':<12}{'ms/file':>10}{'files/s':>10}{'speedup':>10}{'agreement':>11}")
+    for name, result in results.items():
+        agreement = sum(
+            word_agreement(a, b) for a, b in zip(result["outputs"], baseline["outputs"])
+        ) / len(paths)
+        print(
+            f"{name:<12}{result['seconds'] / len(paths) * 1000:>10.2f}"
+            f"{len(paths) / result['seconds']:>10.0f}"
+            f"{baseline['seconds'] / result['seconds']:>9.1f}x"
+            f"{agreement:>11.1%}"
+        )
+    print("auto engine choices:", dict(engines))
+
+
+if __name__ == "__main__":
+    main()
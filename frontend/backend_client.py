@@ -0,0 +1,201 @@
+import time
+import threading
+from collections import defaultdict, deque
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# -----------------------------
+# Shared backend client for the Streamlit apps
+# -----------------------------
+# One pooled keep-alive session per process and base URL,
+# so reruns and concurrent sessions reuse TCP/TLS connections.
+
+POOL_SIZE = 20
+
+# (connect, read) seconds per endpoint template
+DEFAULT_TIMEOUT = (5, 30)
+TIMEOUTS = {
+    "/screen-resumes": (5, 300),
+    "/screen-resumes-from-drive": (5, 300),
+    "/jobs": (5, 60),
+    "/jobs/{job_id}/resumes": (5, 120),
+    "/candidates/{candidate_id}/start-interview": (5, 60),
+    "/candidates/{candidate_id}/answer": (5, 60),
+}
+
+# Seconds GET responses are reused (read endpoints only)
+CACHE_TTLS = {
+    "/dashboard/candidates": 30,
+    "/jobs/{job_id}/results": 5,
+    "/": 5,
+}
+
+# Cached GET responses kept per client; expired ones stay (for
+# If-None-Match revalidation) until the cache is over the cap
+MAX_CACHED_RESPONSES = 128
+
+# Idempotent methods are retried on connection errors,
+# 429 and 5xx, honouring Retry-After
+RETRY = Retry(
+    total=3,
+    connect=3,
+    read=2,
+    status=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+LATENCY_SAMPLES = 200
+
+
+class BackendClient:
+    def __init__(self, base_url: str):
+        self.base_url = base_url.rstrip("/")
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            max_retries=RETRY
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._lock = threading.Lock()
+        self._cache = {}
+        self._latency = defaultdict(lambda: {
+            "count": 0,
+            "errors": 0,
+            "samples": deque(maxlen=LATENCY_SAMPLES)
+        })
+
+    # -----------------------------
+    # Requests
+    # -----------------------------
+    def request(
+        self,
+        method: str,
+        path: str,
+        path_params: dict | None = None,
+        cache_ttl: float | None = None,
+        **kwargs
+    ) -> requests.Response:
+        """
+        `path` is the endpoint template (e.g. "/jobs/{job_id}/results");
+        it selects the timeout / cache TTL and labels latency stats.
+        """
+        url = self.base_url + path.format(**(path_params or {}))
+        kwargs.setdefault("timeout", TIMEOUTS.get(path, DEFAULT_TIMEOUT))
+
+        ttl = 0
+        cached = None
+        if method == "GET":
+            ttl = CACHE_TTLS.get(path, 0) if cache_ttl is None else cache_ttl
+            # Full URL incl. encoded query string
+            cache_key = requests.Request("GET", url, params=kwargs.get("params")).prepare().url
+
+            if ttl:
+                with self._lock:
+                    cached = self._cache.get(cache_key)
+                if cached and cached[0] > time.monotonic():
+                    return cached[1]
+
+                # Expired: revalidate (304 = keep the cached body)
+                if cached and cached[1].headers.get("ETag"):
+                    kwargs["headers"] = {
+                        "If-None-Match": cached[1].headers["ETag"],
+                        **(kwargs.get("headers") or {})
+                    }
+
+        started = time.perf_counter()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.exceptions.RequestException:
+            self._record(method, path, started, error=True)
+            raise
+
+        self._record(method, path, started, error=response.status_code >= 500)
+
+        if ttl and response.status_code == 304 and cached:
+            response = cached[1]
+
+        if ttl and response.status_code == 200:
+            self._store(cache_key, ttl, response)
+
+        return response
+
+    def _store(self, cache_key: str, ttl: float, response: requests.Response):
+        now = time.monotonic()
+        with self._lock:
+            # Re-inserted, so dict order stays oldest-first
+            self._cache.pop(cache_key, None)
+            self._cache[cache_key] = (now + ttl, response)
+
+            if len(self._cache) > MAX_CACHED_RESPONSES:
+                for key in [k for k, (expires, _) in self._cache.items() if expires <= now]:
+                    del self._cache[key]
+                while len(self._cache) > MAX_CACHED_RESPONSES:
+                    del self._cache[next(iter(self._cache))]
+
+    def get(self, path: str, **kwargs) -> requests.Response:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> requests.Response:
+        return self.request("POST", path, **kwargs)
+
+    def invalidate(self, path_prefix: str = ""):
+        """
+        Drop cached GET responses whose URL path starts with prefix
+        """
+        prefix = self.base_url + path_prefix
+        with self._lock:
+            for key in [k for k in self._cache if k.startswith(prefix)]:
+                del self._cache[key]
+
+    # -----------------------------
+    # Client-side latency
+    # -----------------------------
+    def _record(self, method: str, path: str, started: float, error: bool):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            stats = self._latency[f"{method} {path}"]
+            stats["count"] += 1
+            stats["errors"] += int(error)
+            stats["samples"].append(elapsed_ms)
+
+    def latency_report(self) -> list:
+        """
+        Per-endpoint round-trip stats (p50 / p95 over the
+        last LATENCY_SAMPLES calls)
+        """
+        report = []
+        with self._lock:
+            for endpoint, stats in sorted(self._latency.items()):
+                samples = sorted(stats["samples"])
+                if not samples:
+                    continue
+                report.append({
+                    "endpoint": endpoint,
+                    "calls": stats["count"],
+                    "errors": stats["errors"],
+                    "p50_ms": round(samples[len(samples) // 2], 1),
+                    "p95_ms": round(samples[min(int(len(samples) * 0.95), len(samples) - 1)], 1),
+                    "max_ms": round(samples[-1], 1)
+                })
+        return report
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(base_url: str) -> BackendClient:
+    with _clients_lock:
+        if base_url not in _clients:
+            _clients[base_url] = BackendClient(base_url)
+        return _clients[base_url]
@@ -1,12 +1,16 @@
 import streamlit as st
 import requests
 
+from backend_client import get_client
+
 BACKEND_URL = st.secrets.get("BACKEND_URL")
 
 if not BACKEND_URL:
     st.error("BACKEND_URL not set in Streamlit secrets")
     st.stop()
 
+backend = get_client(BACKEND_URL)
+
 st.title("Job Application Portal")
 
 # Get job_id from URL
@@ -39,11 +43,11 @@ if st.button("Submit Application"):
     }
 
     try:
-        response = requests.post(
-            f"{BACKEND_URL}/jobs/{job_id}/upload_resume",
+        response = backend.post(
+            "/jobs/{job_id}/upload_resume",
+            path_params={"job_id": job_id},
             files=files,
-            data=data,
-            timeout=120
+            data=data
         )
     except requests.exceptions.RequestException as e:
         st.error(f"Connection error: {e}")
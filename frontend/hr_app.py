@@ -2,6 +2,8 @@ import streamlit as st
 import requests
 import os
 
+from backend_client import get_client
+
 st.set_page_config(page_title="HR Job Creation", layout="centered")
 
 st.title("HR – Create Job")
@@ -13,6 +15,8 @@ if not BACKEND_URL:
     st.error("BACKEND_URL is not set in Streamlit secrets")
     st.stop()
 
+backend = get_client(BACKEND_URL)
+
 # Job form
 job_title = st.text_input("Job Title")
 job_description = st.text_area("Job Description")
@@ -36,10 +40,9 @@ if st.button("Create Job"):
 
         try:
             with st.spinner("Creating job..."):
-                res = requests.post(
-                    f"{BACKEND_URL}/jobs/create",
-                    json=payload,
-                    timeout=60
+                res = backend.post(
+                    "/jobs/create",
+                    json=payload
                 )
 
             if res.status_code == 200:
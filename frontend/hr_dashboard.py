@@ -1,17 +1,27 @@
 import streamlit as st
 import requests
 import pandas as pd
+import time
+import random
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from backend_client import get_client
 
 # -----------------------------
 # CONFIG
 # -----------------------------
 BACKEND_URL = st.secrets.get("BACKEND_URL", "http://127.0.0.1:8000")
+backend = get_client(BACKEND_URL)
 
-# Public CSV export link of Google Sheet
-GOOGLE_SHEET_CSV_URL = st.secrets.get(
-    "GOOGLE_SHEET_CSV_URL",
-    ""  # must be set in Streamlit secrets
-)
+# Seconds a fetched candidate page is reused across reruns
+DASHBOARD_CACHE_TTL = 30
+
+# Parallel chunked upload
+CHUNKED_MODE = "Upload in Parallel Chunks"
+CHUNK_SIZE = 5            # resumes per request
+PARALLEL_UPLOADS = 4      # requests in flight
+CHUNK_RETRIES = 2
 
 st.set_page_config(
     page_title="HR Resume Screening Dashboard",
@@ -20,6 +30,175 @@ st.set_page_config(
 
 st.title("🧑‍💼 AI Resume Screening – HR Dashboard")
 
+# -----------------------------
+# CANDIDATE DATA (cached)
+# -----------------------------
+def fetch_candidate_page(job_id, shortlisted_only, final_selected_only, page, page_size):
+    """
+    Backend returns candidates already filtered, sorted & paginated.
+    Cached per argument set by the backend client; cleared after
+    screening / on Refresh.
+    """
+    params = {
+        "shortlisted_only": shortlisted_only,
+        "final_selected_only": final_selected_only,
+        "sort_by": ["interview_score", "rank_score"],
+        "page": page,
+        "page_size": page_size
+    }
+    if job_id:
+        params["job_id"] = job_id
+
+    res = backend.get(
+        "/dashboard/candidates",
+        params=params,
+        cache_ttl=DASHBOARD_CACHE_TTL
+    )
+    res.raise_for_status()
+    return res.json()
+
+
+def clear_candidate_cache():
+    backend.invalidate("/dashboard/candidates")
+
+
+def reset_candidate_page():
+    # A new filter starts again from its first page
+    st.session_state["candidate_page"] = 1
+
+
+# -----------------------------
+# IDEMPOTENT SCREENING
+# -----------------------------
+def screening_key(*parts):
+    """
+    Same job details + same resumes -> same Idempotency-Key, so
+    clicking again after a timeout attaches to the job the backend
+    is already screening instead of starting a duplicate one
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(repr(part).encode())
+    return digest.hexdigest()
+
+
+# -----------------------------
+# CHUNKED UPLOAD
+# -----------------------------
+def retry_delay(res, attempt):
+    """
+    The backend's Retry-After (admission control) when it sent
+    one, else jittered exponential backoff
+    """
+    retry_after = res.headers.get("Retry-After") if res is not None else None
+    if retry_after and retry_after.isdigit():
+        return int(retry_after)
+    return 2 ** attempt * random.uniform(0.5, 1.0)
+
+
+def upload_chunk(job_id, chunk):
+    """
+    POST one sub-batch to the job, retrying only this chunk
+    on connection errors / 429 / 5xx. Retries carry the same
+    Idempotency-Key, so a chunk whose response was lost is
+    not screened twice.
+    """
+    files = [("resumes", (name, content, mime)) for name, content, mime in chunk]
+    key = screening_key(
+        "/jobs/{job_id}/resumes", job_id,
+        [(name, hashlib.sha256(content).hexdigest()) for name, content, _ in chunk]
+    )
+    last_error = None
+
+    for attempt in range(CHUNK_RETRIES + 1):
+        res = None
+        try:
+            res = backend.post(
+                "/jobs/{job_id}/resumes",
+                path_params={"job_id": job_id},
+                files=files,
+                headers={"Idempotency-Key": key}
+            )
+            if res.status_code == 200:
+                return res.json()
+            if res.status_code != 429 and res.status_code < 500:
+                raise RuntimeError(f"Backend rejected chunk ({res.status_code}): {res.text}")
+            last_error = RuntimeError(f"Backend error ({res.status_code})")
+        except requests.exceptions.RequestException as e:
+            last_error = e
+
+        # No wait after the last attempt
+        if attempt < CHUNK_RETRIES:
+            time.sleep(retry_delay(res, attempt))
+
+    raise last_error
+
+
+def upload_chunks(job_id, chunks):
+    """
+    Sends chunks concurrently, so the backend screens earlier
+    chunks while later ones are still uploading.
+    Returns (latest job summary, failed chunks).
+    """
+    total_files = sum(len(chunk) for chunk in chunks)
+    done_files = 0
+    summary = None
+    failed_chunks = []
+
+    progress = st.progress(0.0, text=f"Uploading 0/{total_files} resumes")
+
+    with ThreadPoolExecutor(max_workers=PARALLEL_UPLOADS) as pool:
+        futures = {pool.submit(upload_chunk, job_id, chunk): chunk for chunk in chunks}
+
+        for future in as_completed(futures):
+            chunk = futures[future]
+            try:
+                data = future.result()
+                if summary is None or data["total_resumes"] >= summary["total_resumes"]:
+                    summary = data
+            except Exception as e:
+                failed_chunks.append(chunk)
+                st.warning(f"Chunk failed ({', '.join(name for name, _, _ in chunk)}): {e}")
+
+            done_files += len(chunk)
+            progress.progress(
+                done_files / total_files,
+                text=f"Uploading {done_files}/{total_files} resumes"
+            )
+
+    return summary, failed_chunks
+
+
+def show_chunked_result(job_id, summary, failed_chunks):
+    st.session_state["job_id"] = job_id
+    st.session_state["candidate_page"] = 1
+    st.session_state["failed_chunks"] = failed_chunks
+    clear_candidate_cache()
+
+    if summary:
+        st.success(
+            f"Processed {summary['total_resumes']} resumes | "
+            f"Shortlisted: {summary['shortlisted']}"
+        )
+    if failed_chunks:
+        st.error(
+            f"{sum(len(c) for c in failed_chunks)} resumes failed to upload. "
+            "Use \"Retry failed uploads\" to resend only those."
+        )
+
+
+def run_chunked_upload(job_fields, resumes):
+    res = backend.post("/jobs", data=job_fields)
+    res.raise_for_status()
+    job_id = res.json()["job_id"]
+
+    payload = [(r.name, r.getvalue(), r.type) for r in resumes]
+    chunks = [payload[i:i + CHUNK_SIZE] for i in range(0, len(payload), CHUNK_SIZE)]
+
+    summary, failed_chunks = upload_chunks(job_id, chunks)
+    show_chunked_result(job_id, summary, failed_chunks)
+
+
 # -----------------------------
 # JOB INPUT SECTION
 # -----------------------------
@@ -44,13 +223,13 @@ st.subheader("📂 Resume Input")
 
 upload_mode = st.radio(
     "Choose resume source",
-    ["Upload Multiple Resumes", "Google Drive Folder Link"]
+    ["Upload Multiple Resumes", CHUNKED_MODE, "Google Drive Folder Link"]
 )
 
 resumes = None
 drive_link = None
 
-if upload_mode == "Upload Multiple Resumes":
+if upload_mode in ("Upload Multiple Resumes", CHUNKED_MODE):
     resumes = st.file_uploader(
         "Upload resumes (PDF/DOCX)",
         type=["pdf", "docx"],
@@ -65,6 +244,23 @@ else:
 if st.button("🚀 Start Resume Screening"):
     if not role or not required_skills or not experience_level:
         st.warning("Please fill all job details.")
+    elif upload_mode == CHUNKED_MODE:
+        if not resumes:
+            st.warning("Please upload resumes.")
+        else:
+            try:
+                run_chunked_upload(
+                    {
+                        "role": role,
+                        "required_skills": required_skills,
+                        "experience_level": experience_level,
+                        "culture_traits": culture_traits,
+                    },
+                    resumes
+                )
+            except Exception as e:
+                st.error("Failed to connect to backend")
+                st.exception(e)
     else:
         with st.spinner("Processing resumes..."):
             try:
@@ -73,8 +269,12 @@ if st.button("🚀 Start Resume Screening"):
                         st.warning("Please upload resumes.")
                     else:
                         files = [("resumes", r) for r in resumes]
-                        response = requests.post(
-                            f"{BACKEND_URL}/screen-resumes",
+                        key = screening_key(
+                            "/screen-resumes", role, required_skills, experience_level, culture_traits,
+                            [(r.name, hashlib.sha256(r.getvalue()).hexdigest()) for r in resumes]
+                        )
+                        response = backend.post(
+                            "/screen-resumes",
                             data={
                                 "role": role,
                                 "required_skills": required_skills,
@@ -82,22 +282,26 @@ if st.button("🚀 Start Resume Screening"):
                                 "culture_traits": culture_traits,
                             },
                             files=files,
-                            timeout=120
+                            headers={"Idempotency-Key": key}
                         )
                 else:
                     if not drive_link:
                         st.warning("Please enter Google Drive folder link.")
                     else:
-                        response = requests.post(
-                            f"{BACKEND_URL}/screen-resumes-drive",
+                        key = screening_key(
+                            "/screen-resumes-from-drive", role, required_skills,
+                            experience_level, culture_traits, drive_link
+                        )
+                        response = backend.post(
+                            "/screen-resumes-from-drive",
                             data={
                                 "role": role,
                                 "required_skills": required_skills,
                                 "experience_level": experience_level,
                                 "culture_traits": culture_traits,
-                                "drive_link": drive_link
+                                "drive_folder_link": drive_link
                             },
-                            timeout=120
+                            headers={"Idempotency-Key": key}
                         )
 
                 if response.status_code == 200:
@@ -107,6 +311,8 @@ if st.button("🚀 Start Resume Screening"):
                         f"Shortlisted: {data['shortlisted']}"
                     )
                     st.session_state["job_id"] = data["job_id"]
+                    st.session_state["candidate_page"] = 1
+                    clear_candidate_cache()
                 else:
                     st.error("Backend error while screening resumes")
 
@@ -114,6 +320,11 @@ if st.button("🚀 Start Resume Screening"):
                 st.error("Failed to connect to backend")
                 st.exception(e)
 
+if st.session_state.get("failed_chunks") and st.button("🔁 Retry failed uploads"):
+    job_id = st.session_state["job_id"]
+    summary, failed_chunks = upload_chunks(job_id, st.session_state["failed_chunks"])
+    show_chunked_result(job_id, summary, failed_chunks)
+
 st.divider()
 
 # -----------------------------
@@ -121,82 +332,91 @@ st.divider()
 # -----------------------------
 st.subheader("📊 Ranked Candidates")
 
-if not GOOGLE_SHEET_CSV_URL:
-    st.info("Google Sheet CSV link not configured.")
-else:
-    try:
-        df = pd.read_csv(GOOGLE_SHEET_CSV_URL)
-
-        if df.empty:
-            st.warning("No candidates found yet.")
-        else:
-            # Optional filter by job_id
-            job_id = st.session_state.get("job_id")
-            if job_id and "job_id" in df.columns:
-                df = df[df["job_id"] == job_id]
-
-            # Sort by interview score first, then rank_score
-            if "interview_score" in df.columns:
-                df = df.sort_values(
-                    by=["interview_score", "rank_score"],
-                    ascending=False
-                )
-            elif "rank_score" in df.columns:
-                df = df.sort_values(by="rank_score", ascending=False)
-
-            # Shortlist filter
-            show_shortlisted = st.checkbox("Show only shortlisted candidates")
-            if show_shortlisted and "shortlisted" in df.columns:
-                df = df[df["shortlisted"] == True]
-          
-            show_final_selected = st.checkbox("Show final interview candidates only")
-
-            if show_final_selected and "final_selected" in df.columns:
-                df = df[df["final_selected"] == True]
-
-
-
-
-            # Highlight strong interview performers
-            if "interview_score" in df.columns:
-                df["Interview Status"] = df["interview_score"].apply(
-                    lambda x: "🔥 Strong" if x >= 80 else "⚠️ Moderate" if x >= 60 else "❌ Weak"
-                )
+filter_col1, filter_col2, filter_col3 = st.columns([2, 2, 1])
+
+with filter_col1:
+    show_shortlisted = st.checkbox("Show only shortlisted candidates", on_change=reset_candidate_page)
+with filter_col2:
+    show_final_selected = st.checkbox("Show final interview candidates only", on_change=reset_candidate_page)
+with filter_col3:
+    if st.button("🔄 Refresh"):
+        clear_candidate_cache()
+
+page_size = 50
+page = st.session_state.get("candidate_page", 1)
+
+try:
+    data = fetch_candidate_page(
+        st.session_state.get("job_id"),
+        show_shortlisted,
+        show_final_selected,
+        page,
+        page_size
+    )
 
-            visible_columns = [
-                col for col in [
-                    "job_id",
-                    "role",
-                    "candidate_id",
-                    "name",
-                    "email",
-                    "email_confidence",
-                    "skills",
-                    "experience_years",
-                    "score",
-                    "interview_score",
-                    "rank",
-                    "rank_score",
-                    "recommendation",
-                    "shortlisted",
-                    "resume_file",
-                    "confidence",
-                    "email_stage",
-                    "personal_form_submitted"
-                ] if col in df.columns
-            ]
-
-            st.dataframe(
-                df[visible_columns],
-                use_container_width=True
+    if data["total"] == 0:
+        st.warning("No candidates found yet.")
+    else:
+        df = pd.DataFrame(data["rows"])
+
+        # Highlight strong interview performers
+        if "interview_score" in df.columns:
+            df["Interview Status"] = df["interview_score"].apply(
+                lambda x: "🔥 Strong" if isinstance(x, (int, float)) and x >= 80
+                else "⚠️ Moderate" if isinstance(x, (int, float)) and x >= 60
+                else "❌ Weak"
             )
 
-    except Exception as e:
-        st.warning("Google Sheet not accessible yet")
-        st.exception(e)
-
-
-
-
-
+        visible_columns = [
+            col for col in [
+                "job_id",
+                "role",
+                "candidate_id",
+                "name",
+                "email",
+                "email_confidence",
+                "skills",
+                "experience_years",
+                "score",
+                "interview_score",
+                "Interview Status",
+                "rank",
+                "rank_score",
+                "recommendation",
+                "shortlisted",
+                "resume_file",
+                "confidence",
+                "email_stage",
+                "personal_form_submitted"
+            ] if col in df.columns
+        ]
+
+        st.dataframe(
+            df[visible_columns],
+            use_container_width=True
+        )
+
+        total_pages = max(1, -(-data["total"] // page_size))
+        if page > total_pages:
+            st.session_state["candidate_page"] = total_pages
+
+        st.number_input(
+            f"Page (of {total_pages}, {data['total']} candidates)",
+            min_value=1,
+            max_value=total_pages,
+            key="candidate_page"
+        )
+
+except Exception as e:
+    st.warning("Backend not reachable yet")
+    st.exception(e)
 
+# -----------------------------
+# BACKEND LATENCY (client-side)
+# -----------------------------
+with st.sidebar.expander("⏱️ Backend latency"):
+    latency = backend.latency_report()
+    if latency:
+        st.dataframe(pd.DataFrame(latency), use_container_width=True)
+    else:
+        st.caption("No backend calls yet.")
@@ -1,12 +1,19 @@
 import streamlit as st
-import requests
 import time
+import json
 import streamlit.components.v1 as components
+from websockets.sync.client import connect
+from websockets.exceptions import ConnectionClosed
+
+from backend_client import get_client
 
 # -----------------------------
 # CONFIG
 # -----------------------------
 BACKEND_URL = st.secrets.get("BACKEND_URL", "http://127.0.0.1:8000")
+backend = get_client(BACKEND_URL)
+WS_URL = BACKEND_URL.replace("https://", "wss://").replace("http://", "ws://")
+WS_RECEIVE_TIMEOUT = 60
 TOTAL_INTERVIEW_MINUTES = 20
 THINKING_TIME_SECONDS = 60
 MAX_QUESTIONS = 5
@@ -81,7 +88,8 @@ if "start_time" not in st.session_state:
     st.session_state.q_count = 0
     st.session_state.answer = ""
     st.session_state.chat = []
-    st.session_state.thinking_done = False
+    st.session_state.question_shown_at = None
+    st.session_state.time_remaining = TOTAL_INTERVIEW_MINUTES * 60
     st.session_state.final_score = None
     st.session_state.feedback = None
 
@@ -93,17 +101,66 @@ if elapsed > TOTAL_INTERVIEW_MINUTES:
     st.error("⏰ Interview time limit exceeded")
     st.stop()
 
+# -----------------------------
+# INTERVIEW SOCKET
+# -----------------------------
+# One WebSocket per interview session: answers go up and the
+# next question streams back token by token on the same connection.
+def question_stream(ws, result):
+    """
+    Yields question tokens; the closing message
+    (question_end / completed / error) is stored in result
+    """
+    try:
+        while True:
+            msg = json.loads(ws.recv(timeout=WS_RECEIVE_TIMEOUT))
+            if msg["type"] == "question_token":
+                yield msg["token"]
+            else:
+                result.update(msg)
+                return
+    except (ConnectionClosed, TimeoutError):
+        result.update({"type": "error", "detail": "Connection to interview server lost"})
+
+
+def receive_question(ws):
+    result = {}
+    placeholder = st.empty()
+    with placeholder.container():
+        st.markdown("**AI:**")
+        st.write_stream(question_stream(ws, result))
+    placeholder.empty()
+    return result
+
+
+def show_question(msg):
+    st.session_state.question = msg["question"]
+    st.session_state.q_count = msg["round"]
+    st.session_state.question_shown_at = time.time()
+    st.session_state.time_remaining = msg["time_remaining_seconds"]
+    st.session_state.chat.append(("ai", st.session_state.question))
+
+
 # -----------------------------
 # START INTERVIEW
 # -----------------------------
 if st.session_state.question is None:
-    res = requests.post(
-        f"{BACKEND_URL}/candidates/{candidate_id}/start-interview"
-    )
-    data = res.json()
-    st.session_state.question = data["question"]
-    st.session_state.q_count = 1
-    st.session_state.chat.append(("ai", st.session_state.question))
+    try:
+        st.session_state.ws = connect(
+            f"{WS_URL}/candidates/{candidate_id}/interview/ws",
+            open_timeout=10
+        )
+    except Exception as e:
+        st.error(f"❌ Cannot connect to interview server: {e}")
+        st.stop()
+
+    msg = receive_question(st.session_state.ws)
+
+    if msg["type"] != "question_end":
+        st.error(f"❌ {msg.get('detail', 'Could not start interview')}")
+        st.stop()
+
+    show_question(msg)
 
 # -----------------------------
 # PROGRESS BAR
@@ -139,15 +196,44 @@ components.html(
 )
 
 # -----------------------------
-# THINKING TIMER
+# THINKING TIMER (runs in the browser)
 # -----------------------------
-if not st.session_state.thinking_done:
-    timer = st.empty()
-    for i in range(THINKING_TIME_SECONDS, 0, -1):
-        timer.markdown(f"<div class='timer-box'>⏳ Thinking time: {i}s</div>", unsafe_allow_html=True)
-        time.sleep(1)
-    timer.empty()
-    st.session_state.thinking_done = True
+# Deadlines are absolute, so reruns don't restart the countdown.
+# The backend enforces the limits from its own timestamps.
+thinking_ends_ms = int((st.session_state.question_shown_at + THINKING_TIME_SECONDS) * 1000)
+interview_ends_ms = int((st.session_state.question_shown_at + st.session_state.time_remaining) * 1000)
+
+components.html(
+    f"""
+    <div id="timer" style="background:#fff7ed;padding:10px;border-radius:8px;
+         text-align:center;font-weight:bold;font-family:sans-serif;"></div>
+    <script>
+      const thinkingEnds = {thinking_ends_ms};
+      const interviewEnds = {interview_ends_ms};
+      const box = document.getElementById("timer");
+
+      function tick() {{
+        const now = Date.now();
+        const thinking = Math.ceil((thinkingEnds - now) / 1000);
+        const total = Math.max(Math.ceil((interviewEnds - now) / 1000), 0);
+        const totalText = Math.floor(total / 60) + ":" + String(total % 60).padStart(2, "0");
+
+        if (total <= 0) {{
+          box.innerText = "⏰ Interview time limit reached";
+          clearInterval(timerId);
+        }} else if (thinking > 0) {{
+          box.innerText = "⏳ Thinking time: " + thinking + "s  |  Interview time left: " + totalText;
+        }} else {{
+          box.innerText = "🎤 Answer now  |  Interview time left: " + totalText;
+        }}
+      }}
+
+      const timerId = setInterval(tick, 1000);
+      tick();
+    </script>
+    """,
+    height=60
+)
 
 # -----------------------------
 # STT – MIC BUTTON
@@ -192,34 +278,37 @@ if st.button("Submit Answer"):
 
     st.session_state.chat.append(("user", answer))
 
-    res = requests.post(
-        f"{BACKEND_URL}/candidates/{candidate_id}/answer",
-        params={"answer": answer}
-    )
+    try:
+        st.session_state.ws.send(json.dumps({"type": "answer", "answer": answer}))
+    except ConnectionClosed:
+        st.error("❌ Connection to interview server lost")
+        st.stop()
+
+    data = receive_question(st.session_state.ws)
 
-    data = res.json()
+    if data["type"] == "error":
+        st.error(f"⏰ {data.get('detail', 'Interview closed')}")
+        st.stop()
 
     # -----------------------------
     # NEXT QUESTION
     # -----------------------------
-    if "next_question" in data:
-        st.session_state.question = data["next_question"]
-        st.session_state.q_count += 1
-        st.session_state.chat.append(("ai", st.session_state.question))
+    if data["type"] == "question_end":
+        show_question(data)
         st.session_state.answer = ""
-        st.session_state.thinking_done = False
         st.rerun()
 
     # -----------------------------
     # INTERVIEW COMPLETED
     # -----------------------------
     else:
-        st.session_state.final_score = data.get("score", 0)
+        st.session_state.final_score = data.get("interview_score", 0)
         st.session_state.feedback = data.get("feedback", "")
 
         # 🔥 AUTO-SEND INTERVIEW SCORE TO BACKEND
-        requests.post(
-            f"{BACKEND_URL}/candidates/{candidate_id}/interview-result",
+        backend.post(
+            "/candidates/{candidate_id}/interview-result",
+            path_params={"candidate_id": candidate_id},
             params={"interview_score": st.session_state.final_score}
         )
 
@@ -236,22 +325,3 @@ if st.button("Submit Answer"):
         )
 
         st.stop()
-
-
-response = requests.post(
-    f"{BACKEND_URL}/interview/update",
-    json={
-        "job_id": st.session_state["job_id"],
-        "candidate_id": st.session_state["candidate_id"],
-        "interview_score": final_score,
-        "recommendation": recommendation
-    }
-)
-
-if response.status_code == 200:
-    st.success("Interview completed successfully!")
-else:
-    st.error("Failed to submit interview results")
-
-
-
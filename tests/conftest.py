@@ -0,0 +1,53 @@
+import io
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Offline emulators instead of Google Sheets / Drive / Make.com
+os.environ.setdefault("INTEGRATIONS_BACKEND", "local")
+
+
+@pytest.fixture(scope="session")
+def client(tmp_path_factory):
+    from fastapi.testclient import TestClient
+
+    # main keeps its state, blobs and uploads relative to the cwd
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("backend"))
+    try:
+        from backend.main import app
+        yield TestClient(app)
+    finally:
+        os.chdir(cwd)
+
+
+@pytest.fixture
+def make_resume():
+    from docx import Document
+
+    def make(name: str, email: str, *lines: str) -> bytes:
+        doc = Document()
+        doc.add_paragraph(name)
+        doc.add_paragraph(email)
+        for line in lines or ("Skills: Python, SQL", "Backend developer building Python APIs and SQL pipelines."):
+            doc.add_paragraph(line)
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        return buffer.getvalue()
+
+    return make
+
+
+@pytest.fixture
+def create_job(client):
+    def create(required_skills: str) -> str:
+        return client.post("/jobs", data={
+            "role": "Backend Engineer",
+            "required_skills": required_skills,
+            "experience_level": "mid"
+        }).json()["job_id"]
+
+    return create
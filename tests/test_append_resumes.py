@@ -0,0 +1,34 @@
+def test_retried_chunk_is_not_screened_twice(client, create_job, make_resume):
+    job_id = create_job("Python, SQL")
+
+    chunk = [
+        ("resumes", ("ava.docx", make_resume("Ava Adams", "ava@example.com"))),
+        ("resumes", ("ben.docx", make_resume("Ben Brooks", "ben@example.com"))),
+        ("resumes", ("notes.txt", b"not a resume"))
+    ]
+    headers = {"Idempotency-Key": f"{job_id}-chunk-1"}
+
+    first = client.post(f"/jobs/{job_id}/resumes", files=chunk, headers=headers)
+    retry = client.post(f"/jobs/{job_id}/resumes", files=chunk, headers=headers)
+
+    assert first.status_code == 200
+    assert first.json()["added"] == 2
+    assert retry.json() == first.json()
+    assert retry.headers["Idempotent-Replayed"] == "true"
+
+    results = client.get(f"/jobs/{job_id}/results").json()
+    assert len(results["candidates"]) == 2
+
+
+def test_same_key_with_other_files_is_rejected(client, create_job, make_resume):
+    job_id = create_job("Python")
+    headers = {"Idempotency-Key": f"{job_id}-chunk-1"}
+
+    client.post(f"/jobs/{job_id}/resumes", headers=headers, files=[
+        ("resumes", ("cara.docx", make_resume("Cara Chen", "cara@example.com")))
+    ])
+    conflict = client.post(f"/jobs/{job_id}/resumes", headers=headers, files=[
+        ("resumes", ("cara.docx", make_resume("Dev Diaz", "dev@example.com")))
+    ])
+
+    assert conflict.status_code == 422
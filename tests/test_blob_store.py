@@ -0,0 +1,53 @@
+import os
+import time
+
+from backend.blob_store import BlobStore
+
+
+def age(path: str, seconds: float):
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def test_unreferenced_blob_kept_within_retention(tmp_path):
+    store = BlobStore(root=str(tmp_path), retention_days=1)
+    key = store.put(b"resume", "cv.pdf")
+
+    assert store.collect_garbage()["files"] == 0
+    assert os.path.exists(store.path(key))
+
+
+def test_unreferenced_blob_deleted_after_retention(tmp_path):
+    store = BlobStore(root=str(tmp_path), retention_days=1)
+    key = store.put(b"resume", "cv.pdf")
+    age(store.path(key), 2 * 86400)
+
+    assert store.collect_garbage()["files"] == 1
+    assert not os.path.exists(store.path(key))
+
+
+def test_refs_survive_restart(tmp_path):
+    store = BlobStore(root=str(tmp_path), retention_days=1)
+    key = store.put(b"resume", "cv.pdf")
+    store.add_ref(key, "job-a")
+    age(store.path(key), 2 * 86400)
+
+    restarted = BlobStore(root=str(tmp_path), retention_days=1)
+
+    assert restarted.collect_garbage()["files"] == 0
+    assert os.path.exists(restarted.path(key))
+    assert restarted.stats()["referenced_blobs"] == 1
+
+
+def test_temp_files_only_get_the_grace_period(tmp_path):
+    store = BlobStore(root=str(tmp_path), retention_days=30, grace_seconds=60)
+    fresh = tmp_path / ".fresh.tmp"
+    stale = tmp_path / ".stale.tmp"
+    fresh.write_bytes(b"x")
+    stale.write_bytes(b"x")
+    age(str(stale), 120)
+
+    store.collect_garbage()
+
+    assert fresh.exists()
+    assert not stale.exists()
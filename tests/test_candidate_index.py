@@ -0,0 +1,71 @@
+from backend.candidate_index import CandidateIndex
+
+JOB = {"job_id": "job-a", "role": "Backend Engineer"}
+
+
+def candidate(candidate_id: str, **fields) -> dict:
+    return {
+        "candidate_id": candidate_id,
+        "name": candidate_id,
+        "email": f"{candidate_id}@example.com",
+        "skills": ["Python"],
+        "experience_years": 0,
+        "score": 50,
+        "shortlisted": True,
+        "email_stage": "RESUME_SHORTLISTED",
+        **fields
+    }
+
+
+def ids(result: dict) -> set:
+    return {r["candidate_id"] for r in result["results"]}
+
+
+def test_range_bounds_are_inclusive():
+    index = CandidateIndex()
+    index.add(JOB, candidate("exact", experience_years=2.2, score=70))
+    index.add(JOB, candidate("above", experience_years=2.3, score=71))
+    index.add(JOB, candidate("below", experience_years=2.1, score=69))
+
+    assert ids(index.search(max_experience=2.2)) == {"exact", "below"}
+    assert ids(index.search(min_experience=2.2)) == {"exact", "above"}
+    assert ids(index.search(min_experience=2.2, max_experience=2.2)) == {"exact"}
+    assert ids(index.search(min_score=70)) == {"exact", "above"}
+    assert ids(index.search(max_score=70)) == {"exact", "below"}
+
+
+def test_ranges_span_several_buckets():
+    index = CandidateIndex()
+    for years in (0.5, 1, 3.5, 7, 12):
+        index.add(JOB, candidate(f"c{years}", experience_years=years))
+
+    assert ids(index.search(min_experience=1, max_experience=7)) == {"c1", "c3.5", "c7"}
+
+
+def test_combined_filters():
+    index = CandidateIndex()
+    index.add(JOB, candidate("py-sql", skills=["Python", "SQL"], score=80))
+    index.add(JOB, candidate("py-aws", skills=["Python", "AWS"], score=75))
+    index.add(JOB, candidate("sql", skills=["SQL"], score=90, shortlisted=False, email_stage="REJECTED"))
+
+    assert ids(index.search(skills=["python", "sql"])) == {"py-sql"}
+    assert ids(index.search(skills=["Python", "SQL"], match="any")) == {"py-sql", "py-aws", "sql"}
+    assert ids(index.search(skills=["SQL"], shortlisted=True)) == {"py-sql"}
+    assert ids(index.search(skills=["Python"], exclude_skills=["AWS"])) == {"py-sql"}
+    assert ids(index.search(stages=["rejected"], min_score=85)) == {"sql"}
+
+    # Ordered by score
+    result = index.search(skills=["Python", "SQL"], match="any")
+    assert [r["candidate_id"] for r in result["results"]] == ["sql", "py-sql", "py-aws"]
+
+
+def test_reindex_after_rescore():
+    index = CandidateIndex()
+    index.add(JOB, candidate("c1", skills=["Python"], score=40, shortlisted=False))
+
+    index.add(JOB, candidate("c1", skills=["Python", "Docker"], score=85, shortlisted=True))
+
+    assert ids(index.search(skills=["Docker"], min_score=80, shortlisted=True)) == {"c1"}
+    assert index.search(max_score=50)["total"] == 0
+    assert index.search(shortlisted=False)["total"] == 0
+    assert index.get("c1")["score"] == 85
@@ -0,0 +1,65 @@
+from backend import http_cache
+
+
+def results(client, job_id: str, **headers):
+    return client.get(f"/jobs/{job_id}/results", headers=headers)
+
+
+def test_matching_if_none_match_is_not_modified(client, create_job):
+    job_id = create_job("Python")
+    first = results(client, job_id)
+    etag = first.headers["ETag"]
+
+    again = results(client, job_id, **{"If-None-Match": etag})
+
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["ETag"] == etag
+
+
+def test_changed_job_gets_a_new_etag(client, create_job, make_resume):
+    job_id = create_job("Python")
+    etag = results(client, job_id).headers["ETag"]
+
+    client.post(f"/jobs/{job_id}/resumes", files=[
+        ("resumes", ("ava.docx", make_resume("Ava Adams", "ava@example.com")))
+    ])
+    changed = results(client, job_id, **{"If-None-Match": etag})
+
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert len(changed.json()["candidates"]) == 1
+
+
+def test_restart_invalidates_etags(client, create_job, monkeypatch):
+    job_id = create_job("Python")
+    etag = results(client, job_id).headers["ETag"]
+
+    # Job versions restart from scratch in a new process
+    monkeypatch.setattr(http_cache, "_BOOT_ID", "restarted")
+    after = results(client, job_id, **{"If-None-Match": etag})
+
+    assert after.status_code == 200
+    assert after.headers["ETag"] != etag
+
+
+def test_negotiation_without_brotli(monkeypatch):
+    monkeypatch.setattr(http_cache, "brotli", None)
+
+    assert http_cache.negotiate_encoding("br, gzip") == "gzip"
+    assert http_cache.negotiate_encoding("br;q=1.0, gzip;q=0.5") == "gzip"
+    assert http_cache.negotiate_encoding("br") == "identity"
+    assert http_cache.negotiate_encoding("*") == "gzip"
+    assert http_cache.negotiate_encoding("gzip;q=0, *") == "identity"
+    assert http_cache.negotiate_encoding(None) == "identity"
+
+
+def test_large_response_is_gzipped_without_brotli(client, create_job, monkeypatch):
+    monkeypatch.setattr(http_cache, "brotli", None)
+    monkeypatch.setattr(http_cache, "COMPRESS_MIN_BYTES", 1)
+    job_id = create_job("Python")
+
+    response = results(client, job_id, **{"Accept-Encoding": "br, gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.json()["job_id"] == job_id
@@ -0,0 +1,58 @@
+import pytest
+
+from backend.idempotency import (
+    IdempotencyStore,
+    IdempotencyConflict,
+    MAX_KEY_LENGTH,
+    request_fingerprint
+)
+
+
+def test_retry_replays_the_first_result():
+    store = IdempotencyStore()
+    fingerprint = request_fingerprint("job-a", ["cv.pdf"])
+
+    future, owner = store.claim("key-1", fingerprint)
+    assert owner
+    store.complete("key-1", {"job_id": "job-a"})
+
+    replay, owner = store.claim("key-1", fingerprint)
+    assert not owner
+    assert replay.result() == {"job_id": "job-a"}
+    assert store.stats()["replayed"] == 1
+
+
+def test_same_key_different_request_conflicts():
+    store = IdempotencyStore()
+    store.claim("key-1", request_fingerprint("job-a", ["cv.pdf"]))
+
+    with pytest.raises(IdempotencyConflict):
+        store.claim("key-1", request_fingerprint("job-a", ["other.pdf"]))
+
+
+def test_failed_request_releases_the_key():
+    store = IdempotencyStore()
+    fingerprint = request_fingerprint("job-a")
+
+    future, _ = store.claim("key-1", fingerprint)
+    store.fail("key-1", RuntimeError("boom"))
+    assert isinstance(future.exception(), RuntimeError)
+
+    _, owner = store.claim("key-1", fingerprint)
+    assert owner
+
+
+def test_expired_key_runs_again():
+    store = IdempotencyStore(ttl_seconds=-1)
+    fingerprint = request_fingerprint("job-a")
+
+    store.claim("key-1", fingerprint)
+    store.complete("key-1", {})
+
+    _, owner = store.claim("key-1", fingerprint)
+    assert owner
+
+
+def test_overlong_key_rejected():
+    with pytest.raises(ValueError):
+        IdempotencyStore().claim("k" * (MAX_KEY_LENGTH + 1), "fingerprint")
@@ -0,0 +1,52 @@
+from backend.ranker import rank_candidates, merge_ranked
+
+
+def candidate(candidate_id: str, score: int) -> dict:
+    # rank_score = score * 0.4 with no skills / interview / experience
+    return {"candidate_id": candidate_id, "score": score, "skills": [], "email_confidence": "LOW"}
+
+
+def ids(candidates: list) -> list:
+    return [c["candidate_id"] for c in candidates]
+
+
+def test_merge_matches_a_full_rerank():
+    existing = rank_candidates([candidate("a", 90), candidate("b", 70), candidate("c", 50)])
+    new = [candidate("d", 60), candidate("e", 95)]
+
+    merged, _ = merge_ranked(existing, new)
+
+    expected = rank_candidates(
+        [candidate("a", 90), candidate("b", 70), candidate("c", 50), candidate("d", 60), candidate("e", 95)]
+    )
+    assert ids(merged) == ids(expected)
+    assert [c["rank"] for c in merged] == [1, 2, 3, 4, 5]
+
+
+def test_ties_keep_existing_candidates_first():
+    existing = rank_candidates([candidate("a", 80), candidate("b", 60)])
+
+    merged, moved = merge_ranked(existing, [candidate("new", 80)])
+
+    assert ids(merged) == ["a", "new", "b"]
+    assert ids(moved) == ["b"]
+
+
+def test_only_moved_ranks_are_reported():
+    existing = rank_candidates([candidate("a", 90), candidate("b", 70), candidate("c", 50)])
+
+    merged, moved = merge_ranked(existing, [candidate("d", 60)])
+
+    # a and b keep ranks 1 and 2; only c is pushed down
+    assert ids(merged) == ["a", "b", "d", "c"]
+    assert ids(moved) == ["c"]
+    assert merged[3]["rank"] == 4
+
+
+def test_new_candidates_at_the_bottom_move_nobody():
+    existing = rank_candidates([candidate("a", 90), candidate("b", 70)])
+
+    merged, moved = merge_ranked(existing, [candidate("c", 10), candidate("d", 20)])
+
+    assert ids(merged) == ["a", "b", "d", "c"]
+    assert moved == []
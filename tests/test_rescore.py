@@ -0,0 +1,64 @@
+def screen(client, create_job, make_resume) -> tuple:
+    job_id = create_job("Python, SQL")
+    client.post(f"/jobs/{job_id}/resumes", files=[
+        ("resumes", ("ava.docx", make_resume("Ava Adams", "ava@example.com"))),
+        ("resumes", ("ben.docx", make_resume("Ben Brooks", "ben@example.com", "Skills: Excel", "Office manager."))),
+        ("resumes", ("cara.docx", make_resume(
+            "Cara Chen", "cara@example.com", "Skills: SQL, Python, Docker", "Data engineer running SQL warehouses."
+        )))
+    ])
+    candidates = client.get(f"/jobs/{job_id}/results").json()["candidates"]
+    return job_id, {c["name"]: c for c in candidates}
+
+
+def test_preview_leaves_the_job_unchanged(client, create_job, make_resume):
+    job_id, before = screen(client, create_job, make_resume)
+
+    preview = client.post(f"/jobs/{job_id}/rescore", data={"shortlist_cutoff": "0"}).json()
+
+    assert not preview["applied"]
+    assert preview["shortlisted"] == 3
+    after = {c["name"]: c for c in client.get(f"/jobs/{job_id}/results").json()["candidates"]}
+    assert after == before
+
+
+def test_apply_moves_email_stage_with_the_shortlist(client, create_job, make_resume):
+    job_id, _ = screen(client, create_job, make_resume)
+
+    applied = client.post(f"/jobs/{job_id}/rescore", data={"shortlist_cutoff": "0", "apply": "true"}).json()
+
+    assert applied["applied"]
+    candidates = client.get(f"/jobs/{job_id}/results").json()["candidates"]
+    assert all(c["shortlisted"] for c in candidates)
+    assert {c["email_stage"] for c in candidates} == {"RESUME_SHORTLISTED"}
+
+    client.post(f"/jobs/{job_id}/rescore", data={"shortlist_cutoff": "101", "apply": "true"})
+
+    candidates = client.get(f"/jobs/{job_id}/results").json()["candidates"]
+    assert not any(c["shortlisted"] for c in candidates)
+    assert {c["email_stage"] for c in candidates} == {"REJECTED"}
+
+
+def test_candidates_past_screening_keep_their_decision(client, create_job, make_resume):
+    job_id, by_name = screen(client, create_job, make_resume)
+    client.post(f"/jobs/{job_id}/rescore", data={"shortlist_cutoff": "0", "apply": "true"})
+    ava = by_name["Ava Adams"]["candidate_id"]
+    client.post("/candidates/form-submitted", json={"candidate_id": ava})
+
+    client.post(f"/jobs/{job_id}/rescore", data={"shortlist_cutoff": "101", "apply": "true"})
+
+    candidates = {c["candidate_id"]: c for c in client.get(f"/jobs/{job_id}/results").json()["candidates"]}
+    assert candidates[ava]["shortlisted"]
+    assert candidates[ava]["email_stage"] == "FORM_SUBMITTED"
+    assert all(c["email_stage"] == "REJECTED" for cid, c in candidates.items() if cid != ava)
+
+
+def test_new_skills_change_scores(client, create_job, make_resume):
+    job_id, by_name = screen(client, create_job, make_resume)
+
+    preview = client.post(f"/jobs/{job_id}/rescore", data={"required_skills": "Excel"}).json()
+
+    skills = {c["name"]: c["skills"] for c in preview["candidates"]}
+    assert skills["Ben Brooks"] == ["Excel"]
+    assert skills["Ava Adams"] == []
+    assert preview["rescored"] == 3
@@ -0,0 +1,49 @@
+from datetime import date
+
+from backend.resume_extractor import estimate_experience_years, merged_months
+
+TODAY = date(2024, 6, 15)
+
+
+def years(text: str) -> float | None:
+    return estimate_experience_years(text, TODAY)
+
+
+def test_merged_months_counts_overlaps_once():
+    assert merged_months([(0, 12), (6, 18), (24, 30)]) == 24
+    assert merged_months([(10, 20), (0, 5)]) == 15
+    assert merged_months([]) == 0
+
+
+def test_overlapping_ranges_are_merged():
+    text = "Acme  Jan 2018 - Dec 2019\nGlobex  Jun 2019 - Mar 2020"
+    assert years(text) == 2.2
+
+
+def test_range_formats():
+    assert years("Mar 2016 - Feb 2017") == 1.0
+    assert years("03/2016 - 12/2018") == 2.8
+    assert years("September, 2019 to Aug 2020") == 1.0
+    assert years("Jan 2023 – Present") == 1.5
+
+
+def test_year_only_ends_cover_the_whole_year():
+    assert years("2019 - 2019") == 1.0
+    assert years("Jan 2019 - 2020") == 2.0
+    assert years("2012 - 2015") == 4.0
+
+
+def test_ranges_win_over_stated_years():
+    assert years("10 years of experience\nJan 2020 - Dec 2021") == 2.0
+
+
+def test_stated_years_are_capped():
+    assert years("Worked at a 125 years old company, 3 years exp") == 3.0
+    assert years("5+ Years of experience") == 5.0
+    assert years("Founded 120 yrs ago") is None
+
+
+def test_numbers_that_are_not_ranges():
+    assert years("Phone 120193 - 2020") is None
+    assert years("Invoice 12/03/2016 - 2018") is None
+    assert years("No dates here") is None
@@ -0,0 +1,132 @@
+import zipfile
+
+import pypdfium2
+import pytest
+from docx import Document
+from docx.shared import Inches
+
+from backend import resume_parser
+from backend.resume_parser import iter_docx_paragraphs, parse_docx
+
+W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+MC = 'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"'
+WPS = 'xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape"'
+V = 'xmlns:v="urn:schemas-microsoft-com:vml"'
+
+
+def python_docx_paragraphs(path) -> list:
+    # Body paragraphs and table cells in document order
+    doc = Document(path)
+    texts = []
+    for block in doc.element.body.iterchildren():
+        if block.tag.endswith("}p"):
+            texts.append(next(p.text for p in doc.paragraphs if p._p is block))
+        elif block.tag.endswith("}tbl"):
+            table = next(t for t in doc.tables if t._tbl is block)
+            for row in table.rows:
+                for cell in row.cells:
+                    texts.extend(p.text for p in cell.paragraphs)
+    return texts
+
+
+def test_matches_python_docx(tmp_path):
+    doc = Document()
+    doc.add_paragraph("Ava Adams")
+    tabbed = doc.add_paragraph("Email:\tava@example.com")
+    tabbed.paragraph_format.tab_stops.add_tab_stop(Inches(1))
+    doc.add_paragraph("Line one").add_run().add_break()
+    doc.add_paragraph("")
+    table = doc.add_table(rows=2, cols=2)
+    for i, cell in enumerate(c for row in table.rows for c in row.cells):
+        cell.text = f"Cell {i}"
+    doc.add_paragraph("Skills: Python, SQL")
+    path = tmp_path / "resume.docx"
+    doc.save(path)
+
+    assert list(iter_docx_paragraphs(str(path))) == python_docx_paragraphs(str(path))
+    assert parse_docx(str(path)).startswith("Ava Adams\nEmail:\tava@example.com\nLine one\n")
+
+
+def test_text_box_read_once_before_its_anchor(tmp_path):
+    box = '<w:txbxContent><w:p><w:r><w:t>Senior Engineer</w:t></w:r></w:p></w:txbxContent>'
+    document = (
+        f'<w:document {W} {MC} {WPS} {V}><w:body>'
+        '<w:p><w:r><w:t>Ava Adams</w:t></w:r></w:p>'
+        '<w:p><w:r><mc:AlternateContent>'
+        f'<mc:Choice Requires="wps"><wps:txbx>{box}</wps:txbx></mc:Choice>'
+        f'<mc:Fallback><v:textbox>{box}</v:textbox></mc:Fallback>'
+        '</mc:AlternateContent></w:r><w:r><w:t>Anchor</w:t></w:r></w:p>'
+        '</w:body></w:document>'
+    )
+    path = tmp_path / "textbox.docx"
+    with zipfile.ZipFile(path, "w") as docx:
+        docx.writestr("word/document.xml", document)
+
+    assert list(iter_docx_paragraphs(str(path))) == ["Ava Adams", "Senior Engineer", "Anchor"]
+
+
+# -------------------------------------------------
+# PDF engine selection
+# -------------------------------------------------
+GOOD_TEXT = " ".join(["experience"] * 40)
+
+
+@pytest.fixture
+def engines(monkeypatch):
+    """
+    Stubs both PDF engines; set calls["pdfium"] to the fast
+    path's (text, pages) or to an exception
+    """
+    calls = {"pdfium": (GOOD_TEXT, 1), "pdfplumber": GOOD_TEXT + " layout", "plumber_calls": 0}
+
+    def pdfium(path):
+        if isinstance(calls["pdfium"], Exception):
+            raise calls["pdfium"]
+        return calls["pdfium"]
+
+    def pdfplumber(path):
+        calls["plumber_calls"] += 1
+        return calls["pdfplumber"]
+
+    monkeypatch.setattr(resume_parser, "PDF_ENGINE", "auto")
+    monkeypatch.setattr(resume_parser, "parse_pdf_pdfium", pdfium)
+    monkeypatch.setattr(resume_parser, "parse_pdf_pdfplumber", pdfplumber)
+    return calls
+
+
+def test_good_fast_path_skips_pdfplumber(engines):
+    assert resume_parser.parse_pdf_with_engine("cv.pdf") == (GOOD_TEXT, "pdfium")
+    assert engines["plumber_calls"] == 0
+
+
+def test_empty_page_falls_back(engines):
+    engines["pdfium"] = ("", 1)
+
+    assert resume_parser.parse_pdf_with_engine("cv.pdf") == (engines["pdfplumber"], "pdfplumber:empty")
+
+
+def test_pdfium_error_falls_back(engines):
+    engines["pdfium"] = pypdfium2.PdfiumError("Failed to load page")
+
+    assert resume_parser.parse_pdf_with_engine("cv.pdf") == (engines["pdfplumber"], "pdfplumber:error")
+
+
+def test_garbled_text_falls_back(engines):
+    engines["pdfium"] = ("(cid:12)(cid:13) " * 40, 1)
+
+    assert resume_parser.parse_pdf_with_engine("cv.pdf")[1] == "pdfplumber:garbled"
+
+
+def test_sparse_output_kept_when_pdfplumber_is_no_better(engines):
+    engines["pdfium"] = ("Scanned page", 1)
+    engines["pdfplumber"] = "Scanned"
+
+    assert resume_parser.parse_pdf_with_engine("cv.pdf") == ("Scanned page", "pdfium")
+
+
+def test_pdfium_only_raises(engines, monkeypatch):
+    monkeypatch.setattr(resume_parser, "PDF_ENGINE", "pdfium")
+    engines["pdfium"] = pypdfium2.PdfiumError("Failed to load page")
+
+    with pytest.raises(pypdfium2.PdfiumError):
+        resume_parser.parse_pdf_with_engine("cv.pdf")
@@ -0,0 +1,37 @@
+from backend.resume_text_store import ResumeTextStore
+
+
+def test_texts_survive_restart(tmp_path):
+    store = ResumeTextStore(state_dir=str(tmp_path))
+    store.put("c-1", "Python developer")
+    store.put("c-2", "Data engineer")
+
+    restarted = ResumeTextStore(state_dir=str(tmp_path))
+
+    assert restarted.get("c-1") == "Python developer"
+    assert restarted.get("c-2") == "Data engineer"
+    assert restarted.stats() == store.stats()
+
+
+def test_appends_after_restart(tmp_path):
+    ResumeTextStore(state_dir=str(tmp_path)).put("c-1", "first")
+
+    restarted = ResumeTextStore(state_dir=str(tmp_path))
+    restarted.put("c-2", "second")
+
+    assert restarted.get("c-1") == "first"
+    assert restarted.get("c-2") == "second"
+
+
+def test_unjournaled_tail_is_dropped(tmp_path):
+    store = ResumeTextStore(state_dir=str(tmp_path))
+    store.put("c-1", "kept")
+    # Crash after the data write, before the index entry
+    with open(store.path, "ab") as f:
+        f.write(b"torn")
+
+    restarted = ResumeTextStore(state_dir=str(tmp_path))
+    restarted.put("c-2", "next")
+
+    assert restarted.get("c-1") == "kept"
+    assert restarted.get("c-2") == "next"
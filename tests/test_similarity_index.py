@@ -0,0 +1,64 @@
+import random
+
+from backend.similarity_index import SimilarityIndex
+
+# Random vocabulary: unrelated resumes share few terms
+WORDS = [f"term{i}" for i in range(5000)]
+
+
+def resume(rng: random.Random, words: int = 120) -> str:
+    return " ".join(rng.choices(WORDS, k=words))
+
+
+def build(count: int, seed: int = 1) -> tuple:
+    rng = random.Random(seed)
+    index = SimilarityIndex()
+    texts = {}
+    for i in range(count):
+        texts[f"c{i}"] = resume(rng)
+        index.add(f"c{i}", texts[f"c{i}"])
+    return index, texts
+
+
+def test_near_duplicate_ranks_first():
+    index, texts = build(50)
+    # Same resume with a few words changed
+    edited = texts["c7"].split()
+    edited[:5] = ["golang", "terraform", "grpc", "redis", "kafka"]
+    index.add("copy", " ".join(edited))
+
+    result = index.similar("copy", k=5)
+
+    assert result["results"][0]["candidate_id"] == "c7"
+    assert result["results"][0]["similarity"] >= 0.9
+    assert all(r["similarity"] < 0.9 for r in result["results"][1:])
+
+
+def test_band_lookup_compares_a_subset():
+    index, texts = build(300)
+    index.add("copy", texts["c42"])
+
+    result = index.similar("copy", k=1)
+
+    assert not result["exhaustive"]
+    assert 1 <= result["compared"] < 300
+    assert result["results"][0]["candidate_id"] == "c42"
+
+
+def test_fallback_scans_everything_but_the_query():
+    index, _ = build(20)
+
+    result = index.similar("c3", k=50)
+
+    assert result["exhaustive"]
+    assert result["compared"] == 19
+    assert len(result["results"]) == 19
+    assert "c3" not in {r["candidate_id"] for r in result["results"]}
+
+
+def test_readding_a_candidate_is_a_noop():
+    index, texts = build(5)
+    index.add("c0", "completely different text")
+
+    assert index.stats()["resumes"] == 5
+    assert index.similar("c0", k=1)["results"]
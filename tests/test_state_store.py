@@ -0,0 +1,120 @@
+from backend.candidate_model import Candidate
+from backend.candidate_view import get_candidate_page, bump_job_version
+from backend.state_store import JobStore
+
+
+def make_job(job_id: str, candidates: int = 2) -> dict:
+    return {
+        "job_id": job_id,
+        "role": "Backend Engineer",
+        "required_skills": ["Python"],
+        "candidates": [
+            {
+                "candidate_id": f"{job_id}-{i}",
+                "name": f"Candidate {i}",
+                "skills": ["Python"],
+                "score": 50 + i,
+                "shortlisted": True,
+                "rank": i + 1,
+                "rank_score": 40.0 + i
+            }
+            for i in range(candidates)
+        ]
+    }
+
+
+def test_dashboard_renders_spilled_jobs(tmp_path):
+    store = JobStore(state_dir=str(tmp_path), max_hot_jobs=1)
+    for job_id in ("job-a", "job-b"):
+        store[job_id] = make_job(job_id)
+        bump_job_version(job_id)
+
+    assert store.stats()["cold_jobs"] == 1
+    assert all(isinstance(c, Candidate) for job in store.values() for c in job["candidates"])
+
+    page = get_candidate_page(store)
+
+    assert page["total"] == 4
+    assert {row["job_id"] for row in page["rows"]} == {"job-a", "job-b"}
+    assert all(row["skills"] == "Python" for row in page["rows"])
+
+
+def test_spilled_job_reloads_with_sidecar(tmp_path):
+    store = JobStore(state_dir=str(tmp_path), max_hot_jobs=1)
+    store["job-a"] = make_job("job-a")
+    store.sidecar("job-a")["seen_blobs"] = {"blob": "job-a-0"}
+    store["job-b"] = make_job("job-b")
+
+    assert store.stats()["cold_jobs"] == 1
+    assert store.job_id_for_candidate("job-a-1") == "job-a"
+
+    job = store["job-a"]
+    assert job["candidates"][1]["candidate_id"] == "job-a-1"
+    assert store.sidecar("job-a") == {"seen_blobs": {"blob": "job-a-0"}}
+    assert store.stats()["reloads"] == 1
+
+
+def test_held_job_is_not_spilled(tmp_path):
+    store = JobStore(state_dir=str(tmp_path), max_hot_jobs=1)
+    store["job-a"] = make_job("job-a")
+    live = store["job-a"]
+
+    with store.hold("job-a"):
+        store["job-b"] = make_job("job-b")
+        live["candidates"][0]["score"] = 99
+        assert store["job-a"] is live
+
+    # Spilled once released, with the write made while held
+    store["job-c"] = make_job("job-c")
+    assert "job-a" in store
+    assert store["job-a"]["candidates"][0]["score"] == 99
+
+
+def test_spilled_jobs_survive_restart(tmp_path):
+    store = JobStore(state_dir=str(tmp_path))
+    store["job-a"] = make_job("job-a")
+    store.close()
+
+    restarted = JobStore(state_dir=str(tmp_path))
+    assert list(restarted) == ["job-a"]
+    assert restarted.job_id_for_candidate("job-a-0") == "job-a"
+    assert isinstance(restarted["job-a"]["candidates"][0], Candidate)
+
+
+def test_dashboard_cache_hit_does_not_read_spilled_jobs(tmp_path, monkeypatch):
+    store = JobStore(state_dir=str(tmp_path), max_hot_jobs=1)
+    for job_id in ("job-c", "job-d"):
+        store[job_id] = make_job(job_id)
+        bump_job_version(job_id)
+
+    first = get_candidate_page(store)
+
+    reads = []
+    read = store._read
+    monkeypatch.setattr(store, "_read", lambda job_id: reads.append(job_id) or read(job_id))
+
+    assert get_candidate_page(store) == first
+    assert reads == []
+
+
+def test_dashboard_change_does_not_reread_unchanged_jobs(tmp_path, monkeypatch):
+    store = JobStore(state_dir=str(tmp_path), max_hot_jobs=1)
+    for job_id in ("job-e", "job-f", "job-g"):
+        store[job_id] = make_job(job_id)
+        bump_job_version(job_id)
+
+    get_candidate_page(store, sort_by=["score"])
+
+    # Reloads job-e and spills job-g
+    store["job-e"]["candidates"][0]["score"] = 99
+    bump_job_version("job-e")
+
+    reads = []
+    read = store._read
+    monkeypatch.setattr(store, "_read", lambda job_id: reads.append(job_id) or read(job_id))
+
+    page = get_candidate_page(store, sort_by=["score"])
+
+    assert reads == []
+    assert page["total"] == 6
+    assert page["rows"][0]["candidate_id"] == "job-e-0"
@@ -0,0 +1,52 @@
+import json
+import threading
+
+import pytest
+
+from backend import tracing
+from backend.integrations import LocalSheetsStore
+from backend.sheets_queue import SheetsWriteQueue
+
+
+@pytest.fixture
+def trace_file(tmp_path, monkeypatch):
+    path = tmp_path / "spans.jsonl"
+    monkeypatch.setattr(tracing, "TRACING_ENABLED", True)
+    monkeypatch.setattr(tracing, "TRACE_FILE", str(path))
+    yield path
+    tracing.stop_writer()
+
+
+def spans(path) -> list:
+    tracing.stop_writer()
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_concurrent_first_spans_are_written_once(trace_file):
+    barrier = threading.Barrier(8)
+
+    def worker(i):
+        barrier.wait()
+        with tracing.span("parse", worker=i):
+            pass
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    written = spans(trace_file)
+    assert sorted(s["attributes"]["worker"] for s in written) == list(range(8))
+
+
+def test_background_sheet_writes_are_traced(trace_file):
+    store = LocalSheetsStore()
+    queue = SheetsWriteQueue(writes_per_minute=6000, store=store)
+    queue.append({"candidate_id": "c-1", "name": "Ava"})
+    queue.update("c-0", {"rank": 2})
+
+    assert queue.flush()
+
+    flushes = [s for s in spans(trace_file) if s["name"] == "sheet_flush"]
+    assert [(s["attributes"]["op"], s["attributes"]["rows"]) for s in flushes] == [("append", 1), ("update", 1)]